@@ -0,0 +1,4 @@
+"""Micro-benchmarks of the vinted_scraper hot paths.
+
+Run them from the repository root, e.g. ``uv run -m benchmarks.logging_overhead``.
+"""
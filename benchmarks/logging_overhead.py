@@ -0,0 +1,64 @@
+"""Overhead of the logging of an API call with DEBUG disabled.
+
+Times the log calls made by ``curl`` for a single request and response at
+INFO level against an empty function, and against the same messages
+formatted eagerly with f-strings. The lazy helpers should only cost their
+logger level checks: nothing is formatted and the body is never decoded.
+"""
+
+import logging
+import timeit
+
+import httpx
+
+from src.vinted_scraper.utils import (
+    get_curl_headers,
+    log_curl_request,
+    log_curl_response,
+    log_search,
+)
+
+NUMBER = 200_000
+BASE_URL = "https://www.vinted.com"
+ENDPOINT = "/api/v2/catalog/items"
+PARAMS = {"search_text": "board games", "page": 1}
+HEADERS = get_curl_headers(BASE_URL, "Mozilla/5.0", {"access_token_web": "x" * 600})
+RESPONSE = httpx.Response(200, json={"items": [{"id": i} for i in range(96)]})
+
+
+def baseline() -> None:
+    """An API call without any logging."""
+
+
+def lazy(log: logging.Logger) -> None:
+    """The log calls of an API call, as made by the wrappers."""
+    log_search(log, PARAMS)
+    log_curl_request(log, BASE_URL, ENDPOINT, HEADERS, PARAMS)
+    log_curl_response(log, ENDPOINT, 200, RESPONSE.headers, lambda: RESPONSE.text)
+
+
+def eager(log: logging.Logger) -> None:
+    """The same messages formatted before calling the logger."""
+    log.debug(f"Calling search() with params: {PARAMS}")
+    log.debug(f"API Request: GET {ENDPOINT} with params {PARAMS}")
+    log.debug(f"API Response: {ENDPOINT} - Status: {200}")
+    log.debug(f"Response Headers: {dict(RESPONSE.headers)}")
+    log.debug(f"Response Body: {RESPONSE.text}")
+
+
+def main() -> None:
+    """Print the time per API call of each variant."""
+    log = logging.getLogger("benchmarks.logging_overhead")
+    log.setLevel(logging.INFO)
+    variants = {
+        "no logging": baseline,
+        "lazy helpers": lambda: lazy(log),
+        "eager f-strings": lambda: eager(log),
+    }
+    for name, func in variants.items():
+        elapsed = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:>16}: {elapsed / NUMBER * 1e9:8.1f} ns per call")
+
+
+if __name__ == "__main__":
+    main()
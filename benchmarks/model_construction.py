@@ -0,0 +1,69 @@
+"""Cost of building the items of a 96-item search page.
+
+Times the construction of the ``VintedItem`` objects of a search page and
+measures the memory they hold, when reading only the scalar fields (``id``,
+``title``, ``price`` and ``url``) and when reading the nested models too. The
+nested models are only built on first access, so the first case should
+allocate a fraction of the second.
+"""
+
+import json
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from src.vinted_scraper.models import VintedItem
+
+NUMBER = 200
+PER_PAGE = 96
+SAMPLE = Path(__file__).parents[1] / "tests" / "samples" / "search_items_dummy.json"
+
+
+def page() -> List[Dict[str, Any]]:
+    """Return the items of a search page of copies of the sample item."""
+    item = json.loads(SAMPLE.read_text(encoding="utf-8"))["items"][0]
+    return [{**item, "id": i} for i in range(PER_PAGE)]
+
+
+def scalars(items: List[Dict[str, Any]]) -> List[VintedItem]:
+    """Build the items and read their scalar fields."""
+    models = [VintedItem(json_data=data) for data in items]
+    for item in models:
+        (item.id, item.title, item.price, item.url)  # pylint: disable=W0104
+    return models
+
+
+def nested(items: List[Dict[str, Any]]) -> List[VintedItem]:
+    """Build the items and read their nested models too."""
+    models = scalars(items)
+    for item in models:
+        _ = (item.user.photo.thumbnails, item.photos[0].thumbnails, item.brand)
+    return models
+
+
+def allocated(func: Callable[[], List[VintedItem]]) -> int:
+    """Return the bytes held by the models built by a call."""
+    tracemalloc.start()
+    models = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return size
+
+
+def main() -> None:
+    """Print the time and memory per page of each access pattern."""
+    items = page()
+    variants = {"scalar fields": scalars, "nested models": nested}
+    for name, func in variants.items():
+        elapsed = min(timeit.repeat(lambda f=func: f(items), number=NUMBER, repeat=5))
+        size = allocated(lambda f=func: f(items))
+        print(
+            f"{name:>14}: {elapsed / NUMBER * 1e6:8.1f} us, "
+            f"{size / 1024:6.1f} KiB per page"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Memory retained by the item models of a 100k-item search corpus.
+
+The corpus is made of search pages of 96 copies of the sample item, each with
+its own id. For every variant, the pages are decoded and turned into models
+one at a time, and only the models are kept, as a scraper collecting the
+results would. ``VintedItem`` keeps every key twice, in its ``__dict__`` and
+in ``json_data``. The compact models store them once, and not at all once
+``json_data`` is dropped. The views only reference the JSON data.
+
+Usage: ``python -m benchmarks.model_memory [items]``
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from src.vinted_scraper.models import VintedCompactItem, VintedItem, VintedItemView
+
+ITEMS = 100_000
+PER_PAGE = 96
+SAMPLE = Path(__file__).parents[1] / "tests" / "samples" / "search_items_dummy.json"
+
+
+def corpus(items: int) -> List[bytes]:
+    """Return the JSON bodies of the search pages of the corpus."""
+    item = json.loads(SAMPLE.read_text(encoding="utf-8"))["items"][0]
+    pages = []
+    for start in range(0, items, PER_PAGE):
+        ids = range(start, min(start + PER_PAGE, items))
+        pages.append(json.dumps({"items": [{**item, "id": i} for i in ids]}))
+    return [page.encode() for page in pages]
+
+
+def retained(pages: List[bytes], build: Callable[[Dict], Any]) -> int:
+    """Return the bytes retained by the models built from every page."""
+    gc.collect()
+    tracemalloc.start()
+    models = [build(item) for page in pages for item in json.loads(page)["items"]]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return size
+
+
+def main() -> None:
+    """Print the memory retained per item by each variant."""
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else ITEMS
+    pages = corpus(items)
+    variants: Dict[str, Callable[[Dict], Any]] = {
+        "raw dicts": lambda item: item,
+        "VintedItem": lambda item: VintedItem(json_data=item),
+        "compact": VintedCompactItem,
+        "compact, no json": lambda item: VintedCompactItem(item, keep_json=False),
+        "view": VintedItemView,
+    }
+    print(f"{items} items")
+    for name, build in variants.items():
+        size = retained(pages, build)
+        print(f"{name:>18}: {size / 2**20:8.1f} MiB, {size / items:6.0f} B per item")
+
+
+if __name__ == "__main__":
+    main()
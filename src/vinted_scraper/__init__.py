@@ -9,6 +9,8 @@ Classes:
     VintedWrapper: Synchronous client with raw JSON responses.
     AsyncVintedScraper: Asynchronous client with typed VintedItem responses.
     AsyncVintedWrapper: Asynchronous client with raw JSON responses.
+    SessionPool: Synchronous pool spreading requests across several clients.
+    AsyncSessionPool: Asynchronous pool spreading requests across several clients.
 
     Examples:
         See https://github.com/Giglium/vinted_scraper/tree/main/examples
@@ -17,6 +19,14 @@ Classes:
 from ._async_scraper import AsyncVintedScraper
 from ._async_wrapper import AsyncVintedWrapper
 from ._scraper import VintedScraper
+from ._session_pool import AsyncSessionPool, SessionPool
 from ._wrapper import VintedWrapper
 
-__all__ = ["AsyncVintedWrapper", "VintedWrapper", "AsyncVintedScraper", "VintedScraper"]
+__all__ = [
+    "AsyncVintedWrapper",
+    "VintedWrapper",
+    "AsyncVintedScraper",
+    "VintedScraper",
+    "AsyncSessionPool",
+    "SessionPool",
+]
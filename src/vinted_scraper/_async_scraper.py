@@ -2,21 +2,30 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 from ._async_wrapper import AsyncVintedWrapper
+from ._base_scraper import BaseVintedScraperMixin
 from .models import VintedItem, VintedJsonModel
 
 _log = logging.getLogger(__name__)
 
 
 @dataclass
-class AsyncVintedScraper(AsyncVintedWrapper):
+class AsyncVintedScraper(BaseVintedScraperMixin, AsyncVintedWrapper):
     """Asynchronous Vinted scraper with typed model support.
 
     Returns structured VintedItem objects instead of raw JSON dictionaries.
     Inherits all functionality from AsyncVintedWrapper.
 
+    With ``struct_models``, the search and item responses are decoded by
+    msgspec straight into ``VintedItemStruct`` objects, skipping the
+    intermediate dicts. They have the same public attributes as
+    ``VintedItem`` but no ``json_data``.
+
+    Attributes:
+        struct_models: Whether to return Struct models, requires msgspec.
+
     Example:
         See https://github.com/Giglium/vinted_scraper/blob/main/examples/async_scraper.py
     """
@@ -40,7 +49,27 @@ class AsyncVintedScraper(AsyncVintedWrapper):
             List of VintedItem objects representing search results.
         """
         response = await super().search(params)
-        return [VintedItem(json_data=item) for item in response["items"]]
+        return [self._item_model(item) for item in response["items"]]
+
+    async def aiter_search(  # type: ignore
+        self,
+        params: Optional[Dict] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[VintedItem]:
+        """Lazily iterate over the search results page by page asynchronously.
+
+        Args:
+            params: Query parameters, see ``search``. If present, ``page`` is
+                used as the first page to fetch.
+            max_pages: Maximum number of pages to fetch. Unlimited if None.
+            prefetch: Number of pages to request ahead of the consumer.
+
+        Yields:
+            VintedItem objects representing the search results.
+        """
+        async for item in super().aiter_search(params, max_pages, prefetch):
+            yield self._item_model(item)
 
     async def item(self, item_id: str, params: Optional[Dict] = None) -> VintedItem:
         """Retrieve detailed information about a specific item asynchronously.
@@ -60,22 +89,26 @@ class AsyncVintedScraper(AsyncVintedWrapper):
              See: https://github.com/Giglium/vinted_scraper/issues/59
         """
         response = await super().item(item_id, params)
-        return VintedItem(json_data=response["item"])
+        return self._item_model(response["item"])
 
     async def curl(
-        self, endpoint: str, params: Optional[Dict] = None, *, _retries: int = 0
+        self, endpoint: str, params: Optional[Dict] = None, *, use_cache: bool = True
     ) -> VintedJsonModel:
         """Send an async HTTP GET request to any Vinted API endpoint.
 
         Args:
             endpoint: The API endpoint path (e.g., "/api/v2/users/username").
             params: Optional query parameters.
+            use_cache: Whether a cached response can be returned.
 
         Returns:
-            VintedJsonModel containing the JSON response.
+            VintedJsonModel containing the JSON response, or the Struct
+            model of the search and item endpoints with ``struct_models``.
 
         Raises:
             RuntimeError: If the request fails or returns a non-200 status code.
         """
-        response = await super().curl(endpoint, params, _retries=_retries)
+        response = await super().curl(endpoint, params, use_cache=use_cache)
+        if not isinstance(response, dict):
+            return response
         return VintedJsonModel(json_data=response)
@@ -1,16 +1,39 @@
 # jscpd:ignore-start
-# pylint: disable=duplicate-code
+# pylint: disable=duplicate-code,too-many-instance-attributes
 """Async Vinted wrapper for raw JSON responses."""
 
 import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import httpx
 
 from ._base_wrapper import BaseVintedWrapper
-from .utils import DEFAULT_RETRIES, HTTP_OK, HTTP_UNAUTHORIZED
+from .utils import (
+    ASYNC_CLIENT_OPTIONS,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RETRIES,
+    HTTP_OK,
+    HTTP_UNAUTHORIZED,
+    ClientOptions,
+    RetryPolicy,
+    RetryState,
+    get_cache_key,
+)
 
 _log = logging.getLogger(__name__)
 
@@ -28,12 +51,43 @@ class AsyncVintedWrapper(BaseVintedWrapper):
         user_agent: Custom user agent string. Auto-generated if None.
         config: httpx client configuration dict.
         cookie_names: List of cookie names to extract. Defaults to ["access_token_web"].
+        auto_renew_cookie: Renew the session cookie in background before it expires.
+        cookie_store: Persistent store sharing the session cookie across processes.
+        rate_limiter: Token-bucket limiter applied to every API request.
+        retry_policy: Backoff applied to the cookie fetch and to failed API calls.
+        on_retry: Called with the ``RetryState`` of an API call before each retry.
+        circuit_breaker: Fails fast the calls to endpoints that keep failing.
+        response_cache: Cache of successful API responses used by ``curl``.
+        client_options: HTTP/2, connection pool limits and per-phase timeouts.
+        transport: Shared transport owned, and closed, by the caller.
+        json_decoder: Decoder of the raw response bytes (orjson, msgspec, json).
+        coalesce_requests: Share a single in-flight request, and its parsed
+            result, between concurrent identical ``curl`` calls.
 
     Example:
         See https://github.com/Giglium/vinted_scraper/blob/main/examples/async_wrapper.py
     """
 
+    _default_client_options: ClassVar[ClientOptions] = ASYNC_CLIENT_OPTIONS
+    _transport_type: ClassVar[type] = httpx.AsyncBaseTransport
+
+    coalesce_requests: bool = False
     _client: httpx.AsyncClient = field(init=False, repr=False)
+    _cookie_refresh: Optional[asyncio.Future] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _renewal: Optional[asyncio.Future] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _renewal_cookie: Optional[Dict[str, str]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _revalidating: Dict[str, asyncio.Future] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _in_flight: Dict[str, asyncio.Future] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
 
     @classmethod
     async def create(
@@ -42,25 +96,34 @@ class AsyncVintedWrapper(BaseVintedWrapper):
         user_agent: Optional[str] = None,
         config: Optional[Dict] = None,
         cookie_names: Optional[List[str]] = None,
+        **kwargs: Any,
     ):
         """Factory method to create an AsyncVintedWrapper instance.
 
-        Use this instead of direct instantiation to automatically fetch the session cookie.
+        Use this instead of direct instantiation to automatically fetch the session cookie,
+        unless a valid one is found in the ``cookie_store``.
 
         Args:
             baseurl: Vinted domain URL (e.g., "https://www.vinted.com").
             user_agent: Custom user agent string. Auto-generated if None.
             config: httpx client configuration dict.
             cookie_names: List of cookie names to extract. Defaults to ["access_token_web"].
+            **kwargs: Any other attribute of the class, e.g. ``auto_renew_cookie``.
 
         Returns:
             Initialized AsyncVintedWrapper instance with fetched cookies.
         """
         _log.debug("Creating the async wrapper using the factory method")
         self = cls(
-            baseurl, user_agent=user_agent, config=config, cookie_names=cookie_names
+            baseurl,
+            user_agent=user_agent,
+            config=config,
+            cookie_names=cookie_names,
+            **kwargs,
         )
-        self.session_cookie = await self.refresh_cookie()
+        if self.session_cookie is None:
+            self.session_cookie = await self.refresh_cookie()
+        self._schedule_cookie_renewal()
         return self
 
     def __post_init__(self) -> None:
@@ -91,12 +154,100 @@ class AsyncVintedWrapper(BaseVintedWrapper):
             RuntimeError: If cookies cannot be fetched after all retries.
         """
         self._log_refresh_cookie()
-        return await AsyncVintedWrapper.fetch_cookie(
+        cookies = await AsyncVintedWrapper.fetch_cookie(
             self._client,
             self._get_cookie_headers(),
             self.cookie_names,
             retries,
+            self.retry_policy,
         )
+        await self._run_cookie_store(self._store_cookie, cookies)
+        return cookies
+
+    async def _refresh_session_cookie(self, stale: Optional[Dict[str, str]]) -> None:
+        """Refresh the session cookie once for all coroutines that saw it expire.
+
+        The first coroutine starts the refresh; the others await the same
+        in-flight refresh, and those that sent an already replaced cookie
+        simply retry with the new one.
+
+        Args:
+            stale: The session cookie that was rejected.
+
+        Raises:
+            RuntimeError: If cookies cannot be fetched after all retries.
+        """
+        if self._cookie_refresh is None:
+            if self.session_cookie is not stale:
+                return
+            self._cookie_refresh = asyncio.ensure_future(self._swap_session_cookie())
+        await asyncio.shield(self._cookie_refresh)
+
+    async def _swap_session_cookie(self) -> None:
+        """Replace the current session cookie with a stored or fetched one."""
+        try:
+            self.session_cookie = (
+                await self._run_cookie_store(
+                    self._load_newer_cookie, self.session_cookie
+                )
+                or await self.refresh_cookie()
+            )
+            self._schedule_cookie_renewal()
+        finally:
+            self._cookie_refresh = None
+
+    async def _run_cookie_store(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Call a cookie store helper, in a worker thread if there is a store.
+
+        The stores lock a file or open a database, which would block the event
+        loop.
+
+        Args:
+            method: ``_load_newer_cookie`` or ``_store_cookie``.
+            *args: Its arguments.
+
+        Returns:
+            The result of the method.
+        """
+        if self.cookie_store is None:
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+    def _schedule_cookie_renewal(self) -> None:
+        """Schedule a background renewal of the current session cookie.
+
+        Does nothing unless ``auto_renew_cookie`` is set, or if the renewal of
+        the current cookie is already scheduled. Any renewal scheduled for a
+        previous cookie is cancelled. Must be called from the event loop.
+        """
+        session_cookie = self.session_cookie
+        if not self.auto_renew_cookie or self._renewal_cookie is session_cookie:
+            return
+        if self._renewal is not None:
+            self._renewal.cancel()
+        self._renewal_cookie = session_cookie
+        self._renewal = None
+        delay = self._cookie_renewal_delay(session_cookie)
+        if delay is not None:
+            self._renewal = asyncio.ensure_future(
+                self._renew_cookie(delay, session_cookie)
+            )
+
+    async def _renew_cookie(self, delay: float, stale: Dict[str, str]) -> None:
+        """Renew the session cookie after ``delay`` seconds.
+
+        Failures are only logged: the 401 handling still covers the request
+        path if the cookie expires.
+
+        Args:
+            delay: Seconds to wait before the renewal.
+            stale: The session cookie the renewal was scheduled for.
+        """
+        await asyncio.sleep(delay)
+        try:
+            await self._refresh_session_cookie(stale)
+        except (RuntimeError, httpx.HTTPError) as e:
+            _log.warning("Cannot renew the session cookie in background: %s", e)
 
     @staticmethod
     async def fetch_cookie(
@@ -104,6 +255,7 @@ class AsyncVintedWrapper(BaseVintedWrapper):
         headers: Dict,
         cookie_names: List[str],
         retries: int = DEFAULT_RETRIES,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> Dict[str, str]:
         """Fetch session cookies from Vinted using async HTTP GET request.
 
@@ -112,6 +264,7 @@ class AsyncVintedWrapper(BaseVintedWrapper):
             headers: HTTP headers dictionary.
             cookie_names: List of cookie names to extract.
             retries: Number of retry attempts (default: 3).
+            retry_policy: Backoff between attempts. Defaults to ``RetryPolicy()``.
 
         Returns:
             Dictionary of extracted session cookies.
@@ -129,10 +282,12 @@ class AsyncVintedWrapper(BaseVintedWrapper):
             if cookies:
                 return cookies
 
-            if response.status_code != HTTP_OK:
+            if response.status_code != HTTP_OK and i < retries - 1:
                 sleep_time = BaseVintedWrapper._handle_cookie_failure(
-                    response, i, retries
+                    response, i, retries, retry_policy
                 )
+                if sleep_time is None:
+                    break
                 await asyncio.sleep(sleep_time)
 
         BaseVintedWrapper._raise_cookie_error(client.base_url, response)
@@ -158,6 +313,83 @@ class AsyncVintedWrapper(BaseVintedWrapper):
         self._log_search(params)
         return await self.curl(self._search_endpoint(), params=params)
 
+    async def aiter_search(
+        self,
+        params: Optional[Dict] = None,
+        max_pages: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily iterate over the search results page by page asynchronously.
+
+        With the default ``prefetch=0`` a page is only requested once every item
+        of the previous one has been consumed. A positive ``prefetch`` keeps up
+        to that many following pages in flight while the current page is being
+        consumed, so at most ``prefetch + 1`` pages are buffered at any time.
+        The iteration stops on an empty page, on the last page reported by the
+        pagination metadata, or after ``max_pages`` pages; any page still in
+        flight is then cancelled.
+
+        Args:
+            params: Query parameters, see ``search``. If present, ``page`` is
+                used as the first page to fetch.
+            max_pages: Maximum number of pages to fetch. Unlimited if None.
+            prefetch: Number of pages to request ahead of the consumer.
+
+        Yields:
+            Dictionaries containing the JSON data of each item.
+        """
+        pages = iter(self._iter_pages(params, max_pages))
+        pending: Deque[Tuple[int, asyncio.Future]] = deque()
+        last_page: Optional[int] = None
+
+        def schedule(depth: int) -> None:
+            while len(pending) < depth:
+                page = next(pages, None)
+                if page is None or (last_page is not None and page > last_page):
+                    return
+                pending.append(
+                    (
+                        page,
+                        asyncio.ensure_future(
+                            self._search_page(self._page_params(params, page))
+                        ),
+                    )
+                )
+
+        try:
+            while True:
+                schedule(1)
+                if not pending:
+                    return
+                page, task = pending.popleft()
+                response = await task
+                items = self._page_items(response)
+                if not items or self._is_last_page(response, page):
+                    for item in items:
+                        yield item
+                    return
+                last_page = self._total_pages(response)
+                schedule(max(prefetch, 0))
+                for item in items:
+                    yield item
+        finally:
+            for _, task in pending:
+                if task.done() and not task.cancelled():
+                    task.exception()
+                task.cancel()
+
+    async def _search_page(self, params: Dict) -> Dict[str, Any]:
+        """Fetch a single search page.
+
+        Args:
+            params: Query parameters including the page number.
+
+        Returns:
+            Dictionary containing JSON response with search results.
+        """
+        self._log_search(params)
+        return await self.curl(self._search_endpoint(), params=params)
+
     async def item(self, item_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Retrieve detailed information about a specific item asynchronously.
 
@@ -178,45 +410,222 @@ class AsyncVintedWrapper(BaseVintedWrapper):
         self._log_item(item_id, params)
         return await self.curl(self._item_endpoint(item_id), params=params)
 
-    async def curl(
+    async def item_many(
         self,
-        endpoint: str,
+        item_ids: Iterable[str],
         params: Optional[Dict] = None,
-        *,
-        _retries: int = 0,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[str, Union[Dict[str, Any], Exception]]]:
+        """Retrieve many items concurrently, yielding them as they complete.
+
+        At most ``concurrency`` requests are in flight at any time, all sharing
+        the wrapper's connection pool. ``item_ids`` is consumed lazily, so it can
+        be a generator, and a failing item never interrupts the others: its
+        exception is yielded in place of the result.
+
+        Args:
+            item_ids: Identifiers of the items to retrieve.
+            params: Optional query parameters sent with every request.
+            concurrency: Maximum number of concurrent requests (default: 8).
+
+        Yields:
+            ``(item_id, result)`` tuples in completion order, where ``result``
+            is what ``item`` returns (a ``VintedItem`` for the scraper) or the
+            exception it raised.
+        """
+        ids = iter(item_ids)
+        pending: Dict[asyncio.Future, str] = {}
+
+        def schedule() -> None:
+            for item_id in ids:
+                pending[asyncio.ensure_future(self.item(item_id, params))] = item_id
+                if len(pending) >= concurrency:
+                    return
+
+        try:
+            schedule()
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                results = [(pending.pop(task), task) for task in done]
+                schedule()
+                for item_id, task in results:
+                    try:
+                        result = task.result()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        result = e
+                    yield item_id, result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def curl(
+        self, endpoint: str, params: Optional[Dict] = None, *, use_cache: bool = True
     ) -> Dict[str, Any]:
         """Send an async HTTP GET request to any Vinted API endpoint.
 
         Automatically handles headers, cookies, retries, and error responses.
+        A 401 refreshes the session cookie before retrying; throttled (429),
+        failed (5xx) and timed out attempts are retried after the delay given
+        by the ``retry_policy``. Every retry is reported to ``on_retry``.
 
         Args:
             endpoint: API endpoint path (e.g., "/api/v2/users/username").
             params: Optional query parameters.
+            use_cache: Whether a cached response can be returned. The response
+                received is cached either way.
 
         Returns:
             Dictionary containing the parsed JSON response.
 
         Raises:
             RuntimeError: If response status is not 200 or JSON parsing fails.
+            CircuitOpenError: If the circuit of the endpoint family is open.
+            httpx.TimeoutException: If the last attempt timed out.
         """
-        headers = self._build_curl_headers()
-        self._log_curl_request(endpoint, headers, params)
+        self._schedule_cookie_renewal()
+        cache_key = self._cache_key(endpoint, params)
+        if use_cache:
+            cached = await self._run_cache(self._cached_response, cache_key)
+            if cached is not None:
+                if cached.stale:
+                    self._revalidate(endpoint, params, cache_key)
+                return self._decode_cached_response(cached, endpoint)
+        if not self.coalesce_requests:
+            return await self._call(endpoint, params, cache_key)
+        return await self._coalesced_call(endpoint, params, cache_key)
+
+    async def _call(
+        self, endpoint: str, params: Optional[Dict], cache_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """Send an API call through the circuit breaker of its endpoint."""
+        with self._circuit(endpoint):
+            return await self._request(endpoint, params, cache_key)
 
-        response = await self._client.get(endpoint, headers=headers, params=params)
+    async def _coalesced_call(
+        self, endpoint: str, params: Optional[Dict], cache_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """Join the identical API call in flight, or start it.
 
-        self._log_curl_response(
-            endpoint, response.status_code, response.headers, response.text
-        )
+        The call runs in its own task, so a cancelled caller does not cancel
+        it for the others.
 
-        if response.status_code == HTTP_OK:
-            return self._handle_curl_response(response, endpoint)
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+            cache_key: Key under which the response is cached, if any.
 
-        if response.status_code == HTTP_UNAUTHORIZED and _retries < DEFAULT_RETRIES:
-            self._log_cookie_retry(response.status_code)
-            self.session_cookie = await self.refresh_cookie()
-            return await self.curl(endpoint, params, _retries=_retries + 1)
+        Returns:
+            The parsed JSON response, shared by every caller.
+        """
+        key = get_cache_key(endpoint, params)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._call(endpoint, params, cache_key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._forget_in_flight(key, t))
+        else:
+            _log.debug("Joining the request in flight for %s", key)
+        return await asyncio.shield(task)
+
+    def _forget_in_flight(self, key: str, task: asyncio.Future) -> None:
+        """Drop a finished call, retrieving its error if every caller left."""
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def _request(
+        self, endpoint: str, params: Optional[Dict], cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run the attempts of an API call until success or retries run out.
 
-        self._raise_curl_error(endpoint, response.status_code)
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+            cache_key: Key under which the response is cached, if any.
+
+        Returns:
+            Dictionary containing the parsed JSON response.
+        """
+        state = RetryState(endpoint)
+        while True:
+            session_cookie = self.session_cookie
+            headers = self._build_curl_headers(session_cookie)
+            self._log_curl_request(endpoint, headers, params)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.async_acquire(self.baseurl, endpoint)
+
+            try:
+                response = await self._client.get(
+                    endpoint, headers=headers, params=params
+                )
+            except httpx.TimeoutException as e:
+                if not self._next_retry(state, error=e):
+                    raise
+                await asyncio.sleep(state.delay)
+                continue
+
+            self._log_curl_response(endpoint, response)
+            if response.status_code == HTTP_OK:
+                result = self._handle_curl_response(response, endpoint)
+                await self._run_cache(
+                    self._cache_response, cache_key, endpoint, response
+                )
+                return result
+            if not self._next_retry(state, response):
+                self._raise_curl_error(endpoint, response.status_code)
+            if response.status_code == HTTP_UNAUTHORIZED:
+                await self._refresh_session_cookie(session_cookie)
+            else:
+                await asyncio.sleep(state.delay)
+
+    async def _run_cache(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Call a response cache method, in a worker thread if it blocks.
+
+        Args:
+            method: ``_cached_response`` or ``_cache_response``.
+            *args: Its arguments, the cache key first.
+
+        Returns:
+            The result of the method.
+        """
+        if args[0] is None or not self.response_cache.blocking:
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+    def _revalidate(
+        self, endpoint: str, params: Optional[Dict], cache_key: Optional[str]
+    ) -> None:
+        """Refresh a stale cached response in a background task, once at a time.
+
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+            cache_key: Key of the stale cached response.
+        """
+        if cache_key not in self._revalidating:
+            self._revalidating[cache_key] = asyncio.ensure_future(
+                self._refresh_cached_response(endpoint, params, cache_key)
+            )
+
+    async def _refresh_cached_response(
+        self, endpoint: str, params: Optional[Dict], cache_key: Optional[str]
+    ) -> None:
+        """Fetch a response again to replace its stale cached copy.
+
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+            cache_key: Key of the stale cached response.
+        """
+        try:
+            with self._circuit(endpoint):
+                await self._request(endpoint, params, cache_key)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            _log.warning("Cannot refresh the cached response of %s: %s", endpoint, e)
+        finally:
+            self._revalidating.pop(cache_key, None)
 
     async def __aenter__(self) -> "AsyncVintedWrapper":  # pragma: no cover
         """Enter async context manager.
@@ -234,6 +643,10 @@ class AsyncVintedWrapper(BaseVintedWrapper):
             exc_val: Exception value (unused).
             exc_tb: Exception traceback (unused).
         """
+        if self._renewal is not None:
+            self._renewal.cancel()
+        for task in [*self._revalidating.values(), *self._in_flight.values()]:
+            task.cancel()
         await self._client.aclose()
 
 
@@ -0,0 +1,54 @@
+"""Model support shared by the sync and async Vinted scrapers."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from .models import VintedItem, get_struct_decoder
+from .utils import API_CATALOG_ITEMS, JsonDecoder
+
+
+@dataclass
+class BaseVintedScraperMixin:
+    """Model support mixed into the wrappers by the scrapers.
+
+    With ``struct_models``, the search and item responses are decoded by
+    msgspec straight into ``VintedItemStruct`` objects, skipping the
+    intermediate dicts. They have the same public attributes as
+    ``VintedItem`` but no ``json_data``.
+
+    Attributes:
+        struct_models: Whether to return Struct models, requires msgspec.
+    """
+
+    struct_models: bool = False
+
+    def __post_init__(self) -> None:
+        """Check the Struct models are available before initializing.
+
+        Raises:
+            ImportError: If ``struct_models`` is set without msgspec.
+        """
+        if self.struct_models:
+            get_struct_decoder(API_CATALOG_ITEMS)
+        super().__post_init__()  # type: ignore
+
+    def _response_decoder(self, endpoint: str) -> JsonDecoder:
+        """Return the Struct decoder of the endpoint, if enabled and available.
+
+        Args:
+            endpoint: The endpoint that was called.
+        """
+        if self.struct_models:
+            decoder = get_struct_decoder(endpoint)
+            if decoder is not None:
+                return decoder
+        return super()._response_decoder(endpoint)  # type: ignore
+
+    @staticmethod
+    def _item_model(item: Any) -> Any:
+        """Wrap the JSON data of an item into a VintedItem.
+
+        Args:
+            item: Item JSON data, or an already decoded ``VintedItemStruct``.
+        """
+        return VintedItem(json_data=item) if isinstance(item, dict) else item
@@ -1,29 +1,66 @@
+# pylint: disable=too-many-instance-attributes
 """Base Vinted wrapper with shared logic for sync and async variants."""
 
+import itertools
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, NoReturn, Optional
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
 
 from .utils import (
     API_CATALOG_ITEMS,
     API_ITEMS,
+    COOKIE_RENEWAL_MARGIN,
     HTTP_OK,
-    RETRY_BASE_SLEEP,
+    HTTP_UNAUTHORIZED,
     SESSION_COOKIE_NAME,
+    CachedResponse,
+    CircuitBreaker,
+    ClientOptions,
+    CookieStore,
+    JsonDecoder,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+    RetryState,
+    VintedApiError,
+    borrow_transport,
     extract_cookie_from_response,
+    get_cache_key,
+    get_cookie_expiry,
     get_cookie_headers,
-    get_curl_headers,
+    get_cookie_string,
+    get_curl_header_template,
     get_httpx_config,
+    get_json_decoder,
     get_random_user_agent,
+    is_service_failure,
     log_constructor,
     log_cookie_fetch_failed,
     log_cookie_fetched,
+    log_cookie_renewal,
     log_cookie_retry,
     log_curl_request,
     log_curl_response,
     log_interaction,
     log_item,
     log_refresh_cookie,
+    log_retry,
     log_search,
     log_sleep,
     url_validator,
@@ -46,13 +83,55 @@ class BaseVintedWrapper:
         config: httpx client configuration dict.
         cookie_names: List of cookie names to extract.
             Defaults to ["access_token_web"].
+        auto_renew_cookie: Renew the session cookie in the background shortly
+            before the expiry encoded in its token, instead of waiting for a 401.
+        cookie_store: Persistent store consulted before fetching a session
+            cookie and updated after every fetch, to share one session across
+            processes and restarts.
+        rate_limiter: Token-bucket limiter applied to every API request, with a
+            budget per host and endpoint family. It can be shared by wrappers.
+        retry_policy: Backoff applied to the session cookie fetch, and to API
+            calls failing with a retryable status (429, 5xx) or timing out.
+        on_retry: Called with the ``RetryState`` of an API call before each
+            of its retries, e.g. to collect metrics.
+        circuit_breaker: Fails fast with ``CircuitOpenError`` the calls to an
+            endpoint family whose recent calls mostly failed.
+        response_cache: Cache of successful API responses, consulted by
+            ``curl`` unless called with ``use_cache=False``. Stale entries are
+            served immediately and refreshed in the background.
+        client_options: Connection options of the httpx client: HTTP/2, pool
+            limits and per-phase timeouts. Keys of ``config`` take precedence.
+            Defaults to a larger pool for the async clients.
+        transport: Externally owned httpx transport, sync or async to match
+            the wrapper, e.g. from ``ClientOptions.transport``. Wrappers given
+            the same transport share its connection pool, even across Vinted
+            domains. It overrides the ``transport`` of ``config`` and is left
+            open when the wrapper closes: its owner closes it.
+        json_decoder: Function decoding the raw response bytes. Defaults to
+            the fastest backend installed, see ``get_json_decoder``.
     """
 
+    _default_client_options: ClassVar[ClientOptions] = ClientOptions()
+    _transport_type: ClassVar[type] = httpx.BaseTransport
+
     baseurl: str
     session_cookie: Optional[Dict[str, str]] = None
     user_agent: Optional[str] = None
     config: Optional[Dict] = None
     cookie_names: Optional[List[str]] = None
+    auto_renew_cookie: bool = False
+    cookie_store: Optional[CookieStore] = None
+    rate_limiter: Optional[RateLimiter] = None
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    on_retry: Optional[Callable[[RetryState], None]] = None
+    circuit_breaker: Optional[CircuitBreaker] = None
+    response_cache: Optional[ResponseCache] = None
+    client_options: Optional[ClientOptions] = None
+    transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None
+    json_decoder: Optional[JsonDecoder] = None
+    _curl_headers: Optional[
+        Tuple[Optional[str], Optional[Dict[str, str]], Dict[str, str]]
+    ] = field(init=False, repr=False, compare=False, default=None)
 
     def _validate_and_init(self) -> Dict:
         """Validate base URL, set defaults, and return httpx config.
@@ -65,6 +144,7 @@ class BaseVintedWrapper:
 
         Raises:
             RuntimeError: If the base URL is invalid.
+            TypeError: If the transport is not sync, or async, like the wrapper.
         """
         if not url_validator(self.baseurl):
             _log.error("'%s' is not a valid url", self.baseurl)
@@ -79,15 +159,60 @@ class BaseVintedWrapper:
             config=self.config,
         )
 
+        if self.session_cookie is None and self.cookie_store is not None:
+            record = self.cookie_store.load(self.baseurl, self.user_agent)
+            if record is not None:
+                _log.debug("Using the session cookie from the cookie store")
+                self.session_cookie = record.cookies
+                self.user_agent = record.user_agent
         if self.user_agent is None:
             self.user_agent = get_random_user_agent()
         if self.cookie_names is None:
             self.cookie_names = [SESSION_COOKIE_NAME]
+        if self.json_decoder is None:
+            self.json_decoder = get_json_decoder()
 
-        return get_httpx_config(self.baseurl, self.config)
+        options = self.client_options or self._default_client_options
+        httpx_config = get_httpx_config(self.baseurl, self.config, options)
+        if self.transport is not None:
+            httpx_config["transport"] = borrow_transport(
+                self.transport, self._transport_type
+            )
+        return httpx_config
 
     # -- cookie helpers -------------------------------------------------------
 
+    def _store_cookie(self, cookies: Dict[str, str]) -> None:
+        """Save a freshly fetched session cookie in the cookie store, if any.
+
+        Args:
+            cookies: The fetched session cookie.
+        """
+        if self.cookie_store is not None:
+            self.cookie_store.save(self.baseurl, self.user_agent, cookies)
+
+    def _load_newer_cookie(
+        self, stale: Optional[Dict[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        """Return a stored session cookie other than the rejected one.
+
+        Lets a wrapper pick up a cookie already refreshed by another process
+        instead of fetching a new one.
+
+        Args:
+            stale: The session cookie that was rejected.
+
+        Returns:
+            The stored cookie, or None if there is no newer valid one.
+        """
+        if self.cookie_store is None:
+            return None
+        record = self.cookie_store.load(self.baseurl, self.user_agent)
+        if record is None or record.cookies == stale:
+            return None
+        _log.debug("Using the session cookie refreshed by another wrapper")
+        return record.cookies
+
     @staticmethod
     def _process_cookie_response(
         response, cookie_names: List[str]
@@ -110,22 +235,53 @@ class BaseVintedWrapper:
         return None
 
     @staticmethod
-    def _handle_cookie_failure(response, attempt: int, retries: int) -> float:
+    def _handle_cookie_failure(
+        response,
+        attempt: int,
+        retries: int,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> Optional[float]:
         """Log a failed cookie attempt and return the sleep duration.
 
         Args:
             response: httpx response object.
             attempt: Current attempt number (0-indexed).
             retries: Total retry count.
+            retry_policy: Backoff to apply. Defaults to ``RetryPolicy()``.
 
         Returns:
-            Seconds to sleep before the next attempt.
+            Seconds to sleep before the next attempt, or None to give up if
+            the ``Retry-After`` of the response exceeds the maximum delay.
         """
         log_cookie_fetch_failed(_log, response.status_code, attempt, retries)
-        sleep_time = RETRY_BASE_SLEEP**attempt
-        log_sleep(_log, sleep_time)
+        sleep_time = (retry_policy or RetryPolicy()).backoff(attempt, response)
+        if sleep_time is not None:
+            log_sleep(_log, sleep_time)
         return sleep_time
 
+    @staticmethod
+    def _cookie_renewal_delay(
+        session_cookie: Optional[Dict[str, str]],
+    ) -> Optional[float]:
+        """Compute when a session cookie should be proactively renewed.
+
+        Args:
+            session_cookie: The session cookie to inspect.
+
+        Returns:
+            Seconds before the renewal, or None if the cookie carries no expiry
+            or expires within ``COOKIE_RENEWAL_MARGIN`` seconds, in which case
+            the 401 handling takes over.
+        """
+        expiry = get_cookie_expiry(session_cookie)
+        if expiry is None:
+            return None
+        delay = expiry - COOKIE_RENEWAL_MARGIN - time.time()
+        if delay <= 0:
+            return None
+        log_cookie_renewal(_log, delay)
+        return delay
+
     @staticmethod
     def _raise_cookie_error(base_url, response) -> NoReturn:
         """Raise after all cookie-fetch retries are exhausted.
@@ -146,13 +302,34 @@ class BaseVintedWrapper:
 
     # -- curl helpers ---------------------------------------------------------
 
-    def _build_curl_headers(self) -> Dict[str, str]:
+    def _build_curl_headers(
+        self, session_cookie: Optional[Dict[str, str]]
+    ) -> Dict[str, str]:
         """Build headers for an API request.
 
+        The headers are reused until the session cookie or the user agent
+        change, on top of a template shared per base URL and user agent.
+
+        Args:
+            session_cookie: Snapshot of the session cookie to send.
+
         Returns:
-            Header dictionary.
+            Dictionary of HTTP headers, shared by the requests: do not modify.
         """
-        return get_curl_headers(self.baseurl, self.user_agent, self.session_cookie)
+        cached = self._curl_headers
+        if (
+            cached is not None
+            and cached[0] == self.user_agent
+            and cached[1] == session_cookie
+        ):
+            return cached[2]
+        headers = {
+            **get_curl_header_template(self.baseurl, self.user_agent),
+            "Cookie": get_cookie_string(session_cookie),
+        }
+        snapshot = None if session_cookie is None else dict(session_cookie)
+        self._curl_headers = (self.user_agent, snapshot, headers)
+        return headers
 
     def _log_curl_request(
         self, endpoint: str, headers: Dict[str, str], params: Optional[Dict]
@@ -167,19 +344,167 @@ class BaseVintedWrapper:
         log_curl_request(_log, self.baseurl, endpoint, headers, params)
 
     @staticmethod
-    def _log_curl_response(endpoint: str, status_code: int, headers, text: str) -> None:
+    def _log_curl_response(endpoint: str, response) -> None:
         """Log an incoming API response.
 
+        The body is only decoded when DEBUG logging is enabled.
+
         Args:
             endpoint: API endpoint that was called.
-            status_code: HTTP status code.
-            headers: Response headers.
-            text: Response body text.
+            response: httpx response object.
         """
-        log_curl_response(_log, endpoint, status_code, headers, text)
+        log_curl_response(
+            _log,
+            endpoint,
+            response.status_code,
+            response.headers,
+            lambda: response.text,
+        )
 
-    @staticmethod
-    def _handle_curl_response(response, endpoint: str) -> Dict[str, Any]:
+    def _cache_key(self, endpoint: str, params: Optional[Dict]) -> Optional[str]:
+        """Return the response cache key of a request, None without a cache."""
+        if self.response_cache is None:
+            return None
+        return get_cache_key(endpoint, params, self.baseurl)
+
+    def _cached_response(self, cache_key: Optional[str]) -> Optional[CachedResponse]:
+        """Return the cached response of a request, if any.
+
+        Args:
+            cache_key: The request cache key, None without a cache.
+
+        Returns:
+            The cached response, possibly stale, or None on a miss.
+        """
+        if cache_key is None:
+            return None
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            _log.debug(
+                "Response cache %s hit for %s",
+                "stale" if cached.stale else "fresh",
+                cache_key,
+            )
+        return cached
+
+    def _response_decoder(
+        self, endpoint: str  # pylint: disable=unused-argument
+    ) -> JsonDecoder:
+        """Return the decoder of the response bodies of an endpoint.
+
+        Args:
+            endpoint: The endpoint that was called.
+
+        Returns:
+            ``json_decoder``, subclasses may decode some endpoints into models.
+        """
+        return self.json_decoder
+
+    def _decode_cached_response(self, cached: CachedResponse, endpoint: str) -> Any:
+        """Decode the body of a cached response.
+
+        Args:
+            cached: The cached response.
+            endpoint: The endpoint of the cached response.
+
+        Returns:
+            Parsed JSON dict.
+        """
+        return self._response_decoder(endpoint)(cached.body)
+
+    def _cache_response(
+        self, cache_key: Optional[str], endpoint: str, response
+    ) -> None:
+        """Cache the body and headers of a successful response.
+
+        Args:
+            cache_key: The request cache key, None without a cache.
+            endpoint: API endpoint path.
+            response: httpx response object.
+        """
+        if cache_key is not None:
+            self.response_cache.set(
+                cache_key, endpoint, response.content, dict(response.headers)
+            )
+
+    @contextmanager
+    def _circuit(self, endpoint: str) -> Iterator[None]:
+        """Guard an API call with the circuit breaker, if any.
+
+        Calls failing with a 403, 429 or 5xx status or an httpx transport
+        error (timeout, connection error) count as failed. Other errors, e.g.
+        the 404 of a deleted item, leave the circuit untouched.
+
+        Args:
+            endpoint: API endpoint path.
+
+        Raises:
+            CircuitOpenError: If the circuit of the endpoint family is open.
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            yield
+            return
+        breaker.acquire(endpoint)
+        try:
+            yield
+        except BaseException as e:
+            if is_service_failure(e):
+                breaker.record(endpoint, failed=True)
+            else:
+                breaker.release(endpoint)
+            raise
+        breaker.record(endpoint, failed=False)
+
+    def _next_retry(
+        self,
+        state: RetryState,
+        response=None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """Record a failed API request attempt and decide whether to retry it.
+
+        A 401 is retried right after refreshing the session cookie, up to
+        ``retry_policy.auth_retries`` times. Other retryable failures wait for
+        the backoff of the ``retry_policy``.
+
+        Args:
+            state: Retry state of the call, updated in place.
+            response: The response, if the request got one.
+            error: The timeout raised, if the request got no response.
+
+        Returns:
+            True if the request should be retried after ``state.delay``.
+        """
+        policy = self.retry_policy
+        if response is not None and response.status_code == HTTP_UNAUTHORIZED:
+            if state.cookie_refreshes >= policy.auth_retries:
+                return False
+            self._log_cookie_retry(response.status_code)
+            state.cookie_refreshes += 1
+            delay = 0.0
+        else:
+            if error is not None and not policy.retry_timeouts:
+                return False
+            if response is not None and not policy.is_retryable(response.status_code):
+                return False
+            delay = policy.next_delay(
+                state.attempt - state.cookie_refreshes, state.elapsed, response
+            )
+            if delay is None:
+                return False
+
+        state.attempt += 1
+        state.reason = (
+            type(error).__name__ if error is not None else str(response.status_code)
+        )
+        state.delay = delay
+        log_retry(_log, state.reason, state.attempt - 1, delay)
+        if self.on_retry is not None:
+            self.on_retry(state)
+        return True
+
+    def _handle_curl_response(self, response, endpoint: str) -> Any:
         """Process a successful (200) curl response.
 
         Args:
@@ -193,7 +518,7 @@ class BaseVintedWrapper:
             RuntimeError: If JSON parsing fails.
         """
         try:
-            return response.json()
+            return self._response_decoder(endpoint)(response.content)
         except ValueError as e:
             _log.error("Failed to parse JSON response from %s: %s", endpoint, e)
             raise RuntimeError(f"Invalid JSON response from {endpoint}: {e}") from e
@@ -207,11 +532,9 @@ class BaseVintedWrapper:
             status_code: HTTP status code received.
 
         Raises:
-            RuntimeError: Always.
+            VintedApiError: Always.
         """
-        raise RuntimeError(
-            f"Cannot perform API call to endpoint {endpoint}, error code: {status_code}"
-        )
+        raise VintedApiError(endpoint, status_code)
 
     # -- search / item helpers ------------------------------------------------
 
@@ -229,6 +552,76 @@ class BaseVintedWrapper:
         """
         return f"{API_ITEMS}/{item_id}/details"
 
+    @staticmethod
+    def _iter_pages(params: Optional[Dict], max_pages: Optional[int]) -> Iterable[int]:
+        """Return the page numbers to walk for a paginated search.
+
+        Args:
+            params: Search parameters; an existing ``page`` is the first page.
+            max_pages: Maximum number of pages to walk. Unlimited if None.
+
+        Returns:
+            An iterable of page numbers.
+        """
+        start = int((params or {}).get("page", 1))
+        if max_pages is None:
+            return itertools.count(start)
+        return range(start, start + max_pages)
+
+    @staticmethod
+    def _page_params(params: Optional[Dict], page: int) -> Dict:
+        """Return a copy of the search parameters targeting the given page.
+
+        Args:
+            params: Search parameters dictionary.
+            page: Page number to request.
+        """
+        return {**(params or {}), "page": page}
+
+    @staticmethod
+    def _page_items(response) -> List[Dict[str, Any]]:
+        """Return the items of a search page, or an empty list if missing.
+
+        Args:
+            response: Search response, either a dict or a ``VintedJsonModel``.
+        """
+        try:
+            return response["items"] or []
+        except KeyError:
+            return []
+
+    @staticmethod
+    def _total_pages(response) -> Optional[int]:
+        """Return the number of pages reported by the pagination metadata.
+
+        Args:
+            response: Search response, either a dict or a ``VintedJsonModel``.
+
+        Returns:
+            Total number of pages, or None if the metadata is missing.
+        """
+        try:
+            pagination = response["pagination"]
+        except KeyError:
+            return None
+        if not isinstance(pagination, dict) or not pagination.get("total_pages"):
+            return None
+        return int(pagination["total_pages"])
+
+    @staticmethod
+    def _is_last_page(response, page: int) -> bool:
+        """Check the pagination metadata of a search page.
+
+        Args:
+            response: Search response, either a dict or a ``VintedJsonModel``.
+            page: Page number of the response.
+
+        Returns:
+            True if the pagination metadata reports ``page`` as the last one.
+        """
+        total_pages = BaseVintedWrapper._total_pages(response)
+        return total_pages is not None and page >= total_pages
+
     def _log_search(self, params: Optional[Dict]) -> None:
         """Log a search call.
 
@@ -250,7 +643,7 @@ class BaseVintedWrapper:
         """Log a cookie refresh."""
         log_refresh_cookie(_log)
 
-    def _get_cookie_headers(self) -> Dict:
+    def _get_cookie_headers(self) -> Dict[str, str]:
         """Build headers for the cookie-fetch request.
 
         Returns:
@@ -2,8 +2,9 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
+from ._base_scraper import BaseVintedScraperMixin
 from ._wrapper import VintedWrapper
 from .models import VintedItem, VintedJsonModel
 
@@ -11,12 +12,20 @@ _log = logging.getLogger(__name__)
 
 
 @dataclass
-class VintedScraper(VintedWrapper):
+class VintedScraper(BaseVintedScraperMixin, VintedWrapper):
     """Synchronous Vinted scraper with typed model support.
 
     Returns structured VintedItem objects instead of raw JSON dictionaries.
     Inherits all functionality from VintedWrapper.
 
+    With ``struct_models``, the search and item responses are decoded by
+    msgspec straight into ``VintedItemStruct`` objects, skipping the
+    intermediate dicts. They have the same public attributes as
+    ``VintedItem`` but no ``json_data``.
+
+    Attributes:
+        struct_models: Whether to return Struct models, requires msgspec.
+
     Example:
        See https://github.com/Giglium/vinted_scraper/blob/main/examples/scraper.py
     """
@@ -39,7 +48,23 @@ class VintedScraper(VintedWrapper):
         Returns:
             List of VintedItem objects representing search results.
         """
-        return [VintedItem(json_data=item) for item in super().search(params)["items"]]
+        return [self._item_model(item) for item in super().search(params)["items"]]
+
+    def iter_search(  # type: ignore
+        self, params: Optional[Dict] = None, max_pages: Optional[int] = None
+    ) -> Iterator[VintedItem]:
+        """Lazily iterate over the search results page by page.
+
+        Args:
+            params: Query parameters, see ``search``. If present, ``page`` is
+                used as the first page to fetch.
+            max_pages: Maximum number of pages to fetch. Unlimited if None.
+
+        Yields:
+            VintedItem objects, fetching the next page only when needed.
+        """
+        for item in super().iter_search(params, max_pages):
+            yield self._item_model(item)
 
     def item(self, item_id: str, params: Optional[Dict] = None) -> VintedItem:  # type: ignore
         """Retrieve detailed information about a specific item.
@@ -58,22 +83,26 @@ class VintedScraper(VintedWrapper):
             It returns a 403 error after a few uses.
             See: https://github.com/Giglium/vinted_scraper/issues/59
         """
-        return VintedItem(json_data=super().item(item_id, params)["item"])
+        return self._item_model(super().item(item_id, params)["item"])
 
     def curl(
-        self, endpoint: str, params: Optional[Dict] = None, *, _retries: int = 0
+        self, endpoint: str, params: Optional[Dict] = None, *, use_cache: bool = True
     ) -> VintedJsonModel:  # type: ignore
         """Send a custom HTTP GET request to any Vinted API endpoint.
 
         Args:
             endpoint: The API endpoint path (e.g., "/api/v2/users/username").
             params: Optional query parameters.
+            use_cache: Whether a cached response can be returned.
 
         Returns:
-            VintedJsonModel containing the JSON response.
+            VintedJsonModel containing the JSON response, or the Struct
+            model of the search and item endpoints with ``struct_models``.
 
         Raises:
             RuntimeError: If the request fails or returns a non-200 status code.
         """
-        response = super().curl(endpoint, params, _retries=_retries)
+        response = super().curl(endpoint, params, use_cache=use_cache)
+        if not isinstance(response, dict):
+            return response
         return VintedJsonModel(json_data=response)
@@ -0,0 +1,338 @@
+"""Pools of wrapper identities to spread requests across several sessions."""
+
+import itertools
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Type
+
+import httpx
+
+from ._async_wrapper import AsyncVintedWrapper
+from ._wrapper import VintedWrapper
+from .utils import (
+    DEFAULT_RETRIES,
+    IDENTITY_FAILURE_STATUSES,
+    VintedApiError,
+    get_random_user_agent,
+)
+
+_log = logging.getLogger(__name__)
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+
+def _is_identity_failure(error: BaseException) -> bool:
+    """Check whether an error is blamed on the identity that made the request.
+
+    Transport errors and 401, 403 and 429 responses are, unlike e.g. the 404
+    of a deleted item, an open circuit or an invalid body.
+    """
+    if isinstance(error, httpx.TransportError):
+        return True
+    return (
+        isinstance(error, VintedApiError)
+        and error.status_code in IDENTITY_FAILURE_STATUSES
+    )
+
+
+@dataclass
+class _Identity:
+    """A wrapper of the pool with its load and failure counters."""
+
+    wrapper: Any
+    in_flight: int = 0
+    failures: int = 0
+    retired: bool = False
+    closed: bool = False
+
+
+@dataclass
+class _BaseSessionPool:
+    """Shared selection and retirement logic of the session pools.
+
+    Attributes:
+        wrappers: The identities of the pool, one wrapper each.
+        policy: ``"round_robin"`` or ``"least_loaded"``.
+        max_failures: Consecutive identity failures (transport errors, 401,
+            403 and 429 responses) after which an identity is retired and
+            closed.
+    """
+
+    wrappers: List[Any]
+    policy: str = ROUND_ROBIN
+    max_failures: int = DEFAULT_RETRIES
+    _identities: List[_Identity] = field(init=False, repr=False)
+    _all: List[_Identity] = field(init=False, repr=False)
+    _counter: Any = field(init=False, repr=False, default_factory=itertools.count)
+    _lock: threading.Lock = field(
+        init=False, repr=False, compare=False, default_factory=threading.Lock
+    )
+
+    def __post_init__(self) -> None:
+        """Validate the policy and wrap the identities.
+
+        Raises:
+            ValueError: If the policy is unknown or the pool is empty.
+        """
+        if self.policy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError(f"Unknown session pool policy '{self.policy}'")
+        if not self.wrappers:
+            raise ValueError("A session pool needs at least one wrapper")
+        self._all = [_Identity(wrapper) for wrapper in self.wrappers]
+        self._identities = list(self._all)
+
+    @staticmethod
+    def _identity_kwargs(
+        index: int, configs: Optional[List[Optional[Dict]]], kwargs: Dict
+    ) -> Dict:
+        """Build the constructor arguments of the identity at ``index``.
+
+        Every identity gets its own random user agent unless one is given, and
+        the httpx config at the same position in ``configs``, if any.
+        """
+        return {
+            "user_agent": get_random_user_agent(),
+            "config": configs[index % len(configs)] if configs else None,
+            **kwargs,
+        }
+
+    @property
+    def active(self) -> List[Any]:
+        """The wrappers that have not been retired."""
+        return [identity.wrapper for identity in self._identities]
+
+    def _acquire(self) -> _Identity:
+        """Pick the identity for the next request according to the policy.
+
+        Raises:
+            RuntimeError: If every identity has been retired.
+        """
+        with self._lock:
+            if not self._identities:
+                raise RuntimeError("Every identity of the session pool was retired")
+            if self.policy == LEAST_LOADED:
+                identity = min(self._identities, key=lambda i: i.in_flight)
+            else:
+                identity = self._identities[next(self._counter) % len(self._identities)]
+            identity.in_flight += 1
+            return identity
+
+    def _release(self, identity: _Identity, failed: Optional[bool]) -> bool:
+        """Update the counters of an identity after a request.
+
+        Args:
+            identity: The identity that served the request.
+            failed: Whether the request failed because of the identity, None
+                if it failed for another reason.
+
+        Returns:
+            Whether the identity is retired and idle, and must be closed.
+        """
+        with self._lock:
+            identity.in_flight -= 1
+            if failed is not None:
+                identity.failures = identity.failures + 1 if failed else 0
+            if identity.failures >= self.max_failures and not identity.retired:
+                _log.warning(
+                    "Retiring a session pool identity after %d failures",
+                    identity.failures,
+                )
+                identity.retired = True
+                self._identities.remove(identity)
+            if identity.retired and not identity.in_flight and not identity.closed:
+                identity.closed = True
+                return True
+            return False
+
+    def _to_close(self) -> List[Any]:
+        """Mark every identity closed and return the wrappers still open."""
+        with self._lock:
+            wrappers = [i.wrapper for i in self._all if not i.closed]
+            for identity in self._all:
+                identity.closed = True
+        return wrappers
+
+
+@dataclass
+class SessionPool(_BaseSessionPool):
+    """Synchronous pool dispatching requests across several wrappers.
+
+    Each wrapper is an identity with its own session cookie, user agent and
+    httpx client, refreshing its cookie independently. Identities failing
+    ``max_failures`` times in a row are retired and closed. The pool is
+    thread-safe.
+
+    Attributes:
+        wrappers: The identities of the pool, e.g. ``VintedScraper`` instances.
+        policy: ``"round_robin"`` or ``"least_loaded"``.
+        max_failures: Consecutive identity failures after which an identity
+            is retired.
+    """
+
+    @classmethod
+    def build(  # pylint: disable=too-many-arguments
+        cls,
+        baseurl: str,
+        size: int,
+        configs: Optional[List[Optional[Dict]]] = None,
+        *,
+        wrapper_cls: Type[VintedWrapper] = VintedWrapper,
+        policy: str = ROUND_ROBIN,
+        max_failures: int = DEFAULT_RETRIES,
+        **kwargs: Any,
+    ) -> "SessionPool":
+        """Create a pool of ``size`` new identities.
+
+        Args:
+            baseurl: Vinted domain URL (e.g., "https://www.vinted.com").
+            size: Number of identities.
+            configs: httpx configs (e.g. with a proxy) assigned in turn.
+            wrapper_cls: Wrapper class of the identities.
+            policy: ``"round_robin"`` or ``"least_loaded"``.
+            max_failures: Consecutive identity failures before retirement.
+            **kwargs: Any other wrapper attribute, shared by every identity.
+
+        Returns:
+            The session pool.
+        """
+        wrappers = [
+            wrapper_cls(baseurl, **cls._identity_kwargs(i, configs, kwargs))
+            for i in range(size)
+        ]
+        return cls(wrappers, policy=policy, max_failures=max_failures)
+
+    def _call(self, method: str, *args: Any) -> Any:
+        """Call a wrapper method on the next identity.
+
+        Raises:
+            RuntimeError: If the request fails or every identity was retired.
+        """
+        identity = self._acquire()
+        try:
+            result = getattr(identity.wrapper, method)(*args)
+        except BaseException as e:
+            if self._release(identity, _is_identity_failure(e) or None):
+                identity.wrapper.__exit__(None, None, None)
+            raise
+        if self._release(identity, failed=False):
+            identity.wrapper.__exit__(None, None, None)
+        return result
+
+    def search(self, params: Optional[Dict] = None) -> Any:
+        """Search for items on Vinted, see ``VintedWrapper.search``."""
+        return self._call("search", params)
+
+    def item(self, item_id: str, params: Optional[Dict] = None) -> Any:
+        """Retrieve an item, see ``VintedWrapper.item``."""
+        return self._call("item", item_id, params)
+
+    def curl(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Send a GET request to any endpoint, see ``VintedWrapper.curl``."""
+        return self._call("curl", endpoint, params)
+
+    def __enter__(self) -> "SessionPool":
+        """Enter context manager.
+
+        Returns:
+            Self for use in with statement.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context manager and close every identity not closed yet."""
+        for wrapper in self._to_close():
+            wrapper.__exit__(exc_type, exc_val, exc_tb)
+
+
+@dataclass
+class AsyncSessionPool(_BaseSessionPool):
+    """Asynchronous pool dispatching requests across several wrappers.
+
+    Each wrapper is an identity with its own session cookie, user agent and
+    httpx client, refreshing its cookie independently. Identities failing
+    ``max_failures`` times in a row are retired and closed.
+
+    Attributes:
+        wrappers: The identities, e.g. ``AsyncVintedScraper`` instances.
+        policy: ``"round_robin"`` or ``"least_loaded"``.
+        max_failures: Consecutive identity failures after which an identity
+            is retired.
+    """
+
+    @classmethod
+    async def create(  # pylint: disable=too-many-arguments
+        cls,
+        baseurl: str,
+        size: int,
+        configs: Optional[List[Optional[Dict]]] = None,
+        *,
+        wrapper_cls: Type[AsyncVintedWrapper] = AsyncVintedWrapper,
+        policy: str = ROUND_ROBIN,
+        max_failures: int = DEFAULT_RETRIES,
+        **kwargs: Any,
+    ) -> "AsyncSessionPool":
+        """Create a pool of ``size`` new identities with their session cookie.
+
+        Args:
+            baseurl: Vinted domain URL (e.g., "https://www.vinted.com").
+            size: Number of identities.
+            configs: httpx configs (e.g. with a proxy) assigned in turn.
+            wrapper_cls: Wrapper class of the identities.
+            policy: ``"round_robin"`` or ``"least_loaded"``.
+            max_failures: Consecutive identity failures before retirement.
+            **kwargs: Any other wrapper attribute, shared by every identity.
+
+        Returns:
+            The session pool.
+        """
+        wrappers = [
+            await wrapper_cls.create(
+                baseurl, **cls._identity_kwargs(i, configs, kwargs)
+            )
+            for i in range(size)
+        ]
+        return cls(wrappers, policy=policy, max_failures=max_failures)
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """Call a wrapper coroutine method on the next identity.
+
+        Raises:
+            RuntimeError: If the request fails or every identity was retired.
+        """
+        identity = self._acquire()
+        try:
+            result = await getattr(identity.wrapper, method)(*args)
+        except BaseException as e:
+            if self._release(identity, _is_identity_failure(e) or None):
+                await identity.wrapper.__aexit__(None, None, None)
+            raise
+        if self._release(identity, failed=False):
+            await identity.wrapper.__aexit__(None, None, None)
+        return result
+
+    async def search(self, params: Optional[Dict] = None) -> Any:
+        """Search for items on Vinted, see ``AsyncVintedWrapper.search``."""
+        return await self._call("search", params)
+
+    async def item(self, item_id: str, params: Optional[Dict] = None) -> Any:
+        """Retrieve an item, see ``AsyncVintedWrapper.item``."""
+        return await self._call("item", item_id, params)
+
+    async def curl(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Send a GET request to any endpoint, see ``AsyncVintedWrapper.curl``."""
+        return await self._call("curl", endpoint, params)
+
+    async def __aenter__(self) -> "AsyncSessionPool":
+        """Enter async context manager.
+
+        Returns:
+            Self for use in async with statement.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager and close every identity not closed yet."""
+        for wrapper in self._to_close():
+            await wrapper.__aexit__(exc_type, exc_val, exc_tb)
@@ -3,14 +3,33 @@
 """Vinted wrapper for raw JSON responses."""
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
 import httpx
 
 from ._base_wrapper import BaseVintedWrapper
-from .utils import DEFAULT_RETRIES, HTTP_OK, HTTP_UNAUTHORIZED
+from .utils import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RETRIES,
+    HTTP_OK,
+    HTTP_UNAUTHORIZED,
+    RetryPolicy,
+    RetryState,
+)
 
 _log = logging.getLogger(__name__)
 
@@ -28,12 +47,42 @@ class VintedWrapper(BaseVintedWrapper):
         user_agent: Custom user agent string. Auto-generated if None.
         config: httpx client configuration dict.
         cookie_names: List of cookie names to extract. Defaults to ["access_token_web"].
+        auto_renew_cookie: Renew the session cookie in background before it expires.
+        cookie_store: Persistent store sharing the session cookie across processes.
+        rate_limiter: Token-bucket limiter applied to every API request.
+        retry_policy: Backoff applied to the cookie fetch and to failed API calls.
+        on_retry: Called with the ``RetryState`` of an API call before each retry.
+        circuit_breaker: Fails fast the calls to endpoints that keep failing.
+        response_cache: Cache of successful API responses used by ``curl``.
+        client_options: HTTP/2, connection pool limits and per-phase timeouts.
+        transport: Shared transport owned, and closed, by the caller.
+        json_decoder: Decoder of the raw response bytes (orjson, msgspec, json).
+        max_workers: Size of the thread pool used by the batch methods.
 
     Example:
         See https://github.com/Giglium/vinted_scraper/blob/main/examples/wrapper.py
     """
 
+    max_workers: int = DEFAULT_CONCURRENCY
     _client: httpx.Client = field(init=False, repr=False)
+    _executor: Optional[ThreadPoolExecutor] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _cache_lock: threading.Lock = field(
+        init=False, repr=False, compare=False, default_factory=threading.Lock
+    )
+    _revalidating: Set[str] = field(
+        init=False, repr=False, compare=False, default_factory=set
+    )
+    _cookie_lock: threading.RLock = field(
+        init=False, repr=False, compare=False, default_factory=threading.RLock
+    )
+    _renewal: Optional[threading.Timer] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _renewal_cookie: Optional[Dict[str, str]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def __post_init__(self) -> None:
         """Initialize VintedWrapper after dataclass initialization.
@@ -48,6 +97,7 @@ class VintedWrapper(BaseVintedWrapper):
         self._client = httpx.Client(**httpx_config)
         if self.session_cookie is None:
             self.session_cookie = self.refresh_cookie()
+        self._schedule_cookie_renewal()
 
     def refresh_cookie(self, retries: int = DEFAULT_RETRIES) -> Dict[str, str]:
         """Manually refresh the session cookie.
@@ -62,12 +112,72 @@ class VintedWrapper(BaseVintedWrapper):
             RuntimeError: If cookies cannot be fetched after all retries.
         """
         self._log_refresh_cookie()
-        return VintedWrapper.fetch_cookie(
+        cookies = VintedWrapper.fetch_cookie(
             self._client,
             self._get_cookie_headers(),
             self.cookie_names,
             retries,
+            self.retry_policy,
         )
+        self._store_cookie(cookies)
+        return cookies
+
+    def _refresh_session_cookie(self, stale: Optional[Dict[str, str]]) -> None:
+        """Refresh the session cookie once for all threads that saw it expire.
+
+        The first thread refreshes while holding the lock, preferring a newer
+        cookie from the cookie store to a new fetch; the others wait for it
+        and, finding a cookie different from the one they sent, retry with the
+        new cookie without refreshing again.
+
+        Args:
+            stale: The session cookie that was rejected.
+        """
+        with self._cookie_lock:
+            if self.session_cookie is stale:
+                self.session_cookie = (
+                    self._load_newer_cookie(stale) or self.refresh_cookie()
+                )
+                self._schedule_cookie_renewal()
+
+    def _schedule_cookie_renewal(self) -> None:
+        """Schedule a background renewal of the current session cookie.
+
+        Does nothing unless ``auto_renew_cookie`` is set, or if the renewal of
+        the current cookie is already scheduled. Any timer scheduled for a
+        previous cookie is cancelled.
+        """
+        session_cookie = self.session_cookie
+        if not self.auto_renew_cookie or self._renewal_cookie is session_cookie:
+            return
+        with self._cookie_lock:
+            if self._renewal_cookie is session_cookie:
+                return
+            if self._renewal is not None:
+                self._renewal.cancel()
+            self._renewal_cookie = session_cookie
+            self._renewal = None
+            delay = self._cookie_renewal_delay(session_cookie)
+            if delay is not None:
+                self._renewal = threading.Timer(
+                    delay, self._renew_cookie, args=(session_cookie,)
+                )
+                self._renewal.daemon = True
+                self._renewal.start()
+
+    def _renew_cookie(self, stale: Dict[str, str]) -> None:
+        """Renew the session cookie from the background timer.
+
+        Failures are only logged: the 401 handling still covers the request
+        path if the cookie expires.
+
+        Args:
+            stale: The session cookie the timer was scheduled for.
+        """
+        try:
+            self._refresh_session_cookie(stale)
+        except (RuntimeError, httpx.HTTPError) as e:
+            _log.warning("Cannot renew the session cookie in background: %s", e)
 
     @staticmethod
     def fetch_cookie(
@@ -75,6 +185,7 @@ class VintedWrapper(BaseVintedWrapper):
         headers: Dict,
         cookie_names: List[str],
         retries: int = DEFAULT_RETRIES,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> Dict[str, str]:
         """Fetch session cookies from Vinted using HTTP GET request.
 
@@ -83,6 +194,7 @@ class VintedWrapper(BaseVintedWrapper):
             headers: HTTP headers dictionary.
             cookie_names: List of cookie names to extract.
             retries: Number of retry attempts (default: 3).
+            retry_policy: Backoff between attempts. Defaults to ``RetryPolicy()``.
 
         Returns:
             Dictionary of extracted session cookies.
@@ -100,10 +212,12 @@ class VintedWrapper(BaseVintedWrapper):
             if cookies:
                 return cookies
 
-            if response.status_code != HTTP_OK:
+            if response.status_code != HTTP_OK and i < retries - 1:
                 sleep_time = BaseVintedWrapper._handle_cookie_failure(
-                    response, i, retries
+                    response, i, retries, retry_policy
                 )
+                if sleep_time is None:
+                    break
                 time.sleep(sleep_time)
 
         BaseVintedWrapper._raise_cookie_error(client.base_url, response)
@@ -129,6 +243,33 @@ class VintedWrapper(BaseVintedWrapper):
         self._log_search(params)
         return self.curl(self._search_endpoint(), params=params)
 
+    def iter_search(
+        self, params: Optional[Dict] = None, max_pages: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over the search results page by page.
+
+        A page is only requested once every item of the previous one has been
+        consumed, so breaking out of the loop never fetches extra pages. The
+        iteration stops on an empty page, on the last page reported by the
+        pagination metadata, or after ``max_pages`` pages.
+
+        Args:
+            params: Query parameters, see ``search``. If present, ``page`` is
+                used as the first page to fetch.
+            max_pages: Maximum number of pages to fetch. Unlimited if None.
+
+        Yields:
+            Dictionaries containing the JSON data of each item.
+        """
+        for page in self._iter_pages(params, max_pages):
+            page_params = self._page_params(params, page)
+            self._log_search(page_params)
+            response = self.curl(self._search_endpoint(), params=page_params)
+            items = self._page_items(response)
+            yield from items
+            if not items or self._is_last_page(response, page):
+                return
+
     def item(self, item_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Retrieve detailed information about a specific item.
 
@@ -149,45 +290,198 @@ class VintedWrapper(BaseVintedWrapper):
         self._log_item(item_id, params)
         return self.curl(self._item_endpoint(item_id), params=params)
 
-    def curl(
+    def search_many(
+        self, params_list: Iterable[Optional[Dict]], return_exceptions: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Run many searches concurrently on the internal thread pool.
+
+        Args:
+            params_list: Query parameters of each search, see ``search``.
+            return_exceptions: If True, a failing search puts its exception in
+                the result list instead of raising it.
+
+        Returns:
+            The results of ``search`` in the same order as ``params_list``.
+
+        Raises:
+            RuntimeError: If a search fails and ``return_exceptions`` is False.
+        """
+        return self._map(
+            self.search, [(params,) for params in params_list], return_exceptions
+        )
+
+    def item_many(
         self,
-        endpoint: str,
+        item_ids: Iterable[str],
         params: Optional[Dict] = None,
-        *,
-        _retries: int = 0,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Retrieve many items concurrently on the internal thread pool.
+
+        Args:
+            item_ids: Identifiers of the items to retrieve.
+            params: Optional query parameters sent with every request.
+            return_exceptions: If True, a failing item puts its exception in
+                the result list instead of raising it.
+
+        Returns:
+            The results of ``item`` in the same order as ``item_ids``.
+
+        Raises:
+            RuntimeError: If an item fails and ``return_exceptions`` is False.
+        """
+        return self._map(
+            self.item, [(item_id, params) for item_id in item_ids], return_exceptions
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool, creating it on first use."""
+        with self._cache_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="vinted_scraper"
+                )
+            return self._executor
+
+    def _map(
+        self, func: Callable, args_list: List[tuple], return_exceptions: bool
+    ) -> List[Any]:
+        """Call ``func`` for every argument tuple on the thread pool.
+
+        Args:
+            func: The bound method to call.
+            args_list: Positional arguments of every call.
+            return_exceptions: Whether to return exceptions instead of raising.
+
+        Returns:
+            The results in the same order as ``args_list``.
+        """
+        executor = self._get_executor()
+        futures = [executor.submit(func, *args) for args in args_list]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if not return_exceptions:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                results.append(e)
+        return results
+
+    def curl(
+        self, endpoint: str, params: Optional[Dict] = None, *, use_cache: bool = True
     ) -> Dict[str, Any]:
         """Send a custom HTTP GET request to any Vinted API endpoint.
 
         Automatically handles headers, cookies, retries, and error responses.
+        A 401 refreshes the session cookie before retrying; throttled (429),
+        failed (5xx) and timed out attempts are retried after the delay given
+        by the ``retry_policy``. Every retry is reported to ``on_retry``.
 
         Args:
             endpoint: API endpoint path (e.g., "/api/v2/users/username").
             params: Optional query parameters.
+            use_cache: Whether a cached response can be returned. The response
+                received is cached either way.
 
         Returns:
             Dictionary containing the parsed JSON response.
 
         Raises:
             RuntimeError: If response status is not 200 or JSON parsing fails.
+            CircuitOpenError: If the circuit of the endpoint family is open.
+            httpx.TimeoutException: If the last attempt timed out.
         """
-        headers = self._build_curl_headers()
-        self._log_curl_request(endpoint, headers, params)
+        self._schedule_cookie_renewal()
+        cache_key = self._cache_key(endpoint, params)
+        if use_cache:
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                if cached.stale:
+                    self._revalidate(endpoint, params, cache_key)
+                return self._decode_cached_response(cached, endpoint)
+        with self._circuit(endpoint):
+            return self._request(endpoint, params, cache_key)
+
+    def _request(
+        self, endpoint: str, params: Optional[Dict], cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run the attempts of an API call until success or retries run out.
 
-        response = self._client.get(endpoint, headers=headers, params=params)
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+            cache_key: Key under which the response is cached, if any.
 
-        self._log_curl_response(
-            endpoint, response.status_code, response.headers, response.text
-        )
+        Returns:
+            Dictionary containing the parsed JSON response.
+        """
+        state = RetryState(endpoint)
+        while True:
+            session_cookie = self.session_cookie
+            headers = self._build_curl_headers(session_cookie)
+            self._log_curl_request(endpoint, headers, params)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.baseurl, endpoint)
+
+            try:
+                response = self._client.get(endpoint, headers=headers, params=params)
+            except httpx.TimeoutException as e:
+                if not self._next_retry(state, error=e):
+                    raise
+                time.sleep(state.delay)
+                continue
+
+            self._log_curl_response(endpoint, response)
+            if response.status_code == HTTP_OK:
+                result = self._handle_curl_response(response, endpoint)
+                self._cache_response(cache_key, endpoint, response)
+                return result
+            if not self._next_retry(state, response):
+                self._raise_curl_error(endpoint, response.status_code)
+            if response.status_code == HTTP_UNAUTHORIZED:
+                self._refresh_session_cookie(session_cookie)
+            else:
+                time.sleep(state.delay)
+
+    def _revalidate(
+        self, endpoint: str, params: Optional[Dict], cache_key: Optional[str]
+    ) -> None:
+        """Refresh a stale cached response on the thread pool, once at a time.
 
-        if response.status_code == HTTP_OK:
-            return self._handle_curl_response(response, endpoint)
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+            cache_key: Key of the stale cached response.
+        """
+        with self._cache_lock:
+            if cache_key in self._revalidating:
+                return
+            self._revalidating.add(cache_key)
+        self._get_executor().submit(
+            self._refresh_cached_response, endpoint, params, cache_key
+        )
 
-        if response.status_code == HTTP_UNAUTHORIZED and _retries < DEFAULT_RETRIES:
-            self._log_cookie_retry(response.status_code)
-            self.session_cookie = self.refresh_cookie()
-            return self.curl(endpoint, params, _retries=_retries + 1)
+    def _refresh_cached_response(
+        self, endpoint: str, params: Optional[Dict], cache_key: Optional[str]
+    ) -> None:
+        """Fetch a response again to replace its stale cached copy.
 
-        self._raise_curl_error(endpoint, response.status_code)
+        Args:
+            endpoint: API endpoint path.
+            params: Optional query parameters.
+            cache_key: Key of the stale cached response.
+        """
+        try:
+            with self._circuit(endpoint):
+                self._request(endpoint, params, cache_key)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            _log.warning("Cannot refresh the cached response of %s: %s", endpoint, e)
+        finally:
+            with self._cache_lock:
+                self._revalidating.discard(cache_key)
 
     def __enter__(self) -> "VintedWrapper":
         """Enter context manager.
@@ -198,13 +492,17 @@ class VintedWrapper(BaseVintedWrapper):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # pragma: no cover
-        """Exit context manager and close HTTP client.
+        """Exit context manager, stop background work and close HTTP client.
 
         Args:
             exc_type: Exception type (unused).
             exc_val: Exception value (unused).
             exc_tb: Exception traceback (unused).
         """
+        if self._renewal is not None:
+            self._renewal.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
         self._client.close()
 
 
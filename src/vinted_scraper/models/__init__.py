@@ -12,10 +12,28 @@ Classes:
     VintedHighResolution: High-res image metadata.
     VintedBundleDiscount: Bundle discount settings.
     VintedDiscount: Individual discount tier.
+
+The ``VintedCompact*`` classes are their counterparts storing the fields in
+``__slots__``, optionally without the JSON data, and the ``Vinted*View``
+classes are read-only views reading the attributes from the JSON data.
+
+With msgspec installed, the ``Vinted*Struct`` classes are their counterparts
+decoded in a single pass, see ``VintedScraper.struct_models``.
 """
 
 from ._brand import VintedBrand
 from ._bundle_discount import VintedBundleDiscount
+from ._compact import (
+    VintedCompactBrand,
+    VintedCompactBundleDiscount,
+    VintedCompactDiscount,
+    VintedCompactHighResolution,
+    VintedCompactImage,
+    VintedCompactItem,
+    VintedCompactMedia,
+    VintedCompactModel,
+    VintedCompactUser,
+)
 from ._discount import VintedDiscount
 from ._high_resolution import VintedHighResolution
 from ._image import VintedImage
@@ -23,6 +41,17 @@ from ._item import VintedItem
 from ._json_model import VintedJsonModel
 from ._media import VintedMedia
 from ._user import VintedUser
+from ._view import (
+    VintedBrandView,
+    VintedBundleDiscountView,
+    VintedDiscountView,
+    VintedHighResolutionView,
+    VintedImageView,
+    VintedItemView,
+    VintedMediaView,
+    VintedUserView,
+    VintedView,
+)
 
 __all__ = [
     "VintedJsonModel",
@@ -34,4 +63,61 @@ __all__ = [
     "VintedItem",
     "VintedMedia",
     "VintedUser",
+    "VintedCompactModel",
+    "VintedCompactBrand",
+    "VintedCompactBundleDiscount",
+    "VintedCompactDiscount",
+    "VintedCompactHighResolution",
+    "VintedCompactImage",
+    "VintedCompactItem",
+    "VintedCompactMedia",
+    "VintedCompactUser",
+    "VintedView",
+    "VintedBrandView",
+    "VintedBundleDiscountView",
+    "VintedDiscountView",
+    "VintedHighResolutionView",
+    "VintedImageView",
+    "VintedItemView",
+    "VintedMediaView",
+    "VintedUserView",
+    "get_struct_decoder",
 ]
+
+try:
+    from ._struct_models import (
+        VintedBrandStruct,
+        VintedBundleDiscountStruct,
+        VintedDiscountStruct,
+        VintedHighResolutionStruct,
+        VintedImageStruct,
+        VintedItemResponseStruct,
+        VintedItemStruct,
+        VintedMediaStruct,
+        VintedSearchResponseStruct,
+        VintedStruct,
+        VintedUserStruct,
+        get_struct_decoder,
+    )
+except ImportError:  # msgspec is an optional dependency
+
+    def get_struct_decoder(endpoint: str):  # type: ignore
+        """Raise as the Struct models require msgspec."""
+        raise ImportError(
+            "Struct models require msgspec: pip install vinted_scraper[msgspec]"
+        )
+
+else:
+    __all__ += [
+        "VintedStruct",
+        "VintedBrandStruct",
+        "VintedBundleDiscountStruct",
+        "VintedDiscountStruct",
+        "VintedHighResolutionStruct",
+        "VintedImageStruct",
+        "VintedItemResponseStruct",
+        "VintedItemStruct",
+        "VintedMediaStruct",
+        "VintedSearchResponseStruct",
+        "VintedUserStruct",
+    ]
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from ._discount import VintedDiscount
-from ._json_model import VintedJsonModel
+from ._json_model import LazyModel, VintedJsonModel
 
 
 @dataclass
@@ -19,13 +19,4 @@ class VintedBundleDiscount(VintedJsonModel):
     enabled: Optional[bool] = None
     minimal_item_count: Optional[int] = None
     fraction: Optional[float] = None
-    discounts: Optional[List[VintedDiscount]] = None
-
-    def __post_init__(self) -> None:
-        super().__post_init__()
-        if self.json_data is not None:
-            if "discounts" in self.json_data:
-                self.discounts = [
-                    VintedDiscount(json_data=discount)
-                    for discount in self.json_data.get("discounts")
-                ]
+    discounts: Optional[List[VintedDiscount]] = LazyModel(VintedDiscount)
@@ -0,0 +1,209 @@
+# pylint: disable=too-few-public-methods
+"""Compact Vinted models storing their fields in ``__slots__``.
+
+A ``VintedJsonModel`` copies every key of its JSON data into its instance
+``__dict__`` and keeps the JSON data itself, so every key is referenced twice.
+The compact models store the declared fields in slots, the undeclared keys in
+a single ``extra`` dict, and can drop the JSON data altogether.
+"""
+
+from dataclasses import fields
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+from ._brand import VintedBrand
+from ._bundle_discount import VintedBundleDiscount
+from ._discount import VintedDiscount
+from ._high_resolution import VintedHighResolution
+from ._image import VintedImage
+from ._item import VintedItem, _brand_data, _parse_price, _photos_data
+from ._media import VintedMedia
+from ._user import VintedUser
+
+
+def _field_names(model: type) -> Tuple[str, ...]:
+    """Return the names of the fields of a model, except ``json_data``."""
+    return tuple(f.name for f in fields(model) if f.name != "json_data")
+
+
+class VintedCompactModel:
+    """Base class of the compact models.
+
+    Subclasses declare their fields as ``__slots__``, the compact class of
+    their nested models in ``_nested`` and the undeclared keys ``_post_init``
+    derives fields from in ``_derived_keys``.
+
+    Attributes:
+        json_data: Raw JSON dictionary from API response, None if dropped.
+        extra: The undeclared keys of the JSON data, None if there are none.
+    """
+
+    __slots__ = ("json_data", "extra")
+    _nested: ClassVar[Dict[str, type]] = {}
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    _derived_keys: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls._fields + tuple(cls.__dict__.get("__slots__", ()))
+
+    def __init__(self, json_data: Optional[Dict] = None, keep_json: bool = True):
+        """Populate the fields from json_data.
+
+        Args:
+            json_data: Raw JSON dictionary from API response.
+            keep_json: Whether to keep json_data. Nested models follow it.
+        """
+        self.extra: Optional[Dict[str, Any]] = None
+        for name in self._fields:
+            setattr(self, name, None)
+        if json_data is not None:
+            extra = {}
+            for key, value in json_data.items():
+                if key not in self._fields:
+                    if keep_json or key not in self._derived_keys:
+                        extra[key] = value
+                elif key in self._nested and value:
+                    setattr(self, key, self._build(key, value, keep_json))
+                else:
+                    setattr(self, key, value)
+            self.extra = extra or None
+            self._post_init(json_data, keep_json)
+        self.json_data = json_data if keep_json else None
+
+    def _build(self, name: str, value: Any, keep_json: bool) -> Any:
+        """Build the nested model, or list of models, of a field."""
+        model = self._nested[name]
+        if isinstance(value, list):
+            return [model(data, keep_json) for data in value]
+        return model(value, keep_json)
+
+    def _post_init(self, json_data: Dict, keep_json: bool) -> None:
+        """Derive the fields not copied as is from json_data."""
+
+    def __getattr__(self, name: str) -> Any:
+        """Return an undeclared key of the JSON data.
+
+        Raises:
+            AttributeError: If the key doesn't exist.
+        """
+        extra = object.__getattribute__(self, "extra")
+        if extra is None or name not in extra:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        return extra[name]
+
+    def __getitem__(self, key: str) -> Any:
+        """Allow dictionary-style subscript access to json_data.
+
+        Without json_data, the fields and undeclared keys are returned.
+
+        Args:
+            key: The key to access.
+
+        Returns:
+            The value associated with the key.
+
+        Raises:
+            KeyError: If the key doesn't exist.
+        """
+        if self.json_data is not None:
+            return self.json_data[key]
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self._fields)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{n}={getattr(self, n)!r}" for n in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+class VintedCompactMedia(VintedCompactModel):
+    """Compact counterpart of ``VintedMedia``."""
+
+    __slots__ = _field_names(VintedMedia)
+
+
+class VintedCompactHighResolution(VintedCompactModel):
+    """Compact counterpart of ``VintedHighResolution``."""
+
+    __slots__ = _field_names(VintedHighResolution)
+
+
+class VintedCompactImage(VintedCompactModel):
+    """Compact counterpart of ``VintedImage``."""
+
+    __slots__ = _field_names(VintedImage)
+    _nested = {
+        "high_resolution": VintedCompactHighResolution,
+        "thumbnails": VintedCompactMedia,
+    }
+
+
+class VintedCompactBrand(VintedCompactModel):
+    """Compact counterpart of ``VintedBrand``."""
+
+    __slots__ = _field_names(VintedBrand)
+
+
+class VintedCompactDiscount(VintedCompactModel):
+    """Compact counterpart of ``VintedDiscount``."""
+
+    __slots__ = _field_names(VintedDiscount)
+
+    def _post_init(self, json_data: Dict, keep_json: bool) -> None:
+        self.minimal_item_count = int(json_data.get("minimal_item_count", 0))
+        self.fraction = float(json_data.get("fraction", 0.0))
+
+
+class VintedCompactBundleDiscount(VintedCompactModel):
+    """Compact counterpart of ``VintedBundleDiscount``."""
+
+    __slots__ = _field_names(VintedBundleDiscount)
+    _nested = {"discounts": VintedCompactDiscount}
+
+
+class VintedCompactUser(VintedCompactModel):
+    """Compact counterpart of ``VintedUser``."""
+
+    __slots__ = _field_names(VintedUser)
+    _nested = {
+        "photo": VintedCompactImage,
+        "bundle_discount": VintedCompactBundleDiscount,
+    }
+
+
+class VintedCompactItem(VintedCompactModel):
+    """Compact counterpart of ``VintedItem``.
+
+    Example:
+        ``items = [VintedCompactItem(item, keep_json=False) for item in page["items"]]``
+    """
+
+    __slots__ = _field_names(VintedItem)
+    _nested = {"user": VintedCompactUser}
+    _derived_keys = ("photo", "brand_dto")
+
+    def _post_init(self, json_data: Dict, keep_json: bool) -> None:
+        photos = _photos_data(json_data)
+        if photos:
+            self.photos = [VintedCompactImage(data, keep_json) for data in photos]
+        brand = _brand_data(json_data)
+        if brand:
+            self.brand = VintedCompactBrand(brand, keep_json)
+
+        price = json_data.get("price")
+        if isinstance(price, dict):
+            self.currency = price["currency_code"]
+        if isinstance(price, (dict, str)):
+            self.price = _parse_price(price)
+        self.service_fee = _parse_price(json_data.get("service_fee"))
+        self.total_item_price = _parse_price(json_data.get("total_item_price"))
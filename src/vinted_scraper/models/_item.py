@@ -2,11 +2,11 @@
 """Vinted item model."""
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ._brand import VintedBrand
 from ._image import VintedImage
-from ._json_model import VintedJsonModel
+from ._json_model import LazyModel, VintedJsonModel
 from ._user import VintedUser
 
 
@@ -26,6 +26,56 @@ def _parse_price(value) -> Optional[float]:
     return None
 
 
+def _photos_data(json_data: Dict) -> Optional[List[Dict]]:
+    """Return the JSON data of the photos of an item.
+
+    Args:
+        json_data: Item JSON data, with either a ``photos`` list or, in the
+            search results, a single ``photo``.
+
+    Returns:
+        The list of photo JSON data, or None if the item has no photo.
+    """
+    if json_data.get("photos"):
+        return json_data["photos"]
+    if json_data.get("photo"):
+        return [json_data["photo"]]
+    return None
+
+
+def _brand_data(json_data: Dict) -> Optional[Dict]:
+    """Return the JSON data of the brand of an item.
+
+    Args:
+        json_data: Item JSON data, with either a ``brand_dto`` or, in the
+            search results, only a ``brand_title``.
+
+    Returns:
+        The brand JSON data, or None if the item has no brand.
+    """
+    if json_data.get("brand_dto"):
+        return json_data["brand_dto"]
+    if json_data.get("brand_title"):
+        return {"title": json_data["brand_title"]}
+    return None
+
+
+def _build_photos(json_data: Dict) -> Optional[List[VintedImage]]:
+    """Build the photos of an item, see ``_photos_data``."""
+    photos = _photos_data(json_data)
+    if photos:
+        return [VintedImage(json_data=photo) for photo in photos]
+    return json_data.get("photos")
+
+
+def _build_brand(json_data: Dict) -> Optional[VintedBrand]:
+    """Build the brand of an item, see ``_brand_data``."""
+    brand = _brand_data(json_data)
+    if brand:
+        return VintedBrand(json_data=brand)
+    return json_data.get("brand")
+
+
 @dataclass
 class VintedItem(VintedJsonModel):
     """Represents a Vinted marketplace item with all its attributes.
@@ -47,7 +97,7 @@ class VintedItem(VintedJsonModel):
     is_processing: Optional[bool] = None
     item_closing_action: Optional[str] = None
     currency: Optional[str] = None
-    photos: Optional[List[VintedImage]] = None
+    photos: Optional[List[VintedImage]] = LazyModel(build=_build_photos)
     price: Optional[float] = None
     transaction_permitted: Optional[bool] = None
     reservation: Optional[str] = None
@@ -58,7 +108,7 @@ class VintedItem(VintedJsonModel):
     favourite_count: Optional[int] = None
     is_favourite: Optional[bool] = None
     view_count: Optional[int] = None
-    user: Optional[VintedUser] = None
+    user: Optional[VintedUser] = LazyModel(VintedUser)
     can_edit: Optional[bool] = None
     can_delete: Optional[bool] = None
     can_reserve: Optional[bool] = None
@@ -66,7 +116,7 @@ class VintedItem(VintedJsonModel):
     can_buy: Optional[bool] = None
     can_bundle: Optional[bool] = None
     promoted: Optional[bool] = None
-    brand: Optional[VintedBrand] = None
+    brand: Optional[VintedBrand] = LazyModel(build=_build_brand)
     path: Optional[str] = None
     url: Optional[str] = None
     color1: Optional[str] = None
@@ -89,22 +139,6 @@ class VintedItem(VintedJsonModel):
     def __post_init__(self) -> None:
         super().__post_init__()
         if self.json_data is not None:
-            if "user" in self.json_data and self.json_data["user"]:
-                self.user = VintedUser(json_data=self.json_data["user"])
-
-            if "photo" in self.json_data and self.json_data["photo"]:
-                self.photos = [VintedImage(json_data=self.json_data["photo"])]
-            if "photos" in self.json_data and self.json_data["photos"]:
-                self.photos = [
-                    VintedImage(json_data=i) for i in self.json_data["photos"]
-                ]
-
-            if "brand_dto" in self.json_data and self.json_data["brand_dto"]:
-                self.brand = VintedBrand(json_data=self.json_data["brand_dto"])
-            elif "brand_title" in self.json_data and self.json_data["brand_title"]:
-                self.brand = VintedBrand()
-                self.brand.title = self.json_data["brand_title"]
-
             if isinstance(self.json_data.get("price"), dict):
                 self.price = float(self.json_data["price"]["amount"])
                 self.currency = self.json_data["price"]["currency_code"]
@@ -1,10 +1,61 @@
 """Base JSON model for Vinted data structures.
 
-This module defines the VintedJsonModel base class used by all Vinted models.
+This module defines the VintedJsonModel base class used by all Vinted models,
+and the LazyModel descriptor of their nested models.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
+
+
+class LazyModel:
+    """Data descriptor of a nested model built from the JSON data on first access.
+
+    Used as the default of a model field, e.g.
+    ``user: Optional[VintedUser] = LazyModel(VintedUser)``. The model is built
+    when the attribute is first read, then cached in the instance ``__dict__``.
+    Assigning the attribute replaces it as for any other field.
+
+    Attributes:
+        model: Model built from the JSON data of the field, or from each
+            element if it is a list. Falsy JSON data is returned as is.
+        build: Function building the value from the whole JSON data of the
+            instance, instead of ``model``.
+    """
+
+    def __init__(
+        self,
+        model: Optional[type] = None,
+        build: Optional[Callable[[Dict], Any]] = None,
+    ) -> None:
+        self.model = model
+        self.build = build
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        owner._lazy_fields = getattr(owner, "_lazy_fields", ()) + (name,)
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return None  # The dataclass field default
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            pass
+        if self.build is not None:
+            value = self.build(instance.json_data)
+        else:
+            value = instance.json_data.get(self.name)
+            if isinstance(value, list):
+                value = [self.model(json_data=data) for data in value]
+            elif value:
+                value = self.model(json_data=value)
+        instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = value
 
 
 @dataclass
@@ -19,17 +70,29 @@ class VintedJsonModel:
     """
 
     json_data: Optional[Dict] = field(default=None, repr=False, compare=False)
+    _lazy_fields: ClassVar[Tuple[str, ...]] = ()
 
     def __post_init__(self) -> None:
         """Populate model attributes from json_data after initialization.
 
+        The ``LazyModel`` fields are left to be built on first access, unless
+        they were passed explicitly.
+
         Warning:
             All keys from json_data are injected into the instance via
             ``__dict__.update``. This means unknown API fields become
             attributes and may shadow declared dataclass fields.
         """
         if self.json_data is not None:
+            explicit = {
+                name: self.__dict__[name]
+                for name in self._lazy_fields
+                if self.__dict__.get(name) is not None
+            }
             self.__dict__.update(self.json_data)
+            for name in self._lazy_fields:
+                self.__dict__.pop(name, None)
+            self.__dict__.update(explicit)
 
     def __getitem__(self, key: str) -> Any:
         """Allow dictionary-style subscript access to json_data.
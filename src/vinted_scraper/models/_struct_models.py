@@ -0,0 +1,261 @@
+# pylint: disable=too-few-public-methods
+"""Vinted models as msgspec Structs, decoded in a single pass.
+
+The JSON body of the search and item endpoints is validated and decoded by
+msgspec straight into these classes, without building the intermediate dicts
+the ``VintedJsonModel`` classes are populated from. They expose the same
+public attributes as their dataclass counterparts, with two differences:
+there is no ``json_data``, and the keys that are not declared are dropped
+instead of becoming attributes.
+
+Scalars are typed ``Any``, as the API returns the same field as a string or
+a number depending on the endpoint (e.g. the ids).
+
+Requires msgspec: ``pip install vinted_scraper[msgspec]``.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+from ..utils import API_CATALOG_ITEMS, API_ITEMS, JsonDecoder, get_endpoint_family
+from ._item import _parse_price
+
+
+class VintedStruct(msgspec.Struct, kw_only=True):
+    """Base class of the Struct models, with subscript access."""
+
+    def __getitem__(self, key: str) -> Any:
+        """Allow dictionary-style subscript access to the fields.
+
+        Args:
+            key: The name of the field.
+
+        Returns:
+            The value of the field.
+
+        Raises:
+            KeyError: If the field doesn't exist.
+        """
+        if key not in self.__struct_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+class VintedMediaStruct(VintedStruct):
+    """Struct counterpart of ``VintedMedia``."""
+
+    type: Any = None
+    url: Any = None
+    width: Any = None
+    height: Any = None
+    original_size: Any = None
+
+
+class VintedHighResolutionStruct(VintedStruct):
+    """Struct counterpart of ``VintedHighResolution``."""
+
+    id: Any = None
+    timestamp: Any = None
+    orientation: Any = None
+
+
+class VintedImageStruct(VintedStruct):
+    """Struct counterpart of ``VintedImage``."""
+
+    id: Any = None
+    image_no: Any = None
+    width: Any = None
+    height: Any = None
+    temp_uuid: Any = None
+    url: Any = None
+    dominant_color: Any = None
+    dominant_color_opaque: Any = None
+    thumbnails: Optional[List[VintedMediaStruct]] = None
+    is_main: Any = None
+    is_suspicious: Any = None
+    orientation: Any = None
+    high_resolution: Optional[VintedHighResolutionStruct] = None
+    full_size_url: Any = None
+    is_hidden: Any = None
+    extra: Any = None
+
+
+class VintedBrandStruct(VintedStruct):
+    """Struct counterpart of ``VintedBrand``."""
+
+    id: Any = None
+    title: Any = None
+    slug: Any = None
+    path: Any = None
+    is_favourite: Any = None
+
+
+class VintedDiscountStruct(VintedStruct):
+    """Struct counterpart of ``VintedDiscount``."""
+
+    minimal_item_count: Any = 0
+    fraction: Any = 0.0
+
+    def __post_init__(self) -> None:
+        self.minimal_item_count = int(self.minimal_item_count)
+        self.fraction = float(self.fraction)
+
+
+class VintedBundleDiscountStruct(VintedStruct):
+    """Struct counterpart of ``VintedBundleDiscount``."""
+
+    id: Any = None
+    user_id: Any = None
+    enabled: Any = None
+    minimal_item_count: Any = None
+    fraction: Any = None
+    discounts: Optional[List[VintedDiscountStruct]] = None
+
+
+class VintedUserStruct(VintedStruct):
+    """Struct counterpart of ``VintedUser``."""
+
+    id: Any = None
+    login: Any = None
+    business: Any = None
+    profile_url: Any = None
+    photo: Optional[VintedImageStruct] = None
+    item_count: Any = None
+    feedback_count: Any = None
+    feedback_reputation: Any = None
+    moderator: Any = None
+    can_bundle: Any = None
+    bundle_discount: Optional[VintedBundleDiscountStruct] = None
+    country_id: Any = None
+    country_title_local: Any = None
+    last_loged_on_ts: Any = None
+    last_logged_on_ts: Any = None
+    is_on_holiday: Any = None
+    expose_location: Any = None
+    city: Any = None
+    locale: Any = None
+    followers_count: Any = None
+    following_count: Any = None
+    is_banned: Any = None
+    is_favourite: Any = None
+    seller_badges: Optional[List[Dict[str, Any]]] = None
+    hates_you: Any = None
+    is_hated: Any = None
+    can_view_profile: Any = None
+
+
+class VintedItemStruct(VintedStruct):
+    """Struct counterpart of ``VintedItem``.
+
+    As in ``VintedItem``, ``price`` is parsed to a float (and ``currency``
+    read from it), ``photos`` also holds the single ``photo`` of the search
+    results and ``brand`` falls back to ``brand_title``.
+    """
+
+    id: Any = None
+    title: Any = None
+    description: Any = None
+    status_id: Any = None
+    disposal_conditions: Any = None
+    catalog_id: Any = None
+    is_hidden: Any = None
+    is_reserved: Any = None
+    is_closed: Any = None
+    is_draft: Any = None
+    is_processing: Any = None
+    item_closing_action: Any = None
+    currency: Any = None
+    photo: Optional[VintedImageStruct] = None
+    photos: Optional[List[VintedImageStruct]] = None
+    price: Any = None
+    transaction_permitted: Any = None
+    reservation: Any = None
+    offline_verification: Any = None
+    offer_price: Any = None
+    conversion: Any = None
+    is_cross_currency_payment: Any = None
+    favourite_count: Any = None
+    is_favourite: Any = None
+    view_count: Any = None
+    user: Optional[VintedUserStruct] = None
+    can_edit: Any = None
+    can_delete: Any = None
+    can_reserve: Any = None
+    instant_buy: Any = None
+    can_buy: Any = None
+    can_bundle: Any = None
+    promoted: Any = None
+    brand_dto: Optional[VintedBrandStruct] = None
+    path: Any = None
+    url: Any = None
+    color1: Any = None
+    status: Any = None
+    localization: Any = None
+    item_alert: Any = None
+    service_fee: Any = None
+    offline_verification_fee: Any = None
+    total_item_price: Any = None
+    can_push_up: Any = None
+    stats_visible: Any = None
+    is_visible: Any = None
+    brand_title: Any = None
+    size_title: Any = None
+    content_source: Any = None
+    badge: Any = None
+    item_box: Any = None
+    search_tracking_params: Any = None
+
+    def __post_init__(self) -> None:
+        if self.photo and not self.photos:
+            self.photos = [self.photo]
+        if isinstance(self.price, dict):
+            self.currency = self.price["currency_code"]
+        if isinstance(self.price, (dict, str)):
+            self.price = _parse_price(self.price)
+        self.service_fee = _parse_price(self.service_fee)
+        self.total_item_price = _parse_price(self.total_item_price)
+
+    @property
+    def brand(self) -> Optional[VintedBrandStruct]:
+        """The brand of the item, from ``brand_dto`` or ``brand_title``."""
+        if self.brand_dto:
+            return self.brand_dto
+        if self.brand_title:
+            return VintedBrandStruct(title=self.brand_title)
+        return None
+
+
+class VintedSearchResponseStruct(VintedStruct):
+    """A page of catalog search results."""
+
+    items: List[VintedItemStruct] = []
+    pagination: Optional[Dict[str, Any]] = None
+
+
+class VintedItemResponseStruct(VintedStruct):
+    """The details of an item."""
+
+    item: Optional[VintedItemStruct] = None
+
+
+_DECODERS = {
+    API_CATALOG_ITEMS: msgspec.json.Decoder(VintedSearchResponseStruct),
+    f"{API_ITEMS}/{{id}}/details": msgspec.json.Decoder(VintedItemResponseStruct),
+}
+
+
+def get_struct_decoder(endpoint: str) -> Optional[JsonDecoder]:
+    """Return the decoder of an endpoint into Struct models, if there is one.
+
+    Decoding errors are raised as ``msgspec.DecodeError``, a ``ValueError``.
+
+    Args:
+        endpoint: Endpoint path.
+
+    Returns:
+        The ``decode`` function of the search or item details endpoints, or
+        None for the endpoints without Struct models.
+    """
+    decoder = _DECODERS.get(get_endpoint_family(endpoint))
+    return None if decoder is None else decoder.decode
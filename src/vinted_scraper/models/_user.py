@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 
 from ._bundle_discount import VintedBundleDiscount
 from ._image import VintedImage
-from ._json_model import VintedJsonModel
+from ._json_model import LazyModel, VintedJsonModel
 
 
 @dataclass
@@ -21,13 +21,13 @@ class VintedUser(VintedJsonModel):
     login: Optional[str] = None
     business: Optional[bool] = None
     profile_url: Optional[str] = None
-    photo: Optional[VintedImage] = None
+    photo: Optional[VintedImage] = LazyModel(VintedImage)
     item_count: Optional[int] = None
     feedback_count: Optional[int] = None
     feedback_reputation: Optional[float] = None
     moderator: Optional[bool] = None
     can_bundle: Optional[bool] = None
-    bundle_discount: Optional[VintedBundleDiscount] = None
+    bundle_discount: Optional[VintedBundleDiscount] = LazyModel(VintedBundleDiscount)
     country_id: Optional[int] = None
     country_title_local: Optional[str] = None
     last_loged_on_ts: Optional[str] = None
@@ -44,16 +44,3 @@ class VintedUser(VintedJsonModel):
     hates_you: Optional[bool] = None
     is_hated: Optional[bool] = None
     can_view_profile: Optional[bool] = None
-
-    def __post_init__(self) -> None:
-        super().__post_init__()
-        if self.json_data is not None:
-            if "photo" in self.json_data and self.json_data["photo"]:
-                self.photo = VintedImage(json_data=self.json_data["photo"])
-            if (
-                "bundle_discount" in self.json_data
-                and self.json_data["bundle_discount"]
-            ):
-                self.bundle_discount = VintedBundleDiscount(
-                    json_data=self.json_data["bundle_discount"]
-                )
@@ -0,0 +1,220 @@
+# pylint: disable=too-few-public-methods
+"""Read-only Vinted models viewing their JSON data in place.
+
+Building a view only stores a reference to its JSON data, whatever its size:
+nothing is copied. The attributes are read from the JSON data on access, the
+nested models and the parsed prices being built on first access and cached.
+"""
+
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Optional, Tuple
+
+from ._brand import VintedBrand
+from ._bundle_discount import VintedBundleDiscount
+from ._compact import _field_names
+from ._discount import VintedDiscount
+from ._high_resolution import VintedHighResolution
+from ._image import VintedImage
+from ._item import VintedItem, _brand_data, _parse_price, _photos_data
+from ._media import VintedMedia
+from ._user import VintedUser
+
+
+class VintedView:
+    """Base class of the view models.
+
+    Subclasses declare the names of their fields in ``_fields``, the view
+    class of their nested models in ``_nested`` and the functions computing
+    their derived fields from the JSON data in ``_derived``.
+
+    Attributes:
+        json_data: Raw JSON dictionary from API response.
+    """
+
+    __slots__ = ("json_data", "_cache")
+    _fields: ClassVar[FrozenSet[str]] = frozenset()
+    _nested: ClassVar[Dict[str, type]] = {}
+    _derived: ClassVar[Dict[str, Callable[[Dict], Any]]] = {}
+
+    def __init__(self, json_data: Dict) -> None:
+        """Wrap json_data, without copying it.
+
+        Args:
+            json_data: Raw JSON dictionary from API response.
+        """
+        object.__setattr__(self, "json_data", json_data)
+        object.__setattr__(self, "_cache", None)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return a field or an undeclared key of the JSON data.
+
+        Declared fields missing from the JSON data are None.
+
+        Raises:
+            AttributeError: If the key is neither declared nor in the JSON data.
+        """
+        if name.startswith("_") or name == "json_data":
+            raise AttributeError(name)
+        cache = self._cache
+        if cache is not None and name in cache:
+            return cache[name]
+        if name in self._derived:
+            value = self._derived[name](self.json_data)
+        elif name in self._nested:
+            value = self._build(self._nested[name], self.json_data.get(name))
+        elif name in self.json_data:
+            return self.json_data[name]
+        elif name in self._fields:
+            return None
+        else:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_cache", cache)
+        cache[name] = value
+        return value
+
+    @staticmethod
+    def _build(view: type, value: Any) -> Any:
+        """Wrap nested JSON data into a view, or a list of views."""
+        if isinstance(value, list):
+            return [view(data) for data in value]
+        return view(value) if value else value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__!r} object is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        """Allow dictionary-style subscript access to json_data.
+
+        Args:
+            key: The key to access in json_data.
+
+        Returns:
+            The value associated with the key.
+
+        Raises:
+            KeyError: If the key doesn't exist.
+        """
+        return self.json_data[key]
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.json_data == other.json_data  # type: ignore
+
+    __hash__ = None  # type: ignore
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict]]:
+        return type(self), (self.json_data,)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(json_data={self.json_data!r})"
+
+
+def _price(json_data: Dict) -> Any:
+    """Return the price of an item as a float, see ``_parse_price``."""
+    price = json_data.get("price")
+    return _parse_price(price) if isinstance(price, (dict, str)) else price
+
+
+def _currency(json_data: Dict) -> Optional[str]:
+    """Return the currency of an item, from its price if available."""
+    price = json_data.get("price")
+    if isinstance(price, dict):
+        return price["currency_code"]
+    return json_data.get("currency")
+
+
+class VintedMediaView(VintedView):
+    """View counterpart of ``VintedMedia``."""
+
+    __slots__ = ()
+    _fields = frozenset(_field_names(VintedMedia))
+
+
+class VintedHighResolutionView(VintedView):
+    """View counterpart of ``VintedHighResolution``."""
+
+    __slots__ = ()
+    _fields = frozenset(_field_names(VintedHighResolution))
+
+
+class VintedImageView(VintedView):
+    """View counterpart of ``VintedImage``."""
+
+    __slots__ = ()
+    _fields = frozenset(_field_names(VintedImage))
+    _nested = {
+        "high_resolution": VintedHighResolutionView,
+        "thumbnails": VintedMediaView,
+    }
+
+
+class VintedBrandView(VintedView):
+    """View counterpart of ``VintedBrand``."""
+
+    __slots__ = ()
+    _fields = frozenset(_field_names(VintedBrand))
+
+
+class VintedDiscountView(VintedView):
+    """View counterpart of ``VintedDiscount``."""
+
+    __slots__ = ()
+    _fields = frozenset(_field_names(VintedDiscount))
+    _derived = {
+        "minimal_item_count": lambda data: int(data.get("minimal_item_count", 0)),
+        "fraction": lambda data: float(data.get("fraction", 0.0)),
+    }
+
+
+class VintedBundleDiscountView(VintedView):
+    """View counterpart of ``VintedBundleDiscount``."""
+
+    __slots__ = ()
+    _fields = frozenset(_field_names(VintedBundleDiscount))
+    _nested = {"discounts": VintedDiscountView}
+
+
+class VintedUserView(VintedView):
+    """View counterpart of ``VintedUser``."""
+
+    __slots__ = ()
+    _fields = frozenset(_field_names(VintedUser))
+    _nested = {"photo": VintedImageView, "bundle_discount": VintedBundleDiscountView}
+
+
+def _photos(json_data: Dict) -> Any:
+    """Return the photos of an item as views, see ``_photos_data``."""
+    photos = _photos_data(json_data)
+    if photos:
+        return [VintedImageView(photo) for photo in photos]
+    return json_data.get("photos")
+
+
+def _brand(json_data: Dict) -> Any:
+    """Return the brand of an item as a view, see ``_brand_data``."""
+    brand = _brand_data(json_data)
+    return VintedBrandView(brand) if brand else json_data.get("brand")
+
+
+class VintedItemView(VintedView):
+    """View counterpart of ``VintedItem``.
+
+    Example:
+        ``items = [VintedItemView(item) for item in page["items"]]``
+    """
+
+    __slots__ = ()
+    _fields = frozenset(_field_names(VintedItem))
+    _nested = {"user": VintedUserView}
+    _derived = {
+        "price": _price,
+        "currency": _currency,
+        "photos": _photos,
+        "brand": _brand,
+        "service_fee": lambda data: _parse_price(data.get("service_fee")),
+        "total_item_price": lambda data: _parse_price(data.get("total_item_price")),
+    }
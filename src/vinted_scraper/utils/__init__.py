@@ -3,61 +3,187 @@
 This module provides common utilities used throughout the package.
 """
 
+from ._circuit_breaker import CircuitBreaker, CircuitOpenError
 from ._constants import (
     API_CATALOG_ITEMS,
     API_ITEMS,
+    ASYNC_KEEPALIVE_EXPIRY,
+    ASYNC_MAX_CONNECTIONS,
+    ASYNC_MAX_KEEPALIVE,
+    CIRCUIT_FAILURE_RATE,
+    CIRCUIT_FAILURE_STATUSES,
+    CIRCUIT_MIN_REQUESTS,
+    CIRCUIT_RESET_TIMEOUT,
+    CIRCUIT_WINDOW,
+    COOKIE_RENEWAL_MARGIN,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_COOKIE_TTL,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
     DEFAULT_RETRIES,
     DEFAULT_TIMEOUT,
     HTTP_OK,
     HTTP_UNAUTHORIZED,
+    IDENTITY_FAILURE_STATUSES,
+    PROXY_FAILURE_STATUSES,
+    PROXY_QUARANTINE_FAILURES,
+    PROXY_QUARANTINE_TIME,
     RETRY_BASE_SLEEP,
+    RETRY_MAX_DELAY,
+    RETRY_MAX_ELAPSED,
+    RETRY_STATUSES,
     SESSION_COOKIE_NAME,
 )
-from ._httpx import extract_cookie_from_response, get_httpx_config
+from ._cookie_store import (
+    CookieRecord,
+    CookieStore,
+    FileCookieStore,
+    SQLiteCookieStore,
+)
+from ._errors import VintedApiError, is_service_failure
+from ._httpx import (
+    ASYNC_CLIENT_OPTIONS,
+    ClientOptions,
+    borrow_transport,
+    extract_cookie_from_response,
+    get_httpx_config,
+)
+from ._json import JSON_BACKENDS, JsonDecoder, get_json_decoder
 from ._log import (
+    log_circuit_state,
     log_constructor,
     log_cookie_fetch_failed,
     log_cookie_fetched,
+    log_cookie_renewal,
     log_cookie_retry,
     log_curl_request,
     log_curl_response,
     log_interaction,
     log_item,
+    log_proxy_quarantined,
     log_refresh_cookie,
+    log_retry,
     log_search,
     log_sleep,
 )
 from ._misc import (
+    get_cookie_expiry,
+    get_cookie_header_template,
     get_cookie_headers,
+    get_cookie_string,
+    get_curl_header_template,
     get_curl_headers,
+    get_endpoint_family,
     get_random_user_agent,
+    get_token_expiry,
     url_validator,
 )
+from ._proxy_pool import (
+    AsyncProxyRotatingTransport,
+    ProxyPool,
+    ProxyRotatingTransport,
+    ProxyStats,
+)
+from ._rate_limiter import RateLimiter, TokenBucket
+from ._response_cache import (
+    CachedResponse,
+    ResponseCache,
+    SQLiteResponseCache,
+    get_cache_key,
+)
+from ._retry import RetryPolicy, RetryState, get_retry_after
 
 __all__ = [
     "SESSION_COOKIE_NAME",
     "DEFAULT_TIMEOUT",
+    "DEFAULT_CONCURRENCY",
+    "DEFAULT_MAX_CONNECTIONS",
+    "DEFAULT_MAX_KEEPALIVE",
+    "DEFAULT_KEEPALIVE_EXPIRY",
+    "ASYNC_MAX_CONNECTIONS",
+    "ASYNC_MAX_KEEPALIVE",
+    "ASYNC_KEEPALIVE_EXPIRY",
+    "COOKIE_RENEWAL_MARGIN",
+    "DEFAULT_COOKIE_TTL",
+    "DEFAULT_CACHE_TTL",
+    "DEFAULT_CACHE_SIZE",
+    "DEFAULT_RATE_LIMIT",
+    "DEFAULT_RATE_BURST",
     "DEFAULT_RETRIES",
     "RETRY_BASE_SLEEP",
+    "RETRY_MAX_DELAY",
+    "RETRY_MAX_ELAPSED",
+    "RETRY_STATUSES",
     "HTTP_OK",
     "HTTP_UNAUTHORIZED",
+    "IDENTITY_FAILURE_STATUSES",
+    "PROXY_FAILURE_STATUSES",
+    "PROXY_QUARANTINE_FAILURES",
+    "PROXY_QUARANTINE_TIME",
     "API_CATALOG_ITEMS",
     "API_ITEMS",
+    "CIRCUIT_FAILURE_RATE",
+    "CIRCUIT_FAILURE_STATUSES",
+    "CIRCUIT_WINDOW",
+    "CIRCUIT_MIN_REQUESTS",
+    "CIRCUIT_RESET_TIMEOUT",
+    "ASYNC_CLIENT_OPTIONS",
+    "CircuitBreaker",
+    "ClientOptions",
+    "CircuitOpenError",
+    "VintedApiError",
+    "CookieRecord",
+    "CookieStore",
+    "FileCookieStore",
+    "JSON_BACKENDS",
+    "JsonDecoder",
+    "SQLiteCookieStore",
+    "AsyncProxyRotatingTransport",
+    "ProxyPool",
+    "ProxyRotatingTransport",
+    "ProxyStats",
+    "RateLimiter",
+    "TokenBucket",
+    "CachedResponse",
+    "ResponseCache",
+    "SQLiteResponseCache",
+    "RetryPolicy",
+    "RetryState",
+    "borrow_transport",
     "extract_cookie_from_response",
     "get_httpx_config",
+    "get_json_decoder",
+    "is_service_failure",
+    "log_circuit_state",
     "log_constructor",
     "log_cookie_fetch_failed",
     "log_cookie_fetched",
+    "log_cookie_renewal",
     "log_cookie_retry",
     "log_curl_request",
     "log_curl_response",
     "log_interaction",
     "log_item",
+    "log_proxy_quarantined",
     "log_refresh_cookie",
+    "log_retry",
     "log_search",
     "log_sleep",
+    "get_cache_key",
+    "get_cookie_expiry",
+    "get_cookie_header_template",
     "get_cookie_headers",
+    "get_cookie_string",
+    "get_curl_header_template",
     "get_curl_headers",
+    "get_endpoint_family",
     "get_random_user_agent",
+    "get_retry_after",
+    "get_token_expiry",
     "url_validator",
 ]
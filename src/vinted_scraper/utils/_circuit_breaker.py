@@ -0,0 +1,194 @@
+"""Circuit breaker per endpoint family.
+
+A circuit opens when the error rate of the recent calls to an endpoint family
+exceeds a threshold. While open, calls fail fast with ``CircuitOpenError``
+instead of reaching the API. After ``reset_timeout`` seconds the circuit is
+half-open: a few probe calls go through, and close the circuit if they all
+succeed or open it again on the first failure.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict
+
+from ._constants import (
+    CIRCUIT_FAILURE_RATE,
+    CIRCUIT_MIN_REQUESTS,
+    CIRCUIT_RESET_TIMEOUT,
+    CIRCUIT_WINDOW,
+)
+from ._log import log_circuit_state
+from ._misc import get_endpoint_family
+
+_log = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit is open.
+
+    Attributes:
+        endpoint: The endpoint family of the open circuit.
+        retry_after: Seconds before the circuit lets probe calls through.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        super().__init__(
+            f"Circuit open for endpoint {endpoint}, retry in {retry_after:.0f} seconds"
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+@dataclass
+class _Circuit:
+    """State of the circuit of an endpoint family."""
+
+    window: int
+    state: str = CLOSED
+    outcomes: Deque[bool] = field(init=False)
+    opened_at: float = 0.0
+    probes: int = 0
+    successes: int = 0
+
+    def __post_init__(self) -> None:
+        self.outcomes = deque(maxlen=self.window)
+
+
+class CircuitBreaker:
+    """Circuit breakers keyed by endpoint family, e.g. ``/api/v2/items/{id}/details``.
+
+    The breaker is thread-safe and can be shared by several wrappers.
+
+    Attributes:
+        failure_rate: Failed share of the last calls that opens the circuit.
+        window: Number of last calls the failure rate is computed on.
+        min_requests: Calls needed in the window before the circuit can open.
+        reset_timeout: Seconds an open circuit waits before half-opening.
+        half_open_probes: Successful probe calls needed to close the circuit.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = CIRCUIT_FAILURE_RATE,
+        window: int = CIRCUIT_WINDOW,
+        min_requests: int = CIRCUIT_MIN_REQUESTS,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+        half_open_probes: int = 1,
+    ) -> None:
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if min(window, min_requests, half_open_probes) < 1 or min_requests > window:
+            raise ValueError("Invalid circuit breaker window or probe count")
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_requests = min_requests
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def states(self) -> Dict[str, str]:
+        """State of the circuit of every endpoint family called so far."""
+        with self._lock:
+            return {family: self._state(c) for family, c in self._circuits.items()}
+
+    def state(self, endpoint: str) -> str:
+        """Return the state of the circuit of an endpoint.
+
+        Args:
+            endpoint: Endpoint path.
+
+        Returns:
+            ``"closed"``, ``"open"`` or ``"half_open"``.
+        """
+        with self._lock:
+            circuit = self._circuits.get(get_endpoint_family(endpoint))
+            return CLOSED if circuit is None else self._state(circuit)
+
+    def _state(self, circuit: _Circuit) -> str:
+        """Return the state of a circuit, an expired open one being half-open."""
+        if circuit.state == OPEN:
+            if time.monotonic() - circuit.opened_at >= self.reset_timeout:
+                return HALF_OPEN
+        return circuit.state
+
+    def _set_state(self, family: str, circuit: _Circuit, state: str) -> None:
+        """Move a circuit to a new state."""
+        circuit.state = state
+        circuit.probes = circuit.successes = 0
+        circuit.outcomes.clear()
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+        log_circuit_state(_log, family, state)
+
+    def acquire(self, endpoint: str) -> None:
+        """Let a call to an endpoint through, or fail fast.
+
+        Args:
+            endpoint: Endpoint path.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                its probe calls already in flight.
+        """
+        family = get_endpoint_family(endpoint)
+        with self._lock:
+            circuit = self._circuits.setdefault(family, _Circuit(self.window))
+            state = self._state(circuit)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and circuit.state == OPEN:
+                self._set_state(family, circuit, HALF_OPEN)
+            if state == OPEN or circuit.probes >= self.half_open_probes:
+                retry_after = circuit.opened_at + self.reset_timeout - time.monotonic()
+                raise CircuitOpenError(family, max(0.0, retry_after))
+            circuit.probes += 1
+
+    def record(self, endpoint: str, failed: bool) -> None:
+        """Record the outcome of a call let through by ``acquire``.
+
+        Args:
+            endpoint: Endpoint path.
+            failed: Whether the call failed.
+        """
+        family = get_endpoint_family(endpoint)
+        with self._lock:
+            circuit = self._circuits.setdefault(family, _Circuit(self.window))
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if failed:
+                    self._set_state(family, circuit, OPEN)
+                    return
+                circuit.successes += 1
+                if circuit.successes >= self.half_open_probes:
+                    self._set_state(family, circuit, CLOSED)
+                return
+            if circuit.state == OPEN:
+                return
+            circuit.outcomes.append(failed)
+            total = len(circuit.outcomes)
+            if (
+                total >= self.min_requests
+                and sum(circuit.outcomes) / total >= self.failure_rate
+            ):
+                self._set_state(family, circuit, OPEN)
+
+    def release(self, endpoint: str) -> None:
+        """Forget a call interrupted before completion, e.g. cancelled.
+
+        Args:
+            endpoint: Endpoint path.
+        """
+        family = get_endpoint_family(endpoint)
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is not None and circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
@@ -8,6 +8,53 @@ SESSION_COOKIE_NAME: Final = "access_token_web"
 DEFAULT_TIMEOUT: Final = 10.0
 DEFAULT_RETRIES: Final = 3
 RETRY_BASE_SLEEP: Final = 2
+# Maximum delay of a single retry and total time spent retrying a request
+RETRY_MAX_DELAY: Final = 30.0
+RETRY_MAX_ELAPSED: Final = 60.0
+# Throttled, failed or unavailable responses retried by default
+RETRY_STATUSES: Final = frozenset({429, 500, 502, 503, 504})
+DEFAULT_CONCURRENCY: Final = 8
+# Connection pool of the sync clients: connections, idle ones kept alive and
+# seconds an idle connection is kept
+DEFAULT_MAX_CONNECTIONS: Final = 100
+DEFAULT_MAX_KEEPALIVE: Final = 20
+DEFAULT_KEEPALIVE_EXPIRY: Final = 5.0
+# Larger pool of the async clients, sized for hundreds of concurrent requests
+ASYNC_MAX_CONNECTIONS: Final = 200
+ASYNC_MAX_KEEPALIVE: Final = 100
+ASYNC_KEEPALIVE_EXPIRY: Final = 30.0
+# Requests per second and burst size of each endpoint family when rate limited
+DEFAULT_RATE_LIMIT: Final = 2.0
+DEFAULT_RATE_BURST: Final = 5
+
+# Seconds before the session cookie expiry at which it is renewed
+COOKIE_RENEWAL_MARGIN: Final = 60.0
+# Lifetime of stored session cookies that don't encode their expiry
+DEFAULT_COOKIE_TTL: Final = 3600.0
+
+# Consecutive failures after which a proxy is quarantined
+PROXY_QUARANTINE_FAILURES: Final = 3
+# Seconds a proxy stays in quarantine before being probed again
+PROXY_QUARANTINE_TIME: Final = 60.0
+# Response statuses blamed on the proxy (banned or throttled exit IP)
+PROXY_FAILURE_STATUSES: Final = frozenset({403, 429})
+# Response statuses blamed on a session pool identity: a session cookie still
+# rejected after renewal, or a banned or throttled session
+IDENTITY_FAILURE_STATUSES: Final = frozenset({401, 403, 429})
+
+# Circuit breaker: failed share of the last CIRCUIT_WINDOW calls (at least
+# CIRCUIT_MIN_REQUESTS) opening a circuit, and seconds before it half-opens
+CIRCUIT_FAILURE_RATE: Final = 0.5
+# Client error statuses blamed on the endpoint (with 5xx and transport errors)
+# rather than on the request, e.g. not the 404 of a deleted item
+CIRCUIT_FAILURE_STATUSES: Final = frozenset({403, 429})
+CIRCUIT_WINDOW: Final = 20
+CIRCUIT_MIN_REQUESTS: Final = 5
+CIRCUIT_RESET_TIMEOUT: Final = 30.0
+
+# Response cache: default entry lifetime in seconds and size bound in bytes
+DEFAULT_CACHE_TTL: Final = 60.0
+DEFAULT_CACHE_SIZE: Final = 32 * 1024 * 1024
 
 # HTTP Status Codes
 HTTP_OK: Final = 200
@@ -0,0 +1,245 @@
+"""Persistent session cookie stores shared across processes and restarts.
+
+A store keeps one cookie record per (base URL, user agent) pair, so that short
+lived workers can reuse a valid session instead of fetching a new one.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+from ._constants import COOKIE_RENEWAL_MARGIN, DEFAULT_COOKIE_TTL
+from ._misc import get_cookie_expiry
+from ._sqlite import sqlite_connection
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore
+
+
+@dataclass(frozen=True)
+class CookieRecord:
+    """A session cookie saved in a store.
+
+    Attributes:
+        baseurl: Vinted domain URL the cookie belongs to.
+        user_agent: User agent the cookie was fetched with.
+        cookies: Session cookie dict.
+        expires_at: Expiry as a Unix timestamp.
+    """
+
+    baseurl: str
+    user_agent: str
+    cookies: Dict[str, str]
+    expires_at: float
+
+    def is_valid(self) -> bool:
+        """Check the cookie won't expire within ``COOKIE_RENEWAL_MARGIN`` seconds."""
+        return self.expires_at - COOKIE_RENEWAL_MARGIN > time.time()
+
+
+class CookieStore(ABC):
+    """Base class of the session cookie stores.
+
+    Subclasses implement ``_read`` and ``_write``; expiry handling and lookups
+    are shared.
+
+    Attributes:
+        ttl: Lifetime in seconds of cookies without an expiry in their token.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_COOKIE_TTL) -> None:
+        self.ttl = ttl
+
+    def load(self, baseurl: str, user_agent: Optional[str]) -> Optional[CookieRecord]:
+        """Return a valid cookie for the given base URL and user agent.
+
+        Args:
+            baseurl: Vinted domain URL.
+            user_agent: User agent of the wrapper. If None, the valid cookie
+                expiring last is returned, whatever its user agent.
+
+        Returns:
+            The matching record, or None if there is no valid one.
+        """
+        records = [
+            record
+            for record in self._read(baseurl, user_agent)
+            if record.is_valid()
+            and (user_agent is None or record.user_agent == user_agent)
+        ]
+        return max(records, key=lambda record: record.expires_at, default=None)
+
+    def save(self, baseurl: str, user_agent: str, cookies: Dict[str, str]) -> None:
+        """Save a freshly fetched cookie, replacing the previous one.
+
+        Args:
+            baseurl: Vinted domain URL.
+            user_agent: User agent the cookie was fetched with.
+            cookies: Session cookie dict.
+        """
+        expires_at = get_cookie_expiry(cookies) or time.time() + self.ttl
+        self._write(CookieRecord(baseurl, user_agent, dict(cookies), expires_at))
+
+    @abstractmethod
+    def _read(self, baseurl: str, user_agent: Optional[str]) -> List[CookieRecord]:
+        """Return the records of a base URL, optionally of a user agent only."""
+
+    @abstractmethod
+    def _write(self, record: CookieRecord) -> None:
+        """Insert or replace a record."""
+
+
+class FileCookieStore(CookieStore):
+    """Cookie store backed by a JSON file guarded by an exclusive file lock.
+
+    Attributes:
+        path: Path of the JSON file. A ``.lock`` file is created next to it.
+        ttl: Lifetime in seconds of cookies without an expiry in their token.
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_COOKIE_TTL) -> None:
+        super().__init__(ttl)
+        self.path = path
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the store across threads and processes."""
+        with open(f"{self.path}.lock", "a+b") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:  # pragma: no cover
+                msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+                elif msvcrt is not None:  # pragma: no cover
+                    lock.seek(0)
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _load_file(self) -> Dict[str, Dict]:
+        """Read the whole file, ignoring a missing or corrupted one."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _parse_entry(entry: Any) -> Optional[CookieRecord]:
+        """Build the record of a file entry, or None if the entry is malformed."""
+        if not isinstance(entry, dict):
+            return None
+        try:
+            record = CookieRecord(**entry)
+        except TypeError:
+            return None
+        if (
+            isinstance(record.baseurl, str)
+            and isinstance(record.user_agent, str)
+            and isinstance(record.cookies, dict)
+            and isinstance(record.expires_at, (int, float))
+        ):
+            return record
+        return None
+
+    def _read(self, baseurl: str, user_agent: Optional[str]) -> List[CookieRecord]:
+        with self._lock():
+            data = self._load_file()
+        records = [self._parse_entry(entry) for entry in data.values()]
+        return [
+            record
+            for record in records
+            if record is not None and record.baseurl == baseurl
+        ]
+
+    def _write(self, record: CookieRecord) -> None:
+        with self._lock():
+            now = time.time()
+            data = {}
+            for key, entry in self._load_file().items():
+                stored = self._parse_entry(entry)
+                if stored is not None and stored.expires_at > now:
+                    data[key] = entry
+            data[f"{record.baseurl}\n{record.user_agent}"] = {
+                "baseurl": record.baseurl,
+                "user_agent": record.user_agent,
+                "cookies": record.cookies,
+                "expires_at": record.expires_at,
+            }
+            # Write a sibling file then rename it, so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.path))
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(tmp_path, self.path)
+
+
+class SQLiteCookieStore(CookieStore):
+    """Cookie store backed by a SQLite database.
+
+    Attributes:
+        path: Path of the SQLite database file.
+        ttl: Lifetime in seconds of cookies without an expiry in their token.
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_COOKIE_TTL) -> None:
+        super().__init__(ttl)
+        self.path = path
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cookies ("
+                "baseurl TEXT NOT NULL, user_agent TEXT NOT NULL, "
+                "cookies TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (baseurl, user_agent))"
+            )
+
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        """Open a short-lived connection committing on success."""
+        return sqlite_connection(self.path)
+
+    def _read(self, baseurl: str, user_agent: Optional[str]) -> List[CookieRecord]:
+        query = (
+            "SELECT baseurl, user_agent, cookies, expires_at FROM cookies "
+            "WHERE baseurl = ?"
+        )
+        args = [baseurl]
+        if user_agent is not None:
+            query += " AND user_agent = ?"
+            args.append(user_agent)
+        with self._connect() as connection:
+            rows = connection.execute(query, args).fetchall()
+        return [
+            CookieRecord(row[0], row[1], json.loads(row[2]), row[3]) for row in rows
+        ]
+
+    def _write(self, record: CookieRecord) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM cookies WHERE expires_at <= ?", (time.time(),)
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO cookies VALUES (?, ?, ?, ?)",
+                (
+                    record.baseurl,
+                    record.user_agent,
+                    json.dumps(record.cookies),
+                    record.expires_at,
+                ),
+            )
@@ -0,0 +1,41 @@
+"""Errors raised by the API calls."""
+
+import httpx
+
+from ._constants import CIRCUIT_FAILURE_STATUSES
+
+
+class VintedApiError(RuntimeError):
+    """Raised for an API call answered with an error status.
+
+    Attributes:
+        endpoint: The endpoint that was called.
+        status_code: The HTTP status code received.
+    """
+
+    def __init__(self, endpoint: str, status_code: int) -> None:
+        super().__init__(
+            f"Cannot perform API call to endpoint {endpoint}, error code: {status_code}"
+        )
+        self.endpoint = endpoint
+        self.status_code = status_code
+
+
+def is_service_failure(error: BaseException) -> bool:
+    """Check whether an error is a failure of the service, not of the request.
+
+    Transport errors, 403, 429 and 5xx responses are service failures. Other
+    errors, e.g. the 404 of a deleted item, are not.
+
+    Args:
+        error: The error raised by an API call.
+
+    Returns:
+        True if the error is a service failure.
+    """
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, VintedApiError):
+        status = error.status_code
+        return status in CIRCUIT_FAILURE_STATUSES or status >= 500
+    return False
@@ -1,21 +1,202 @@
+# pylint: disable=too-many-instance-attributes
 """HTTP utilities for httpx client configuration and cookie handling."""
 
-from typing import Dict, List, Optional
+import importlib.util
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
-from ._constants import DEFAULT_TIMEOUT
+from ._constants import (
+    ASYNC_KEEPALIVE_EXPIRY,
+    ASYNC_MAX_CONNECTIONS,
+    ASYNC_MAX_KEEPALIVE,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE,
+    DEFAULT_TIMEOUT,
+)
 
 
-def get_httpx_config(baseurl: str, config: Optional[Dict] = None) -> Dict:
+@dataclass(frozen=True)
+class ClientOptions:
+    """Connection options of the httpx client of a wrapper.
+
+    The pool limits and HTTP/2 apply to the default transport only, not to a
+    custom ``transport`` given in the wrapper config.
+
+    Attributes:
+        http2: Multiplex the requests over HTTP/2 connections. Requires the
+            ``http2`` extra: ``pip install vinted_scraper[http2]``.
+        max_connections: Maximum number of open connections, None for no limit.
+        max_keepalive_connections: Maximum number of idle connections kept
+            alive, None for no limit.
+        keepalive_expiry: Seconds an idle connection is kept alive, None to
+            keep it forever.
+        timeout: Default timeout in seconds of every phase of a request.
+        connect_timeout: Timeout to establish a connection.
+        read_timeout: Timeout to receive a chunk of the response.
+        write_timeout: Timeout to send a chunk of the request.
+        pool_timeout: Timeout to get a connection from the pool.
+    """
+
+    http2: bool = False
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY
+    timeout: Optional[float] = DEFAULT_TIMEOUT
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    write_timeout: Optional[float] = None
+    pool_timeout: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """Validate the options.
+
+        Raises:
+            ValueError: If a limit is not positive, a duration is negative or
+                more keep-alive connections than connections are allowed.
+            ImportError: If HTTP/2 is enabled without the ``h2`` package.
+        """
+        limits = (self.max_connections, self.max_keepalive_connections)
+        if any(limit is not None and limit < 1 for limit in limits):
+            raise ValueError("Connection limits must be positive")
+        if None not in limits and limits[1] > limits[0]:
+            raise ValueError("max_keepalive_connections cannot exceed max_connections")
+        durations = (
+            self.keepalive_expiry,
+            self.timeout,
+            self.connect_timeout,
+            self.read_timeout,
+            self.write_timeout,
+            self.pool_timeout,
+        )
+        if any(duration is not None and duration < 0 for duration in durations):
+            raise ValueError("Timeouts and keepalive_expiry cannot be negative")
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 requires the h2 package: pip install vinted_scraper[http2]"
+            )
+
+    def _phase_timeout(self, value: Optional[float]) -> Optional[float]:
+        """Return the timeout of a phase, defaulting to ``timeout``."""
+        return self.timeout if value is None else value
+
+    def _limits(self) -> httpx.Limits:
+        """Returns the connection pool limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def transport(self, **kwargs: Any) -> httpx.HTTPTransport:
+        """Create a sync transport with these HTTP/2 and pool options.
+
+        The transport can be shared by several wrappers through their
+        ``transport`` attribute. Its owner closes it.
+
+        Args:
+            **kwargs: Any other ``httpx.HTTPTransport`` option, e.g. ``proxy``.
+        """
+        return httpx.HTTPTransport(http2=self.http2, limits=self._limits(), **kwargs)
+
+    def async_transport(self, **kwargs: Any) -> httpx.AsyncHTTPTransport:
+        """Create an async transport with these HTTP/2 and pool options.
+
+        Args:
+            **kwargs: Any other ``httpx.AsyncHTTPTransport`` option.
+        """
+        return httpx.AsyncHTTPTransport(
+            http2=self.http2, limits=self._limits(), **kwargs
+        )
+
+    def to_httpx(self) -> Dict[str, Any]:
+        """Returns the ``httpx.Client`` keyword arguments of these options."""
+        return {
+            "http2": self.http2,
+            "limits": self._limits(),
+            "timeout": httpx.Timeout(
+                self.timeout,
+                connect=self._phase_timeout(self.connect_timeout),
+                read=self._phase_timeout(self.read_timeout),
+                write=self._phase_timeout(self.write_timeout),
+                pool=self._phase_timeout(self.pool_timeout),
+            ),
+        }
+
+
+# Default options of the async clients, with a pool sized for concurrency
+ASYNC_CLIENT_OPTIONS = ClientOptions(
+    max_connections=ASYNC_MAX_CONNECTIONS,
+    max_keepalive_connections=ASYNC_MAX_KEEPALIVE,
+    keepalive_expiry=ASYNC_KEEPALIVE_EXPIRY,
+)
+
+
+class _BorrowedTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport owned elsewhere, left open when its client closes."""
+
+    def __init__(
+        self, transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport]
+    ) -> None:
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    def close(self) -> None:
+        """Leave the transport to its owner."""
+
+    async def aclose(self) -> None:
+        """Leave the transport to its owner."""
+
+
+def borrow_transport(
+    transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport],
+    transport_type: Optional[type] = None,
+) -> Union[httpx.BaseTransport, httpx.AsyncBaseTransport]:
+    """Wrap a shared transport so that closing a client leaves it open.
+
+    Args:
+        transport: The sync or async transport, closed by its owner. An
+            already borrowed transport is unwrapped first.
+        transport_type: ``httpx.BaseTransport`` or ``httpx.AsyncBaseTransport``,
+            the interface the client needs. Not checked if None.
+
+    Returns:
+        A transport forwarding every request to it.
+
+    Raises:
+        TypeError: If the transport doesn't implement ``transport_type``.
+    """
+    while isinstance(transport, _BorrowedTransport):
+        transport = transport.transport
+    if transport_type is not None and not isinstance(transport, transport_type):
+        raise TypeError(
+            f"Expected an {transport_type.__module__}.{transport_type.__name__}, "
+            f"got {type(transport).__name__}"
+        )
+    return _BorrowedTransport(transport)
+
+
+def get_httpx_config(
+    baseurl: str,
+    config: Optional[Dict] = None,
+    options: Optional[ClientOptions] = None,
+) -> Dict:
     """Returns configuration dictionary for httpx.Client.
 
-    Provides default configuration (base_url, timeout, follow_redirects)
-    and merges with custom config if provided.
+    Provides default configuration (base_url, timeout, follow_redirects),
+    overridden by the connection options and then by the custom config.
 
     Args:
         baseurl: The base URL for the httpx client.
         config: Optional custom configuration to merge with defaults.
+        options: Optional connection options (HTTP/2, pool limits, timeouts).
 
     Returns:
         Dictionary containing httpx client configuration.
@@ -25,6 +206,8 @@ def get_httpx_config(baseurl: str, config: Optional[Dict] = None) -> Dict:
         "timeout": httpx.Timeout(DEFAULT_TIMEOUT),
         "follow_redirects": True,
     }
+    if options is not None:
+        default_config.update(options.to_httpx())
 
     return {**default_config, **(config or {})}
 
@@ -0,0 +1,66 @@
+"""JSON decoding of the API responses.
+
+Responses are decoded straight from their raw bytes, without building the
+intermediate ``str``, by the fastest backend installed: orjson, then msgspec,
+then the standard library ``json`` module. Install one with
+``pip install vinted_scraper[speedups]``.
+"""
+
+import importlib.util
+import json
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+JsonDecoder = Callable[[bytes], Any]
+
+# Decoding backends by order of preference
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _orjson_decoder() -> JsonDecoder:
+    """Returns the orjson decoder, whose errors subclass ValueError."""
+    import orjson  # pylint: disable=import-outside-toplevel,import-error
+
+    return orjson.loads
+
+
+def _msgspec_decoder() -> JsonDecoder:
+    """Returns the msgspec decoder, whose errors subclass ValueError."""
+    import msgspec  # pylint: disable=import-outside-toplevel
+
+    return msgspec.json.Decoder().decode
+
+
+_FACTORIES = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": lambda: json.loads,
+}
+
+
+@lru_cache(maxsize=None)
+def get_json_decoder(backend: Optional[str] = None) -> JsonDecoder:
+    """Returns a function decoding JSON bytes, raising ValueError if invalid.
+
+    Args:
+        backend: ``"orjson"``, ``"msgspec"`` or ``"json"``. Defaults to the
+            first one installed.
+
+    Returns:
+        The decoding function.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if backend is None:
+        backend = next(
+            name
+            for name in JSON_BACKENDS
+            if name == "json" or importlib.util.find_spec(name) is not None
+        )
+    if backend not in _FACTORIES:
+        raise ValueError(
+            f"Unknown JSON backend '{backend}', expected one of {JSON_BACKENDS}"
+        )
+    return _FACTORIES[backend]()
@@ -1,9 +1,13 @@
 # pylint: disable=line-too-long, too-many-arguments
-"""Logging utilities for vinted_scraper."""
+"""Logging utilities for vinted_scraper.
+
+Messages use lazy %-style arguments, and helpers computing their arguments
+check the logger level first, so that nothing is formatted when DEBUG is off.
+"""
 
 import logging
 from logging import Logger
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 from urllib.parse import urlencode
 
 
@@ -26,11 +30,15 @@ def log_constructor(
         session_cookie: Session cookie (logged as 'provided' or 'auto-fetch').
         config: Configuration dictionary.
     """
+    if not log.isEnabledFor(logging.DEBUG):
+        return
     log.debug(
-        f"Initializing {self.__class__.__name__}(baseurl={baseurl}, "
-        f"user_agent={user_agent[:50] + '...' if user_agent else None}, "
-        f"session_cookie={'provided' if session_cookie else 'auto-fetch'}, "
-        f"config={config})"
+        "Initializing %s(baseurl=%s, user_agent=%s, session_cookie=%s, config=%s)",
+        self.__class__.__name__,
+        baseurl,
+        user_agent[:50] + "..." if user_agent else None,
+        "provided" if session_cookie else "auto-fetch",
+        config,
     )
 
 
@@ -42,7 +50,7 @@ def log_interaction(log: Logger, i: int, retries: int) -> None:
         i: Current attempt number (0-indexed).
         retries: Total number of retries allowed.
     """
-    log.debug(f"Cookie fetch attempt {i + 1}/{retries}")
+    log.debug("Cookie fetch attempt %d/%d", i + 1, retries)
 
 
 def log_sleep(log: Logger, time: int) -> None:
@@ -52,7 +60,7 @@ def log_sleep(log: Logger, time: int) -> None:
         log: Logger instance.
         time: Sleep duration in seconds.
     """
-    log.debug(f"Sleeping for {time} seconds")
+    log.debug("Sleeping for %s seconds", time)
 
 
 def log_refresh_cookie(log: Logger) -> None:
@@ -71,7 +79,7 @@ def log_search(log: Logger, params: Optional[Dict]) -> None:
         log: Logger instance.
         params: Search parameters dictionary.
     """
-    log.debug(f"Calling search() with params: {params}")
+    log.debug("Calling search() with params: %s", params)
 
 
 def log_item(log: Logger, item_id: str, params: Optional[Dict]) -> None:
@@ -82,7 +90,7 @@ def log_item(log: Logger, item_id: str, params: Optional[Dict]) -> None:
         item_id: Item identifier.
         params: Query parameters dictionary.
     """
-    log.debug(f"Calling item(item_id={item_id}, params={params})")
+    log.debug("Calling item(item_id=%s, params=%s)", item_id, params)
 
 
 def _build_curl_command(url: str, headers: Dict[str, str]) -> str:
@@ -129,8 +137,8 @@ def log_curl_request(
         full_url = f"{full_url}?{urlencode(params)}"
 
     curl_cmd = _build_curl_command(full_url, headers)
-    log.debug(f"API Request: GET {endpoint} with params {params}")
-    log.debug(f"Curl command:\n{curl_cmd}")
+    log.debug("API Request: GET %s with params %s", endpoint, params)
+    log.debug("Curl command:\n%s", curl_cmd)
 
 
 def log_curl_response(
@@ -138,7 +146,7 @@ def log_curl_response(
     endpoint: str,
     status_code: int,
     headers: Any,
-    body: Optional[str] = None,
+    body: Optional[Union[str, Callable[[], str]]] = None,
 ) -> None:
     """Logs detailed HTTP response with status, headers, and body.
 
@@ -147,19 +155,22 @@ def log_curl_response(
         endpoint: API endpoint that was called.
         status_code: HTTP status code.
         headers: Response headers.
-        body: Response body (truncated if over 1000 chars).
+        body: Response body (truncated if over 1000 chars), or a function
+            returning it, only called when DEBUG is enabled.
     """
     if not log.isEnabledFor(logging.DEBUG):
         return
 
-    log.debug(f"API Response: {endpoint} - Status: {status_code}")
-    log.debug(f"Response Headers: {dict(headers)}")
+    log.debug("API Response: %s - Status: %s", endpoint, status_code)
+    log.debug("Response Headers: %s", dict(headers))
+    if callable(body):
+        body = body()
     if body is not None:
         # Truncate body if too long (over 1000 chars)
         if len(body) > 1000:
-            log.debug(f"Response Body (truncated): {body[:1000]}...")
+            log.debug("Response Body (truncated): %s...", body[:1000])
         else:
-            log.debug(f"Response Body: {body}")
+            log.debug("Response Body: %s", body)
 
 
 def log_cookie_fetched(log: Logger, cookie_value: str) -> None:
@@ -169,7 +180,8 @@ def log_cookie_fetched(log: Logger, cookie_value: str) -> None:
         log: Logger instance.
         cookie_value: Fetched cookie value (truncated in log).
     """
-    log.debug(f"Session cookie fetched successfully: {cookie_value[:20]}...")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Session cookie fetched successfully: %s...", cookie_value[:20])
 
 
 def log_cookie_retry(log: Logger, status_code: int) -> None:
@@ -179,7 +191,56 @@ def log_cookie_retry(log: Logger, status_code: int) -> None:
         log: Logger instance.
         status_code: HTTP status code that triggered retry.
     """
-    log.debug(f"Received {status_code} status, refreshing session cookie and retrying")
+    log.debug("Received %s status, refreshing session cookie and retrying", status_code)
+
+
+def log_retry(log: Logger, reason: str, attempt: int, delay: float) -> None:
+    """Logs the retry of a failed API request.
+
+    Args:
+        log: Logger instance.
+        reason: Why the request failed (status code or exception name).
+        attempt: Failed attempt number (0-indexed).
+        delay: Seconds before the next attempt.
+    """
+    log.debug(
+        "Request failed (%s) on attempt %d, retrying in %.2f seconds",
+        reason,
+        attempt + 1,
+        delay,
+    )
+
+
+def log_circuit_state(log: Logger, endpoint: str, state: str) -> None:
+    """Logs a circuit breaker state change.
+
+    Args:
+        log: Logger instance.
+        endpoint: Endpoint family of the circuit.
+        state: New state of the circuit.
+    """
+    log.debug("Circuit for endpoint %s is now %s", endpoint, state)
+
+
+def log_cookie_renewal(log: Logger, delay: float) -> None:
+    """Logs the scheduling of a proactive session cookie renewal.
+
+    Args:
+        log: Logger instance.
+        delay: Seconds before the renewal.
+    """
+    log.debug("Session cookie renewal scheduled in %.0f seconds", delay)
+
+
+def log_proxy_quarantined(log: Logger, proxy: str, duration: float) -> None:
+    """Logs a proxy put in quarantine after repeated failures.
+
+    Args:
+        log: Logger instance.
+        proxy: Proxy URL.
+        duration: Quarantine duration in seconds.
+    """
+    log.debug("Proxy %s quarantined for %.0f seconds", proxy, duration)
 
 
 def log_cookie_fetch_failed(
@@ -194,5 +255,8 @@ def log_cookie_fetch_failed(
         retries: Total number of retries allowed.
     """
     log.debug(
-        f"Cookie fetch failed (attempt {attempt + 1}/{retries}) with status {status_code or 'unknown'}"
+        "Cookie fetch failed (attempt %d/%d) with status %s",
+        attempt + 1,
+        retries,
+        status_code or "unknown",
     )
@@ -4,15 +4,20 @@ This module provides common utilities including:
 - Random user agent selection
 - URL validation
 - HTTP header generation
+- Session token expiry decoding
+- Endpoint family normalisation
 """
 
+import base64
 import json
 import os
 import random
 import re
 import sys
 from functools import lru_cache
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+from urllib.parse import urlsplit
 
 if sys.version_info >= (3, 9):
     from importlib.resources import files
@@ -68,6 +73,38 @@ def url_validator(url: str) -> bool:
     return bool(_URL_PATTERN.match(url))
 
 
+@lru_cache(maxsize=64)
+def get_cookie_header_template(base_url: str, user_agent: str) -> Mapping[str, str]:
+    """Returns the immutable browser-like HTTP headers for cookie fetching.
+
+    The headers are built once per base URL and user agent.
+
+    Args:
+        base_url: Base URL of the website.
+        user_agent: User agent string.
+
+    Returns:
+        Read-only mapping of HTTP headers.
+    """
+    return MappingProxyType(
+        {
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate, br, zstd",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+            "DNT": "1",  # Do Not Track
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "none",
+            "Sec-Fetch-User": "?1",
+            "Origin": base_url,
+            "Referer": base_url,
+        }
+    )
+
+
 def get_cookie_headers(base_url: str, user_agent: str) -> Dict:
     """Generates browser-like HTTP headers for cookie fetching.
 
@@ -78,21 +115,51 @@ def get_cookie_headers(base_url: str, user_agent: str) -> Dict:
     Returns:
         Dictionary of HTTP headers.
     """
-    return {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br, zstd",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "DNT": "1",  # Do Not Track
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1",
-        "Origin": base_url,
-        "Referer": base_url,
-    }
+    return dict(get_cookie_header_template(base_url, user_agent))
+
+
+@lru_cache(maxsize=64)
+def get_curl_header_template(base_url: str, user_agent: str) -> Mapping[str, str]:
+    """Returns the immutable HTTP headers of API requests, except the Cookie.
+
+    The headers are built once per base URL and user agent.
+
+    Args:
+        base_url: Base URL of the website.
+        user_agent: User agent string.
+
+    Returns:
+        Read-only mapping of HTTP headers.
+    """
+    return MappingProxyType(
+        {
+            "User-Agent": user_agent,
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Encoding": "gzip, deflate, br, zstd",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+            "DNT": "1",  # Do Not Track
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "none",
+            "Sec-Fetch-User": "?1",
+            "Origin": base_url,
+            "Referer": base_url,
+        }
+    )
+
+
+def get_cookie_string(session_cookies: Optional[Dict[str, str]]) -> str:
+    """Joins session cookies into the value of a Cookie header.
+
+    Args:
+        session_cookies: Dictionary of session cookies.
+
+    Returns:
+        The ``name=value`` pairs separated by ``"; "``.
+    """
+    return "; ".join(f"{k}={v}" for k, v in (session_cookies or {}).items())
 
 
 def get_curl_headers(
@@ -108,20 +175,66 @@ def get_curl_headers(
     Returns:
         Dictionary of HTTP headers including Cookie header.
     """
-    cookie_str = "; ".join(f"{k}={v}" for k, v in (session_cookies or {}).items())
     return {
-        "User-Agent": user_agent,
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Encoding": "gzip, deflate, br, zstd",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "DNT": "1",  # Do Not Track
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1",
-        "Origin": base_url,
-        "Referer": base_url,
-        "Cookie": cookie_str,
+        **get_curl_header_template(base_url, user_agent),
+        "Cookie": get_cookie_string(session_cookies),
     }
+
+
+def get_token_expiry(token: str) -> Optional[float]:
+    """Decodes the ``exp`` claim of a JWT without verifying its signature.
+
+    Args:
+        token: The token string, e.g. the ``access_token_web`` cookie value.
+
+    Returns:
+        Expiry as a Unix timestamp, or None if the token is not a JWT with an
+        ``exp`` claim.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+        claims = json.loads(payload)
+    except ValueError:
+        return None
+    expiry = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(expiry, bool) or not isinstance(expiry, (int, float)):
+        return None
+    return float(expiry)
+
+
+def get_cookie_expiry(session_cookies: Optional[Dict[str, str]]) -> Optional[float]:
+    """Returns the earliest token expiry among the session cookies.
+
+    Args:
+        session_cookies: Dictionary of session cookies.
+
+    Returns:
+        Earliest expiry as a Unix timestamp, or None if no cookie is a JWT.
+    """
+    expiries = [
+        expiry
+        for expiry in map(get_token_expiry, (session_cookies or {}).values())
+        if expiry is not None
+    ]
+    return min(expiries) if expiries else None
+
+
+def get_endpoint_family(endpoint: str) -> str:
+    """Returns the endpoint path with its numeric identifiers replaced.
+
+    Requests to the same API route share a family, e.g.
+    ``/api/v2/items/123/details`` becomes ``/api/v2/items/{id}/details``.
+
+    Args:
+        endpoint: Endpoint path or absolute URL, optionally with a query string.
+
+    Returns:
+        The normalised endpoint path.
+    """
+    path = urlsplit(endpoint).path.rstrip("/") or "/"
+    return "/".join(
+        "{id}" if segment.isdigit() else segment for segment in path.split("/")
+    )
@@ -0,0 +1,264 @@
+"""Proxy rotation with per-proxy health scoring.
+
+A ``ProxyPool`` keeps latency, error and load statistics for each proxy
+and spreads new requests over the least loaded healthy ones. Proxies failing
+repeatedly (403, 429, timeouts, connection errors) are quarantined, then
+re-probed with a single request once the quarantine is over.
+
+The pool plugs into httpx through the ``transport`` option of the wrapper
+config, e.g. ``config={"transport": pool.transport()}``.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+import httpx
+
+from ._constants import (
+    PROXY_FAILURE_STATUSES,
+    PROXY_QUARANTINE_FAILURES,
+    PROXY_QUARANTINE_TIME,
+)
+from ._log import log_proxy_quarantined
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class ProxyStats:
+    """Health statistics of a proxy.
+
+    Attributes:
+        url: Proxy URL.
+        latency: Exponentially weighted average latency in seconds.
+        error_rate: Exponentially weighted average of failed requests (0 to 1).
+        consecutive_failures: Failures since the last successful request.
+        quarantined_until: Timestamp until which the proxy is not used.
+        probing: Whether a probe request is in flight after a quarantine.
+        in_flight: Number of requests in flight through the proxy.
+    """
+
+    url: str
+    latency: float = 0.0
+    error_rate: float = 0.0
+    consecutive_failures: int = 0
+    quarantined_until: float = 0.0
+    probing: bool = False
+    in_flight: int = 0
+
+    @property
+    def score(self) -> float:
+        """Lower is healthier: latency penalised by the error rate."""
+        return (self.latency + 0.1) * (1.0 + 10.0 * self.error_rate)
+
+
+class ProxyPool:
+    """Pool of proxies routing each request to the least loaded healthy one.
+
+    The pool is thread-safe and can back several sync and async transports.
+
+    Attributes:
+        quarantine_after: Consecutive failures after which a proxy is quarantined.
+        quarantine_time: Seconds a quarantined proxy is left aside before being
+            probed again. It doubles at each failed probe.
+        smoothing: Weight of the last request in the latency and error averages.
+    """
+
+    def __init__(
+        self,
+        proxies: List[str],
+        quarantine_after: int = PROXY_QUARANTINE_FAILURES,
+        quarantine_time: float = PROXY_QUARANTINE_TIME,
+        smoothing: float = 0.2,
+    ) -> None:
+        if not proxies:
+            raise ValueError("A proxy pool needs at least one proxy")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self.quarantine_after = quarantine_after
+        self.quarantine_time = quarantine_time
+        self.smoothing = smoothing
+        self._stats: Dict[str, ProxyStats] = {url: ProxyStats(url) for url in proxies}
+        self._penalties: Dict[str, int] = {url: 0 for url in proxies}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> List[ProxyStats]:
+        """Snapshot of the statistics of every proxy."""
+        with self._lock:
+            return [ProxyStats(**vars(stats)) for stats in self._stats.values()]
+
+    def acquire(self) -> str:
+        """Pick the proxy for the next request.
+
+        A proxy whose quarantine is over gets a single probe request first.
+        Otherwise the available proxy with the fewest requests in flight is
+        used, the best score breaking ties, so that concurrent requests are
+        spread over the healthy proxies. If every proxy is quarantined, the
+        one released soonest is used anyway.
+
+        Every acquired proxy must be handed back with ``record`` or
+        ``release``.
+
+        Returns:
+            The proxy URL.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [s for s in self._stats.values() if not s.probing]
+            probes = [
+                s
+                for s in candidates
+                if s.quarantined_until and s.quarantined_until <= now
+            ]
+            available = [s for s in candidates if not s.quarantined_until]
+            if probes:
+                stats = probes[0]
+                stats.probing = True
+            elif available:
+                stats = min(available, key=lambda s: (s.in_flight, s.score))
+            else:
+                stats = min(self._stats.values(), key=lambda s: s.quarantined_until)
+            stats.in_flight += 1
+            return stats.url
+
+    def record(self, url: str, latency: float, failed: bool) -> None:
+        """Update the statistics of a proxy after a request.
+
+        Args:
+            url: The proxy URL.
+            latency: Duration of the request in seconds.
+            failed: Whether the request failed because of the proxy.
+        """
+        with self._lock:
+            stats = self._stats[url]
+            stats.in_flight = max(stats.in_flight - 1, 0)
+            stats.latency += self.smoothing * (latency - stats.latency)
+            stats.error_rate += self.smoothing * (float(failed) - stats.error_rate)
+            was_probing, stats.probing = stats.probing, False
+            if not failed:
+                stats.consecutive_failures = 0
+                stats.quarantined_until = 0.0
+                self._penalties[url] = 0
+                return
+            stats.consecutive_failures += 1
+            if was_probing or stats.consecutive_failures >= self.quarantine_after:
+                duration = self.quarantine_time * 2 ** self._penalties[url]
+                self._penalties[url] += 1
+                stats.quarantined_until = time.monotonic() + duration
+                log_proxy_quarantined(_log, url, duration)
+
+    def release(self, url: str) -> None:
+        """Forget a request interrupted before completion, e.g. cancelled.
+
+        Args:
+            url: The proxy URL.
+        """
+        with self._lock:
+            stats = self._stats[url]
+            stats.in_flight = max(stats.in_flight - 1, 0)
+            stats.probing = False
+
+    def transport(self, **kwargs) -> "ProxyRotatingTransport":
+        """Create a sync httpx transport routing through this pool.
+
+        Args:
+            **kwargs: Options of every underlying ``httpx.HTTPTransport``.
+        """
+        return ProxyRotatingTransport(self, **kwargs)
+
+    def async_transport(self, **kwargs) -> "AsyncProxyRotatingTransport":
+        """Create an async httpx transport routing through this pool.
+
+        Args:
+            **kwargs: Options of every underlying ``httpx.AsyncHTTPTransport``.
+        """
+        return AsyncProxyRotatingTransport(self, **kwargs)
+
+
+def _is_proxy_failure(response: httpx.Response) -> bool:
+    """Check whether a response status blames the proxy."""
+    return response.status_code in PROXY_FAILURE_STATUSES
+
+
+class ProxyRotatingTransport(httpx.BaseTransport):
+    """Sync httpx transport sending each request through a pool proxy.
+
+    Attributes:
+        pool: The proxy pool.
+    """
+
+    def __init__(self, pool: ProxyPool, **kwargs) -> None:
+        self.pool = pool
+        self._kwargs = kwargs
+        self._transports: Dict[str, httpx.HTTPTransport] = {}
+        self._lock = threading.Lock()
+
+    def _get_transport(self, url: str) -> httpx.HTTPTransport:
+        """Return the transport of a proxy, creating it on first use."""
+        with self._lock:
+            if url not in self._transports:
+                self._transports[url] = httpx.HTTPTransport(
+                    proxy=httpx.Proxy(url), **self._kwargs
+                )
+            return self._transports[url]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        url = self.pool.acquire()
+        start = time.monotonic()
+        try:
+            response = self._get_transport(url).handle_request(request)
+        except httpx.TransportError:
+            self.pool.record(url, time.monotonic() - start, failed=True)
+            raise
+        except BaseException:
+            self.pool.release(url)
+            raise
+        self.pool.record(url, time.monotonic() - start, _is_proxy_failure(response))
+        return response
+
+    def close(self) -> None:
+        for transport in self._transports.values():
+            transport.close()
+
+
+class AsyncProxyRotatingTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport sending each request through a pool proxy.
+
+    Attributes:
+        pool: The proxy pool.
+    """
+
+    def __init__(self, pool: ProxyPool, **kwargs) -> None:
+        self.pool = pool
+        self._kwargs = kwargs
+        self._transports: Dict[str, httpx.AsyncHTTPTransport] = {}
+
+    def _get_transport(self, url: str) -> httpx.AsyncHTTPTransport:
+        """Return the transport of a proxy, creating it on first use."""
+        if url not in self._transports:
+            self._transports[url] = httpx.AsyncHTTPTransport(
+                proxy=httpx.Proxy(url), **self._kwargs
+            )
+        return self._transports[url]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = self.pool.acquire()
+        start = time.monotonic()
+        try:
+            response = await self._get_transport(url).handle_async_request(request)
+        except httpx.TransportError:
+            self.pool.record(url, time.monotonic() - start, failed=True)
+            raise
+        except BaseException:
+            self.pool.release(url)
+            raise
+        self.pool.record(url, time.monotonic() - start, _is_proxy_failure(response))
+        return response
+
+    async def aclose(self) -> None:
+        for transport in self._transports.values():
+            await transport.aclose()
@@ -0,0 +1,118 @@
+"""Token-bucket rate limiting per host and endpoint family.
+
+Each (host, endpoint family) pair gets its own bucket, so that search and item
+requests have separate budgets. A request reserves a token and waits until it
+becomes available; the waiting itself is left to the caller, so the same
+limiter serves blocking and async clients.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from ._constants import DEFAULT_RATE_BURST, DEFAULT_RATE_LIMIT
+from ._misc import get_endpoint_family
+
+
+@dataclass
+class TokenBucket:
+    """A token bucket refilled at a constant rate.
+
+    Attributes:
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens, i.e. the allowed burst.
+        tokens: Tokens currently available. Negative when requests are queued.
+        updated: Monotonic time of the last refill.
+    """
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated: float
+
+    def reserve(self, now: float) -> float:
+        """Take a token, possibly ahead of time.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            Seconds to wait before the token can be used.
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+
+class RateLimiter:
+    """Token-bucket rate limiter keyed by host and endpoint family.
+
+    A single limiter can be shared by several wrappers, e.g. every identity of
+    a session pool, to enforce a global budget. It is thread-safe.
+
+    Attributes:
+        rate: Default requests per second of each endpoint family.
+        burst: Default burst size of each endpoint family.
+        limits: ``(rate, burst)`` of specific endpoint families, e.g.
+            ``{"/api/v2/items/{id}/details": (0.5, 1)}``.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE_LIMIT,
+        burst: int = DEFAULT_RATE_BURST,
+        limits: Optional[Dict[str, Tuple[float, int]]] = None,
+    ) -> None:
+        for limit_rate, limit_burst in [(rate, burst), *(limits or {}).values()]:
+            if limit_rate <= 0 or limit_burst < 1:
+                raise ValueError("Rate limits need a positive rate and burst")
+        self.rate = rate
+        self.burst = burst
+        self.limits = dict(limits or {})
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, host: str, endpoint: str) -> float:
+        """Reserve a request slot.
+
+        Args:
+            host: Host the request is sent to.
+            endpoint: Endpoint path of the request.
+
+        Returns:
+            Seconds to wait before sending the request.
+        """
+        family = get_endpoint_family(endpoint)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get((host, family))
+            if bucket is None:
+                rate, burst = self.limits.get(family, (self.rate, self.burst))
+                bucket = TokenBucket(rate, burst, burst, now)
+                self._buckets[(host, family)] = bucket
+            return bucket.reserve(now)
+
+    def acquire(self, host: str, endpoint: str) -> None:
+        """Block until a request slot is available.
+
+        Args:
+            host: Host the request is sent to.
+            endpoint: Endpoint path of the request.
+        """
+        delay = self.reserve(host, endpoint)
+        if delay:
+            time.sleep(delay)
+
+    async def async_acquire(self, host: str, endpoint: str) -> None:
+        """Wait without blocking the event loop until a slot is available.
+
+        Args:
+            host: Host the request is sent to.
+            endpoint: Endpoint path of the request.
+        """
+        delay = self.reserve(host, endpoint)
+        if delay:
+            await asyncio.sleep(delay)
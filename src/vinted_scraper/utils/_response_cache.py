@@ -0,0 +1,313 @@
+# pylint: disable=too-many-instance-attributes
+"""Response caches with per-endpoint TTLs, stale-while-revalidate and a size bound.
+
+Responses are stored as the raw body bytes and decoded on every hit, so that
+callers never share (and mutate) the same decoded object, and the size bound
+applies to what is actually stored.
+
+``ResponseCache`` keeps the entries in memory. ``SQLiteResponseCache`` keeps
+them compressed on disk, shared by sibling processes and across restarts.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import ClassVar, ContextManager, Dict, NamedTuple, Optional
+from urllib.parse import urlencode
+
+from ._constants import DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL
+from ._misc import get_endpoint_family
+from ._sqlite import sqlite_connection
+
+
+def get_cache_key(endpoint: str, params: Optional[Dict], baseurl: str = "") -> str:
+    """Returns the cache key of a request, independent of the params order.
+
+    Args:
+        endpoint: Endpoint path.
+        params: Query parameters.
+        baseurl: Vinted domain URL, so that a cache shared by the wrappers of
+            several domains keeps their responses apart.
+
+    Returns:
+        The URL of the request, with its query parameters sorted.
+    """
+    url = f"{baseurl.rstrip('/')}{endpoint}"
+    if not params:
+        return url
+    items = sorted((str(key), value) for key, value in params.items())
+    return f"{url}?{urlencode(items, doseq=True)}"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A response served from a cache.
+
+    Attributes:
+        body: The raw response body.
+        headers: The response headers.
+        stale: Whether the entry is past its TTL and should be revalidated.
+    """
+
+    body: bytes
+    headers: Dict[str, str]
+    stale: bool
+
+
+class _Entry(NamedTuple):
+    """A stored response with its freshness deadlines."""
+
+    body: bytes
+    headers: Dict[str, str]
+    fresh_until: float
+    expires_at: float
+
+
+class ResponseCache:
+    """Thread-safe in-memory TTL and LRU cache of API response bodies.
+
+    Subclasses store the entries elsewhere by overriding ``_load``, ``_save``,
+    ``_clear``, ``size`` and ``__len__``, and set ``blocking`` if that involves
+    I/O, so that the async wrappers access them from a worker thread.
+
+    Attributes:
+        ttl: Default lifetime of the entries in seconds.
+        max_bytes: Maximum total size of the cached bodies. The least recently
+            used entries are evicted first.
+        ttls: Lifetime of the entries of specific endpoint families, e.g.
+            ``{"/api/v2/items/{id}/details": 300}``. 0 disables caching.
+        stale_ttl: Seconds an entry past its TTL is still served, flagged as
+            stale so that it is refreshed in the background.
+        hits: Number of lookups served from the cache, stale ones included.
+        stale_hits: Number of lookups served with a stale entry.
+        misses: Number of lookups not found or expired.
+    """
+
+    blocking: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_bytes: int = DEFAULT_CACHE_SIZE,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_ttl: float = 0.0,
+    ) -> None:
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.ttls = dict(ttls or {})
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached bodies."""
+        return self._size
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response of a request, if not expired.
+
+        Args:
+            key: The request cache key, see ``get_cache_key``.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        now = self._now()
+        with self._lock:
+            entry = self._load(key, now)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            stale = entry.fresh_until <= now
+            self.stale_hits += stale
+        return CachedResponse(entry.body, entry.headers, stale)
+
+    def set(
+        self,
+        key: str,
+        endpoint: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Cache the body of a successful response.
+
+        Args:
+            key: The request cache key, see ``get_cache_key``.
+            endpoint: Endpoint path, selecting the TTL.
+            body: The raw response body.
+            headers: The response headers.
+        """
+        ttl = self.ttls.get(get_endpoint_family(endpoint), self.ttl)
+        if ttl <= 0 or len(body) > self.max_bytes:
+            return
+        now = self._now()
+        entry = _Entry(body, dict(headers or {}), now + ttl, now + ttl + self.stale_ttl)
+        with self._lock:
+            self._save(key, entry)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._clear()
+            self.hits = self.stale_hits = self.misses = 0
+
+    @staticmethod
+    def _now() -> float:
+        """Return the current time of the entry deadlines."""
+        return time.monotonic()
+
+    def _load(self, key: str, now: float) -> Optional[_Entry]:
+        """Return an entry not yet expired, dropping it if it is."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= now:
+            self._remove(key)
+            return None
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _save(self, key: str, entry: _Entry) -> None:
+        """Insert or replace an entry, evicting the least recently used ones."""
+        self._remove(key)
+        self._entries[key] = entry
+        self._size += len(entry.body)
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry, if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.body)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Response cache backed by a SQLite database, with compressed bodies.
+
+    The database can be shared by several processes. ``max_bytes`` bounds the
+    compressed size of the bodies on disk.
+
+    Attributes:
+        path: Path of the SQLite database file.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_bytes: int = DEFAULT_CACHE_SIZE,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_ttl: float = 0.0,
+    ) -> None:
+        super().__init__(ttl, max_bytes, ttls, stale_ttl)
+        self.path = path
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, headers TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, fresh_until REAL NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+                "size INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Total compressed size in bytes of the cached bodies."""
+        with self._connect() as connection:
+            query = "SELECT COALESCE(SUM(size), 0) FROM responses"
+            return connection.execute(query).fetchone()[0]
+
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        """Open a short-lived connection committing on success."""
+        return sqlite_connection(self.path)
+
+    @staticmethod
+    def _now() -> float:
+        """Return the current wall clock time, valid across processes."""
+        return time.time()
+
+    def _load(self, key: str, now: float) -> Optional[_Entry]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT body, headers, fresh_until, expires_at FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[3] <= now:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return _Entry(zlib.decompress(row[0]), json.loads(row[1]), row[2], row[3])
+
+    def _save(self, key: str, entry: _Entry) -> None:
+        body = zlib.compress(entry.body)
+        now = self._now()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    body,
+                    json.dumps(entry.headers),
+                    now,
+                    entry.fresh_until,
+                    entry.expires_at,
+                    now,
+                    len(body),
+                ),
+            )
+            connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete the least recently used entries over ``max_bytes``."""
+        query = "SELECT COALESCE(SUM(size), 0) FROM responses"
+        excess = connection.execute(query).fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        rows = connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        for key, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def _clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM responses")
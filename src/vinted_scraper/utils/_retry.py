@@ -0,0 +1,161 @@
+"""Retry policy shared by the session cookie fetch and the API calls.
+
+Delays use exponential backoff with full jitter, so that concurrent workers
+hitting the same error spread their retries instead of retrying in lockstep,
+and honour the ``Retry-After`` header sent with 429 and 503 responses. A
+``Retry-After`` longer than the maximum delay gives up the retries instead.
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+
+from ._constants import (
+    DEFAULT_RETRIES,
+    RETRY_BASE_SLEEP,
+    RETRY_MAX_DELAY,
+    RETRY_MAX_ELAPSED,
+    RETRY_STATUSES,
+)
+
+
+def get_retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+    """Returns the delay requested by the ``Retry-After`` header of a response.
+
+    Args:
+        response: The httpx response, if any.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryState:
+    """Progress of the retries of a single API call.
+
+    One state is created per call and updated in place at every retry, then
+    handed to the wrapper ``on_retry`` callback, if any.
+
+    Attributes:
+        endpoint: The endpoint called.
+        attempt: Number of retries so far.
+        reason: Why the last attempt failed: its status code or the name of
+            the exception raised.
+        delay: Seconds waited before the next attempt.
+        cookie_refreshes: Retries that refreshed the session cookie after a 401.
+        started: Monotonic time of the first attempt.
+    """
+
+    endpoint: str
+    attempt: int = 0
+    reason: str = ""
+    delay: float = 0.0
+    cookie_refreshes: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds elapsed since the first attempt."""
+        return time.monotonic() - self.started
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Attributes:
+        retries: Maximum number of backoff retries of an API call.
+        auth_retries: Maximum number of session cookie refreshes of an API
+            call rejected with a 401.
+        base_delay: Backoff ceiling of the first retry in seconds, doubled at
+            every further attempt.
+        max_delay: Maximum delay of a single retry. A longer ``Retry-After``
+            is not retried.
+        max_elapsed: Maximum time in seconds spent retrying a single call.
+        statuses: Response status codes worth retrying.
+        retry_timeouts: Whether timed out requests are retried.
+    """
+
+    retries: int = DEFAULT_RETRIES
+    auth_retries: int = DEFAULT_RETRIES
+    base_delay: float = RETRY_BASE_SLEEP
+    max_delay: float = RETRY_MAX_DELAY
+    max_elapsed: float = RETRY_MAX_ELAPSED
+    statuses: FrozenSet[int] = RETRY_STATUSES
+    retry_timeouts: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If a count or a duration is negative.
+        """
+        limits = (self.retries, self.auth_retries, self.base_delay, self.max_delay)
+        if min(*limits, self.max_elapsed) < 0:
+            raise ValueError("Retry counts and delays cannot be negative")
+
+    def is_retryable(self, status_code: int) -> bool:
+        """Check whether a response status is worth retrying."""
+        return status_code in self.statuses
+
+    def backoff(
+        self, attempt: int, response: Optional[httpx.Response] = None
+    ) -> Optional[float]:
+        """Compute the delay before retrying a failed attempt.
+
+        Args:
+            attempt: The failed attempt (0-indexed).
+            response: Its response, whose ``Retry-After`` takes precedence.
+
+        Returns:
+            Seconds to wait, drawn uniformly between 0 and the exponential
+            backoff ceiling unless the server asked for a specific delay, or
+            None if that delay exceeds ``max_delay``: retrying sooner would
+            only be throttled again.
+        """
+        retry_after = get_retry_after(response)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        ceiling = min(self.max_delay, self.base_delay * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        response: Optional[httpx.Response] = None,
+    ) -> Optional[float]:
+        """Compute the delay before the next attempt of an API call.
+
+        Args:
+            attempt: The failed attempt (0-indexed).
+            elapsed: Seconds spent on the call so far.
+            response: The failed response, None for a timeout.
+
+        Returns:
+            Seconds to wait, or None if the call should not be retried because
+            the retries or the time budget are exhausted, or the server asked
+            to wait longer than ``max_delay``.
+        """
+        if attempt >= self.retries:
+            return None
+        delay = self.backoff(attempt, response)
+        if delay is None or elapsed + delay > self.max_elapsed:
+            return None
+        return delay
@@ -0,0 +1,23 @@
+"""SQLite helpers shared by the persistent cookie store and response cache."""
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def sqlite_connection(path: str) -> Iterator[sqlite3.Connection]:
+    """Open a short-lived connection committing on success.
+
+    Args:
+        path: Path of the SQLite database file.
+
+    Yields:
+        The connection, closed on exit.
+    """
+    connection = sqlite3.connect(path, timeout=30)
+    try:
+        with connection:
+            yield connection
+    finally:
+        connection.close()
@@ -4,19 +4,29 @@
 Test the Async Vinted Wrapper class
 """
 
+import asyncio
 import logging
+import os
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 from src.vinted_scraper import AsyncVintedScraper, AsyncVintedWrapper
-from src.vinted_scraper.models import VintedJsonModel
-from src.vinted_scraper.utils import SESSION_COOKIE_NAME
+from src.vinted_scraper.models import VintedItem, VintedJsonModel
+from src.vinted_scraper.utils import (
+    COOKIE_RENEWAL_MARGIN,
+    SESSION_COOKIE_NAME,
+    SQLiteCookieStore,
+)
 from tests.utils import (
     BASE_URL,
     COOKIE_VALUE,
     USER_AGENT,
     create_cookie_response,
+    create_jwt,
     create_mock,
     setup_async_mock_get,
 )
@@ -77,6 +87,20 @@ class TestAsyncVintedWrapper(unittest.IsolatedAsyncioTestCase):
         wrapper = await AsyncVintedWrapper.create(BASE_URL, user_agent=USER_AGENT)
         self.assertEqual(wrapper.user_agent, USER_AGENT)
 
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_factory_create_with_cookie_store(self, mock_client):
+        """Test the factory method reuses the cookie saved in the cookie store"""
+        mock_client.return_value.get = AsyncMock(return_value=create_cookie_response())
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = SQLiteCookieStore(os.path.join(tmp_dir, "cookies.db"))
+
+            wrapper = await AsyncVintedWrapper.create(BASE_URL, cookie_store=store)
+            other = await AsyncVintedWrapper.create(BASE_URL, cookie_store=store)
+
+        self.assertEqual(other.session_cookie, wrapper.session_cookie)
+        self.assertEqual(other.user_agent, wrapper.user_agent)
+        self.assertEqual(mock_client.return_value.get.call_count, 1)
+
     @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
     async def test_search(self, mock_client):
         """Test search method"""
@@ -113,8 +137,9 @@ class TestAsyncVintedWrapper(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result, {"success": True})
         self.assertEqual(mock_client.return_value.get.call_count, 3)
 
+    @patch("src.vinted_scraper._async_wrapper.asyncio.sleep")
     @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
-    async def test_curl_error(self, mock_client):
+    async def test_curl_error(self, mock_client, mock_sleep):
         """Test curl method with non-200/401 response"""
         setup_async_mock_get(mock_client, status_code=500, text="")
 
@@ -123,14 +148,28 @@ class TestAsyncVintedWrapper(unittest.IsolatedAsyncioTestCase):
             await wrapper.curl("/test")
         self.assertIn("500", str(ctx.exception))
         self.assertIsInstance(ctx.exception, RuntimeError)
+        self.assertEqual(mock_client.return_value.get.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
+
+    @patch("src.vinted_scraper._async_wrapper.asyncio.sleep")
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_curl_retry_after(self, mock_client, mock_sleep):
+        """Test a 429 is retried after the delay asked by Retry-After"""
+        throttled = create_mock(status_code=429, text="")
+        throttled.headers = {"Retry-After": "7"}
+        mock_client.return_value.get = AsyncMock(
+            side_effect=[throttled, create_mock({"success": True})]
+        )
+
+        wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertEqual(await wrapper.curl("/test"), {"success": True})
+        mock_sleep.assert_awaited_once_with(7.0)
 
     @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
     async def test_curl_invalid_json(self, mock_client):
         """Test curl method with invalid JSON response"""
         setup_async_mock_get(mock_client, text="invalid")
-        mock_client.return_value.get.return_value.json.side_effect = ValueError(
-            "Invalid JSON"
-        )
+        mock_client.return_value.get.return_value.content = b"invalid"
 
         wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
         with self.assertRaises(RuntimeError) as ctx:
@@ -139,6 +178,131 @@ class TestAsyncVintedWrapper(unittest.IsolatedAsyncioTestCase):
         self.assertIn("JSON", str(ctx.exception))
         self.assertIsInstance(ctx.exception, RuntimeError)
 
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_aiter_search(self, mock_client):
+        """Test aiter_search walks pages until the last one"""
+        mock_client.return_value.get = AsyncMock(
+            side_effect=[
+                create_mock({"items": [{"id": 1}], "pagination": {"total_pages": 2}}),
+                create_mock({"items": [{"id": 2}], "pagination": {"total_pages": 2}}),
+            ]
+        )
+
+        wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        result = [item async for item in wrapper.aiter_search({"search_text": "a"})]
+
+        self.assertEqual([item["id"] for item in result], [1, 2])
+        self.assertEqual(mock_client.return_value.get.call_count, 2)
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_aiter_search_is_lazy(self, mock_client):
+        """Test aiter_search stops on empty pages and early breaks"""
+        setup_async_mock_get(mock_client, {"items": [{"id": 1}]})
+
+        wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        async for _ in wrapper.aiter_search():
+            break
+        mock_client.return_value.get.assert_called_once()
+
+        setup_async_mock_get(mock_client, {"items": []})
+        result = [item async for item in wrapper.aiter_search()]
+        self.assertEqual(result, [])
+        mock_client.return_value.get.assert_called_once()
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_aiter_search_prefetch(self, mock_client):
+        """Test aiter_search keeps the next pages in flight while consuming"""
+        requested = []
+
+        async def get(_endpoint, params=None, **_kwargs):
+            requested.append(params["page"])
+            return create_mock(
+                {"items": [{"id": params["page"]}], "pagination": {"total_pages": 4}}
+            )
+
+        mock_client.return_value.get = AsyncMock(side_effect=get)
+
+        wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        iterator = wrapper.aiter_search(prefetch=2)
+        first = await iterator.__anext__()
+        await asyncio.sleep(0)
+        self.assertEqual(first["id"], 1)
+        self.assertEqual(requested, [1, 2, 3])
+
+        result = [first] + [item async for item in iterator]
+        self.assertEqual([item["id"] for item in result], [1, 2, 3, 4])
+        self.assertEqual(requested, [1, 2, 3, 4])
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_aiter_search_prefetch_cancelled_on_close(self, mock_client):
+        """Test pages still in flight are cancelled when the iterator is closed"""
+        release = asyncio.Event()
+
+        async def get(_endpoint, params=None, **_kwargs):
+            if params["page"] > 1:
+                await release.wait()
+            return create_mock({"items": [{"id": params["page"]}]})
+
+        mock_client.return_value.get = AsyncMock(side_effect=get)
+
+        wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        iterator = wrapper.aiter_search(prefetch=3)
+        await iterator.__anext__()
+        await asyncio.sleep(0)
+        self.assertEqual(mock_client.return_value.get.call_count, 4)
+
+        await iterator.aclose()
+        await asyncio.sleep(0)
+        self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()})
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_item_many(self, mock_client):
+        """Test item_many honours the concurrency limit and isolates errors"""
+        in_flight = []
+        max_in_flight = []
+
+        async def get(endpoint, **_kwargs):
+            in_flight.append(endpoint)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(endpoint)
+            if "/3/" in endpoint:
+                return create_mock(status_code=404, text="")
+            return create_mock({"item": {"endpoint": endpoint}})
+
+        mock_client.return_value.get = AsyncMock(side_effect=get)
+
+        wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        results = {
+            item_id: result
+            async for item_id, result in wrapper.item_many(
+                (str(i) for i in range(6)), concurrency=2
+            )
+        }
+
+        self.assertEqual(set(results), {"0", "1", "2", "3", "4", "5"})
+        self.assertIsInstance(results["3"], RuntimeError)
+        self.assertIn("404", str(results["3"]))
+        self.assertEqual(
+            results["5"], {"item": {"endpoint": "/api/v2/items/5/details"}}
+        )
+        self.assertLessEqual(max(max_in_flight), 2)
+        self.assertEqual(mock_client.return_value.get.call_count, 6)
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_item_many_early_break(self, mock_client):
+        """Test item_many cancels pending requests when the consumer stops"""
+        setup_async_mock_get(mock_client, {"item": {}})
+
+        wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        iterator = wrapper.item_many(range(100), concurrency=4)
+        await iterator.__anext__()
+        await iterator.aclose()
+        await asyncio.sleep(0)
+
+        self.assertLessEqual(mock_client.return_value.get.call_count, 8)
+        self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()})
+
     async def test_fetch_cookie_no_cookie_in_response(self):
         """Test fetch_cookie when response doesn't contain cookie"""
         mock_client = MagicMock()
@@ -170,6 +334,155 @@ class TestAsyncVintedWrapper(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(ctx.exception, RuntimeError)
 
 
+class TestAsyncVintedWrapperSharing(unittest.IsolatedAsyncioTestCase):
+    """Test the cookie refresh and request coalescing of AsyncVintedWrapper"""
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_curl_401_single_cookie_refresh(self, mock_client):
+        """Test concurrent 401s share a single cookie refresh"""
+
+        async def get(endpoint, headers=None, **_kwargs):
+            await asyncio.sleep(0)
+            if endpoint == "/":
+                return create_cookie_response()
+            if "stale" in headers["Cookie"]:
+                return create_mock(status_code=401, text="")
+            return create_mock({"success": True})
+
+        mock_client.return_value.get = AsyncMock(side_effect=get)
+
+        wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: "stale"})
+        results = await asyncio.gather(*(wrapper.curl("/test") for _ in range(20)))
+
+        self.assertEqual(results, [{"success": True}] * 20)
+        self.assertEqual(wrapper.session_cookie, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        cookie_calls = [
+            call
+            for call in mock_client.return_value.get.call_args_list
+            if call.args[0] == "/"
+        ]
+        self.assertEqual(len(cookie_calls), 1)
+
+        await wrapper.curl("/test")
+        self.assertEqual(mock_client.return_value.get.call_count, 42)
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_cookie_store_off_the_event_loop(self, mock_client):
+        """Test the cookie store is accessed from a worker thread on refresh"""
+        threads = set()
+
+        class RecordingStore(SQLiteCookieStore):
+            """SQLite store recording the threads it is accessed from."""
+
+            def _read(self, baseurl, user_agent):
+                threads.add(threading.get_ident())
+                return super()._read(baseurl, user_agent)
+
+            def _write(self, record):
+                threads.add(threading.get_ident())
+                super()._write(record)
+
+        async def get(endpoint, headers=None, **_kwargs):
+            if endpoint == "/":
+                return create_cookie_response()
+            if "stale" in headers["Cookie"]:
+                return create_mock(status_code=401, text="")
+            return create_mock({"success": True})
+
+        mock_client.return_value.get = AsyncMock(side_effect=get)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = RecordingStore(os.path.join(tmp_dir, "cookies.db"))
+            wrapper = AsyncVintedWrapper(
+                BASE_URL, {SESSION_COOKIE_NAME: "stale"}, cookie_store=store
+            )
+            self.assertEqual(await wrapper.curl("/test"), {"success": True})
+
+        self.assertEqual(wrapper.session_cookie, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_auto_renew_cookie(self, mock_client):
+        """Test the session cookie is renewed in background before it expires"""
+        token = create_jwt({"exp": time.time() + COOKIE_RENEWAL_MARGIN + 0.05})
+        mock_client.return_value.get = AsyncMock(
+            side_effect=[create_mock({"success": True}), create_cookie_response()]
+        )
+
+        wrapper = AsyncVintedWrapper(
+            BASE_URL, {SESSION_COOKIE_NAME: token}, auto_renew_cookie=True
+        )
+        self.assertIsNone(wrapper._renewal)
+        await wrapper.curl("/test")
+        self.assertIsNotNone(wrapper._renewal)
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(wrapper.session_cookie, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertEqual(mock_client.return_value.get.call_count, 2)
+        self.assertEqual(mock_client.return_value.get.call_args.args[0], "/")
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_coalesce_requests(self, mock_client):
+        """Test concurrent identical calls share a single request"""
+        response = create_mock({"item": {"id": 1}})
+
+        async def slow_get(*_, **__):
+            await asyncio.sleep(0.01)
+            return response
+
+        mock_client.return_value.get = AsyncMock(side_effect=slow_get)
+        wrapper = AsyncVintedWrapper(
+            BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE}, coalesce_requests=True
+        )
+
+        results = await asyncio.gather(
+            wrapper.search({"page": 1, "order": "newest_first"}),
+            wrapper.search({"order": "newest_first", "page": 1}),
+            wrapper.search({"page": 2}),
+            wrapper.item("1"),
+            wrapper.item("1"),
+        )
+        self.assertEqual(mock_client.return_value.get.call_count, 3)
+        self.assertIs(results[0], results[1])
+        self.assertEqual(wrapper._in_flight, {})
+
+        await wrapper.item("1")
+        self.assertEqual(mock_client.return_value.get.call_count, 4)
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_coalesce_requests_cancel_and_error(self, mock_client):
+        """Test a cancelled caller leaves the shared request to the others"""
+        started = asyncio.Event()
+
+        async def failing_get(*_, **__):
+            started.set()
+            await asyncio.sleep(0.01)
+            return create_mock(status_code=404)
+
+        mock_client.return_value.get = AsyncMock(side_effect=failing_get)
+        wrapper = AsyncVintedWrapper(
+            BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE}, coalesce_requests=True
+        )
+
+        first = asyncio.ensure_future(wrapper.item("1"))
+        second = asyncio.ensure_future(wrapper.item("1"))
+        await started.wait()
+        first.cancel()
+        with self.assertRaises(RuntimeError):
+            await second
+        self.assertTrue(first.cancelled())
+        mock_client.return_value.get.assert_called_once()
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_no_coalescing_by_default(self, mock_client):
+        """Test concurrent identical calls are sent separately by default"""
+        setup_async_mock_get(mock_client, {"item": {}})
+
+        wrapper = AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        await asyncio.gather(wrapper.item("1"), wrapper.item("1"))
+        self.assertEqual(mock_client.return_value.get.call_count, 2)
+
+
 class TestAsyncVintedScraper(unittest.IsolatedAsyncioTestCase):
     """Test AsyncVintedScraper class"""
 
@@ -185,6 +498,22 @@ class TestAsyncVintedScraper(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result[0].id, 1)
         self.assertEqual(result[0].title, "Test")
 
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_aiter_search_returns_vinted_items(self, mock_client):
+        """Test aiter_search yields VintedItem objects"""
+        mock_client.return_value.get = AsyncMock(
+            side_effect=[
+                create_mock({"items": [{"id": 1, "title": "Test"}]}),
+                create_mock({"items": []}),
+            ]
+        )
+
+        scraper = AsyncVintedScraper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        result = [item async for item in scraper.aiter_search()]
+        self.assertEqual(len(result), 1)
+        self.assertIsInstance(result[0], VintedItem)
+        self.assertEqual(result[0].title, "Test")
+
     @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
     async def test_item_returns_vinted_item(self, mock_client):
         """Test item method returns VintedItem object"""
@@ -196,6 +525,16 @@ class TestAsyncVintedScraper(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.title, "Test Item")
         mock_client.return_value.get.assert_called_once()
 
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_item_many_returns_vinted_items(self, mock_client):
+        """Test item_many yields VintedItem objects"""
+        setup_async_mock_get(mock_client, {"item": {"id": 123, "title": "Test Item"}})
+
+        scraper = AsyncVintedScraper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        results = [result async for _, result in scraper.item_many(["1", "2"])]
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(isinstance(result, VintedItem) for result in results))
+
     @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
     async def test_curl_returns_vinted_base(self, mock_client):
         """Test curl method returns VintedJsonModel object"""
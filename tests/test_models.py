@@ -155,6 +155,50 @@ class TestVintedModels(unittest.TestCase):
         self.assertIsNotNone(ctx.exception)
 
 
+class TestVintedLazyModels(unittest.TestCase):
+    """Test suite for the nested models built on first access."""
+
+    def setUp(self):
+        """Set up test fixtures with sample search item data."""
+        self.search_data = read_data_from_file("search_items_dummy").get("items")[0]
+
+    def test_vinted_item_lazy_nested_models(self):
+        """Test nested models are built on first access, then cached."""
+        item = VintedItem(json_data=self.search_data)
+        self.assertNotIn("user", item.__dict__)
+        self.assertNotIn("photos", item.__dict__)
+
+        user = item.user
+        self.assertIsInstance(user, VintedUser)
+        self.assertIs(item.user, user)
+        self.assertNotIn("photo", user.__dict__)
+        self.assertIsInstance(user.photo, VintedImage)
+        self.assertEqual(user.photo.high_resolution.id, "high_resolution_id")
+
+        item.user = None
+        self.assertIsNone(item.user)
+        self.assertEqual(
+            VintedItem(json_data=self.search_data),
+            VintedItem(json_data=self.search_data),
+        )
+
+    def test_vinted_item_nested_models_without_json(self):
+        """Test nested models passed as arguments are kept as is."""
+        user = VintedUser(id=TEST_USER_ID)
+        self.assertIs(VintedItem(user=user).user, user)
+        self.assertIsNone(VintedItem().brand)
+
+    def test_vinted_item_nested_models_with_json(self):
+        """Test nested models passed as arguments win over json_data."""
+        user = VintedUser(id=TEST_USER_ID)
+        self.assertIs(VintedItem(json_data={"id": 1}, user=user).user, user)
+
+        item = VintedItem(json_data={"id": 1, "user": {"id": 2}}, user=user)
+        self.assertIs(item.user, user)
+        self.assertEqual(item.id, 1)
+        self.assertEqual(VintedItem(json_data={"user": {"id": 2}}).user.id, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
 # jscpd:ignore-end
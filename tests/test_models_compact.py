@@ -0,0 +1,106 @@
+# jscpd:ignore-start
+# pylint: disable=duplicate-code
+"""Tests for the compact models."""
+
+import unittest
+from unittest.mock import patch
+
+from src.vinted_scraper.models import (
+    VintedCompactBrand,
+    VintedCompactImage,
+    VintedCompactItem,
+    VintedCompactUser,
+    VintedItem,
+)
+
+from .utils import read_data_from_file
+
+ATTRIBUTES = ("id", "title", "price", "currency", "service_fee", "total_item_price")
+
+
+class TestVintedCompactModels(unittest.TestCase):
+    """Test the compact models match the dataclass models."""
+
+    def setUp(self):
+        """Set up test fixtures with sample item data."""
+        self.data = read_data_from_file("item_dummy").get("item")
+        self.search_data = read_data_from_file("search_items_dummy").get("items")[0]
+
+    def assert_same_item(self, compact, data):
+        """Assert a compact item has the attributes of its VintedItem."""
+        item = VintedItem(json_data=data)
+        for name in ATTRIBUTES:
+            self.assertEqual(getattr(compact, name), getattr(item, name), name)
+        self.assertIsInstance(compact.user, VintedCompactUser)
+        self.assertEqual(compact.user.login, item.user.login)
+        self.assertIsInstance(compact.photos[0], VintedCompactImage)
+        self.assertEqual([p.url for p in compact.photos], [p.url for p in item.photos])
+        self.assertIsInstance(compact.brand, VintedCompactBrand)
+        self.assertEqual(compact.brand.title, item.brand.title)
+
+    def test_item(self):
+        """Test the item details match VintedItem."""
+        self.assert_same_item(VintedCompactItem(self.data), self.data)
+        discounts = VintedCompactItem(self.data).user.bundle_discount.discounts
+        self.assertEqual([d.fraction for d in discounts], [0.0, 0.1, 0.25])
+
+    def test_search_item(self):
+        """Test a search result matches VintedItem."""
+        self.assert_same_item(VintedCompactItem(self.search_data), self.search_data)
+
+    def test_slots(self):
+        """Test the fields are stored in slots, the unknown keys in extra."""
+        item = VintedCompactItem({"id": 1, "unknown": "value"})
+        self.assertFalse(hasattr(item, "__dict__"))
+        self.assertEqual(item.extra, {"unknown": "value"})
+        self.assertEqual(item.unknown, "value")
+        self.assertIsNone(item.description)
+        with self.assertRaises(AttributeError):
+            item.missing  # pylint: disable=pointless-statement,no-member
+
+    def test_keep_json(self):
+        """Test json_data is kept by default and dropped on demand."""
+        self.assertIs(VintedCompactItem(self.data).json_data, self.data)
+        self.assertIs(VintedCompactItem(self.data).user.json_data, self.data["user"])
+
+        item = VintedCompactItem(self.data, keep_json=False)
+        self.assertIsNone(item.json_data)
+        self.assertIsNone(item.user.json_data)
+        self.assertEqual(item["title"], self.data["title"])
+        with self.assertRaises(KeyError):
+            item["missing"]  # pylint: disable=pointless-statement
+
+    def test_derived_keys(self):
+        """Test the photos are built once and their raw data not kept."""
+        built = []
+        init = VintedCompactImage.__init__
+
+        def record_init(image, json_data=None, keep_json=True):
+            built.append(json_data)
+            init(image, json_data, keep_json)
+
+        with patch.object(VintedCompactImage, "__init__", record_init):
+            VintedCompactItem(self.data)
+        photo = self.data["photos"][0]
+        self.assertEqual(sum(data is photo for data in built), 1)
+
+        search_item = VintedCompactItem(self.search_data)
+        self.assertIs(search_item.photo, self.search_data["photo"])
+        search_item = VintedCompactItem(self.search_data, keep_json=False)
+        self.assertNotIn("photo", search_item.extra or {})
+        self.assertFalse(hasattr(search_item, "photo"))
+        self.assertNotIn("brand_dto", VintedCompactItem(self.data, False).extra or {})
+
+    def test_none(self):
+        """Test compact models handle None input gracefully."""
+        item = VintedCompactItem()
+        self.assertIsNone(item.id)
+        self.assertIsNone(item.extra)
+        self.assertIsNone(item["id"])
+        self.assertEqual(item, VintedCompactItem(None))
+        self.assertIn("id=None", repr(item))
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
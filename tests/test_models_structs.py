@@ -0,0 +1,135 @@
+# jscpd:ignore-start
+# pylint: disable=duplicate-code
+"""Tests for the msgspec Struct models."""
+
+import importlib.util
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from src.vinted_scraper import AsyncVintedScraper, VintedScraper
+from src.vinted_scraper.models import VintedItem, get_struct_decoder
+from src.vinted_scraper.utils import SESSION_COOKIE_NAME, ResponseCache
+from tests.utils import BASE_URL, COOKIE_VALUE, create_mock, read_data_from_file
+
+HAS_MSGSPEC = importlib.util.find_spec("msgspec") is not None
+CATALOG = "/api/v2/catalog/items"
+ITEM = "/api/v2/items/1/details"
+ATTRIBUTES = ("id", "title", "price", "currency", "service_fee", "total_item_price")
+
+
+def _decode(endpoint, data):
+    """Decode JSON data with the Struct decoder of an endpoint."""
+    return get_struct_decoder(endpoint)(json.dumps(data).encode())
+
+
+@unittest.skipUnless(HAS_MSGSPEC, "msgspec is not installed")
+class TestStructModels(unittest.TestCase):
+    """Test the Struct models match the dataclass models."""
+
+    def assert_same_item(self, struct, data):
+        """Assert a Struct item has the attributes of its VintedItem."""
+        item = VintedItem(json_data=data)
+        for name in ATTRIBUTES:
+            self.assertEqual(getattr(struct, name), getattr(item, name), name)
+        self.assertEqual(struct.user.login, item.user.login)
+        self.assertEqual(struct.user.photo.url, item.user.photo.url)
+        self.assertEqual([p.url for p in struct.photos], [p.url for p in item.photos])
+        self.assertEqual(struct.brand.title, item.brand.title)
+
+    def test_search(self):
+        """Test a search page is decoded into Struct items."""
+        data = read_data_from_file("search_items_dummy")
+        page = _decode(CATALOG, data)
+        self.assertEqual(len(page["items"]), len(data["items"]))
+        self.assert_same_item(page.items[0], data["items"][0])
+        self.assertEqual(page.items[0].photos[0].thumbnails[0].width, 70)
+
+    def test_item(self):
+        """Test the item details are decoded into a Struct item."""
+        data = read_data_from_file("item_dummy")
+        item = _decode(ITEM, data).item
+        self.assert_same_item(item, data["item"])
+        discounts = item.user.bundle_discount.discounts
+        self.assertEqual([d.fraction for d in discounts], [0.0, 0.1, 0.25])
+        self.assertEqual(item["title"], item.title)
+        with self.assertRaises(KeyError):
+            item["json_data"]  # pylint: disable=pointless-statement
+
+    def test_other_endpoints(self):
+        """Test the endpoints without Struct models have no decoder."""
+        self.assertIsNone(get_struct_decoder("/api/v2/users/1"))
+
+    def test_invalid(self):
+        """Test mistyped responses raise a ValueError."""
+        with self.assertRaises(ValueError):
+            _decode(CATALOG, {"items": "not a list"})
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_scraper(self, mock_client):
+        """Test the scraper returns Struct items, also from the cache."""
+        data = read_data_from_file("search_items_dummy")
+        mock_client.return_value.get.return_value = create_mock(data)
+        scraper = VintedScraper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            response_cache=ResponseCache(),
+            struct_models=True,
+        )
+
+        items = scraper.search()
+        cached = scraper.search()
+        self.assertEqual(mock_client.return_value.get.call_count, 1)
+        self.assertEqual(items, cached)
+        self.assertFalse(isinstance(items[0], VintedItem))
+        self.assert_same_item(items[0], data["items"][0])
+
+        mock_client.return_value.get.return_value = create_mock({"user": {"id": 1}})
+        self.assertEqual(scraper.curl("/api/v2/users/1")["user"], {"id": 1})
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_scraper_invalid(self, mock_client):
+        """Test mistyped responses raise a RuntimeError like invalid JSON."""
+        mock_client.return_value.get.return_value = create_mock({"items": 1})
+        scraper = VintedScraper(
+            BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE}, struct_models=True
+        )
+        with self.assertRaises(RuntimeError), self.assertLogs(level="ERROR"):
+            scraper.search()
+
+
+@unittest.skipUnless(HAS_MSGSPEC, "msgspec is not installed")
+class TestAsyncStructModels(unittest.IsolatedAsyncioTestCase):
+    """Test the Struct models in the async scraper."""
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_item(self, mock_client):
+        """Test the async scraper returns a Struct item."""
+        data = read_data_from_file("item_dummy")
+        mock_client.return_value.get = AsyncMock(return_value=create_mock(data))
+        scraper = AsyncVintedScraper(
+            BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE}, struct_models=True
+        )
+
+        item = await scraper.item("1")
+        self.assertFalse(isinstance(item, VintedItem))
+        self.assertEqual(item.price, VintedItem(json_data=data["item"]).price)
+
+
+class TestStructModelsMissing(unittest.TestCase):
+    """Test the Struct models without msgspec."""
+
+    @patch(
+        "src.vinted_scraper._base_scraper.get_struct_decoder", side_effect=ImportError
+    )
+    def test_scraper(self, _):
+        """Test struct_models fails early without msgspec."""
+        with self.assertRaises(ImportError):
+            VintedScraper(
+                BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE}, struct_models=True
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
@@ -0,0 +1,83 @@
+# jscpd:ignore-start
+# pylint: disable=duplicate-code
+"""Tests for the view models."""
+
+import copy
+import pickle
+import unittest
+
+from src.vinted_scraper.models import (
+    VintedBrandView,
+    VintedImageView,
+    VintedItem,
+    VintedItemView,
+    VintedUserView,
+)
+
+from .utils import read_data_from_file
+
+ATTRIBUTES = ("id", "title", "price", "currency", "service_fee", "total_item_price")
+
+
+class TestVintedViewModels(unittest.TestCase):
+    """Test the view models match the dataclass models."""
+
+    def setUp(self):
+        """Set up test fixtures with sample item data."""
+        self.data = read_data_from_file("item_dummy").get("item")
+        self.search_data = read_data_from_file("search_items_dummy").get("items")[0]
+
+    def assert_same_item(self, view, data):
+        """Assert an item view has the attributes of its VintedItem."""
+        item = VintedItem(json_data=data)
+        for name in ATTRIBUTES:
+            self.assertEqual(getattr(view, name), getattr(item, name), name)
+        self.assertIsInstance(view.user, VintedUserView)
+        self.assertEqual(view.user.login, item.user.login)
+        self.assertIsInstance(view.photos[0], VintedImageView)
+        self.assertEqual([p.url for p in view.photos], [p.url for p in item.photos])
+        self.assertIsInstance(view.brand, VintedBrandView)
+        self.assertEqual(view.brand.title, item.brand.title)
+
+    def test_item(self):
+        """Test the item details match VintedItem."""
+        self.assert_same_item(VintedItemView(self.data), self.data)
+        discounts = VintedItemView(self.data).user.bundle_discount.discounts
+        self.assertEqual([d.fraction for d in discounts], [0.0, 0.1, 0.25])
+
+    def test_search_item(self):
+        """Test a search result matches VintedItem."""
+        self.assert_same_item(VintedItemView(self.search_data), self.search_data)
+
+    def test_zero_copy(self):
+        """Test the attributes are read from json_data, nested views cached."""
+        view = VintedItemView(self.search_data)
+        self.assertFalse(hasattr(view, "__dict__"))
+        self.assertIs(view.json_data, self.search_data)
+        self.assertIs(view.url, self.search_data["url"])
+        self.assertIs(view.user, view.user)
+        self.assertIs(view.user.json_data, self.search_data["user"])
+        self.assertIs(view.photo, self.search_data["photo"])
+        self.assertIsNone(view.description)
+        with self.assertRaises(AttributeError):
+            view.missing  # pylint: disable=pointless-statement,no-member
+
+    def test_read_only(self):
+        """Test the attributes cannot be assigned."""
+        view = VintedItemView(self.data)
+        with self.assertRaises(AttributeError):
+            view.title = "title"
+
+    def test_subscript_and_copy(self):
+        """Test subscript access, equality, copy and pickling."""
+        view = VintedItemView(self.data)
+        self.assertEqual(view["title"], self.data["title"])
+        with self.assertRaises(KeyError):
+            view["missing"]  # pylint: disable=pointless-statement
+        self.assertEqual(copy.deepcopy(view), view)
+        self.assertEqual(pickle.loads(pickle.dumps(view)).price, view.price)
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
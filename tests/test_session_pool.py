@@ -0,0 +1,172 @@
+# jscpd:ignore-start
+# pylint: disable=protected-access,duplicate-code
+"""
+Test the session pools
+"""
+
+import logging
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from src.vinted_scraper import (
+    AsyncSessionPool,
+    AsyncVintedScraper,
+    SessionPool,
+    VintedWrapper,
+)
+from src.vinted_scraper.models import VintedItem
+from src.vinted_scraper.utils import SESSION_COOKIE_NAME, VintedApiError
+from tests.utils import BASE_URL, COOKIE_VALUE, create_cookie_response, create_mock
+
+POOL_LOGGER = "src.vinted_scraper._session_pool"
+
+
+def create_wrapper(result=None, error=None):
+    """Create a mock identity returning ``result`` or raising ``error``"""
+    wrapper = MagicMock()
+    wrapper.curl.return_value = result
+    wrapper.curl.side_effect = error
+    return wrapper
+
+
+class TestSessionPool(unittest.TestCase):
+    """Test the SessionPool class"""
+
+    def test_invalid_pool(self):
+        """Test an unknown policy or an empty pool are rejected"""
+        with self.assertRaises(ValueError):
+            SessionPool([create_wrapper()], policy="random")
+        with self.assertRaises(ValueError):
+            SessionPool([])
+
+    def test_round_robin(self):
+        """Test requests are dispatched in turn across the identities"""
+        wrappers = [create_wrapper(i) for i in range(3)]
+        pool = SessionPool(wrappers)
+
+        results = [pool.curl("/test") for _ in range(6)]
+        self.assertEqual(results, [0, 1, 2, 0, 1, 2])
+
+    def test_least_loaded(self):
+        """Test requests go to the identity with the fewest requests in flight"""
+        wrappers = [create_wrapper(i) for i in range(3)]
+        pool = SessionPool(wrappers, policy="least_loaded")
+        busy = pool._acquire()
+
+        self.assertIs(busy.wrapper, wrappers[0])
+        self.assertEqual(pool.curl("/test"), 1)
+        self.assertEqual(pool.curl("/test"), 1)
+        pool._release(busy, failed=False)
+        self.assertEqual(pool.curl("/test"), 0)
+
+    def test_failing_identity_is_retired(self):
+        """Test an identity is retired after max_failures consecutive failures"""
+        failing = create_wrapper(error=VintedApiError("/test", 403))
+        healthy = create_wrapper("ok")
+        pool = SessionPool([failing, healthy], max_failures=2)
+
+        results = []
+        with self.assertLogs(POOL_LOGGER, logging.WARNING):
+            for _ in range(6):
+                try:
+                    results.append(pool.curl("/test"))
+                except VintedApiError as e:
+                    results.append(e.status_code)
+
+        self.assertEqual(results, [403, "ok", 403, "ok", "ok", "ok"])
+        self.assertEqual(pool.active, [healthy])
+        failing.__exit__.assert_called_once_with(None, None, None)
+
+        healthy.curl.side_effect = httpx.ConnectError("refused")
+        with self.assertLogs(POOL_LOGGER, logging.WARNING):
+            for _ in range(2):
+                with self.assertRaises(httpx.ConnectError):
+                    pool.curl("/test")
+        with self.assertRaises(RuntimeError) as ctx:
+            pool.curl("/test")
+        self.assertIn("retired", str(ctx.exception))
+
+    def test_other_errors_keep_identity(self):
+        """Test errors not caused by the identity, e.g. a 404, don't retire it"""
+        wrapper = create_wrapper(error=VintedApiError("/test", 404))
+        pool = SessionPool([wrapper], max_failures=2)
+
+        for _ in range(4):
+            with self.assertRaises(VintedApiError):
+                pool.curl("/test")
+        self.assertEqual(pool.active, [wrapper])
+        wrapper.__exit__.assert_not_called()
+
+    def test_close_skips_closed_identities(self):
+        """Test leaving the pool doesn't close retired identities twice"""
+        failing = create_wrapper(error=VintedApiError("/test", 401))
+        healthy = create_wrapper("ok")
+
+        with SessionPool([failing, healthy], max_failures=1) as pool:
+            with self.assertLogs(POOL_LOGGER, logging.WARNING):
+                with self.assertRaises(VintedApiError):
+                    pool.curl("/test")
+        failing.__exit__.assert_called_once()
+        healthy.__exit__.assert_called_once()
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_build(self, mock_client):
+        """Test build creates identities with their own user agent and config"""
+        mock_client.return_value.get.return_value = create_cookie_response()
+        configs = [{"proxy": "http://proxy-1"}, {"proxy": "http://proxy-2"}]
+
+        with SessionPool.build(BASE_URL, 3, configs=configs) as pool:
+            self.assertEqual(len(pool.wrappers), 3)
+            self.assertTrue(all(isinstance(w, VintedWrapper) for w in pool.wrappers))
+            self.assertEqual(
+                [w.config for w in pool.wrappers], [configs[0], configs[1], configs[0]]
+            )
+            self.assertEqual(
+                pool.wrappers[0].session_cookie, {SESSION_COOKIE_NAME: COOKIE_VALUE}
+            )
+        self.assertEqual(mock_client.return_value.close.call_count, 3)
+
+
+class TestAsyncSessionPool(unittest.IsolatedAsyncioTestCase):
+    """Test the AsyncSessionPool class"""
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_create(self, mock_client):
+        """Test create fetches a cookie for every identity and dispatches calls"""
+        mock_client.return_value.get = AsyncMock(
+            side_effect=[create_cookie_response()] * 2
+            + [create_mock({"item": {"id": 1}})] * 2
+        )
+
+        pool = await AsyncSessionPool.create(
+            BASE_URL, 2, wrapper_cls=AsyncVintedScraper
+        )
+        self.assertTrue(all(w.session_cookie for w in pool.wrappers))
+
+        items = [await pool.item("1"), await pool.item("1")]
+        self.assertTrue(all(isinstance(item, VintedItem) for item in items))
+        self.assertEqual(mock_client.return_value.get.call_count, 4)
+
+    async def test_failing_identity_is_retired(self):
+        """Test an identity is retired after max_failures consecutive failures"""
+        failing = MagicMock()
+        failing.search = AsyncMock(side_effect=VintedApiError("/test", 429))
+        failing.__aexit__ = AsyncMock()
+        healthy = MagicMock()
+        healthy.search = AsyncMock(return_value={"items": []})
+        pool = AsyncSessionPool([failing, healthy], max_failures=1)
+
+        with self.assertLogs(POOL_LOGGER, logging.WARNING):
+            with self.assertRaises(VintedApiError):
+                await pool.search()
+        self.assertEqual(await pool.search(), {"items": []})
+        self.assertEqual(await pool.search(), {"items": []})
+        self.assertEqual(pool.active, [healthy])
+        failing.__aexit__.assert_awaited_once_with(None, None, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
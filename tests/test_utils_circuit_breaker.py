@@ -0,0 +1,163 @@
+# jscpd:ignore-start
+# pylint: disable=duplicate-code
+"""Tests for the circuit breaker."""
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from src.vinted_scraper import AsyncVintedWrapper, VintedWrapper
+from src.vinted_scraper.utils import (
+    SESSION_COOKIE_NAME,
+    CircuitBreaker,
+    CircuitOpenError,
+    VintedApiError,
+    is_service_failure,
+)
+from tests.utils import BASE_URL, COOKIE_VALUE, create_mock
+
+ITEM = "/api/v2/items/{}/details"
+CATALOG = "/api/v2/catalog/items"
+
+
+def call(breaker, endpoint, failed):
+    """Run a call through the breaker and record its outcome"""
+    breaker.acquire(endpoint)
+    breaker.record(endpoint, failed)
+
+
+@patch("src.vinted_scraper.utils._circuit_breaker.time.monotonic", return_value=0.0)
+class TestCircuitBreaker(unittest.TestCase):
+    """Test the CircuitBreaker class."""
+
+    def test_invalid_breaker(self, _):
+        """Test invalid rates, windows and probe counts are rejected."""
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_rate=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(window=5, min_requests=10)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(half_open_probes=0)
+
+    def test_opens_on_failure_rate(self, _):
+        """Test the circuit opens once the failure rate reaches the threshold."""
+        breaker = CircuitBreaker(failure_rate=0.5, window=4, min_requests=4)
+        for failed in (True, False, True):
+            call(breaker, ITEM.format(1), failed)
+        self.assertEqual(breaker.state(ITEM.format(2)), "closed")
+
+        call(breaker, ITEM.format(3), False)
+        self.assertEqual(breaker.state(ITEM.format(4)), "open")
+        with self.assertRaises(CircuitOpenError) as ctx:
+            breaker.acquire(ITEM.format(5))
+        self.assertEqual(ctx.exception.endpoint, "/api/v2/items/{id}/details")
+        self.assertEqual(ctx.exception.retry_after, 30.0)
+        self.assertIsInstance(ctx.exception, RuntimeError)
+
+        # Other endpoint families are not affected
+        call(breaker, CATALOG, False)
+        self.assertEqual(
+            breaker.states,
+            {"/api/v2/items/{id}/details": "open", CATALOG: "closed"},
+        )
+
+    def test_half_open(self, mock_monotonic):
+        """Test probes close the circuit on success and reopen it on failure."""
+        breaker = CircuitBreaker(
+            window=2, min_requests=2, reset_timeout=10, half_open_probes=2
+        )
+        call(breaker, CATALOG, True)
+        call(breaker, CATALOG, True)
+        self.assertEqual(breaker.state(CATALOG), "open")
+
+        mock_monotonic.return_value = 10.0
+        self.assertEqual(breaker.state(CATALOG), "half_open")
+        breaker.acquire(CATALOG)
+        breaker.acquire(CATALOG)
+        with self.assertRaises(CircuitOpenError):
+            breaker.acquire(CATALOG)
+        breaker.record(CATALOG, failed=True)
+        breaker.record(CATALOG, failed=False)
+        self.assertEqual(breaker.state(CATALOG), "open")
+
+        mock_monotonic.return_value = 20.0
+        breaker.acquire(CATALOG)
+        breaker.release(CATALOG)
+        call(breaker, CATALOG, False)
+        self.assertEqual(breaker.state(CATALOG), "half_open")
+        call(breaker, CATALOG, False)
+        self.assertEqual(breaker.state(CATALOG), "closed")
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_wrapper(self, mock_client, _):
+        """Test the wrapper fails fast without calling a blocked endpoint."""
+        mock_client.return_value.get.return_value = create_mock(status_code=403)
+        wrapper = VintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            circuit_breaker=CircuitBreaker(window=2, min_requests=2),
+        )
+
+        for item_id in ("1", "2"):
+            with self.assertRaises(RuntimeError) as ctx:
+                wrapper.item(item_id)
+            self.assertIn("403", str(ctx.exception))
+        with self.assertRaises(CircuitOpenError):
+            wrapper.item("3")
+        self.assertEqual(mock_client.return_value.get.call_count, 2)
+
+        mock_client.return_value.get.return_value = create_mock({"items": []})
+        self.assertEqual(wrapper.search(), {"items": []})
+
+    def test_is_service_failure(self, _):
+        """Test only 403, 429, 5xx and transport errors are service failures."""
+        for status, expected in ((403, True), (429, True), (503, True), (404, False)):
+            error = VintedApiError(CATALOG, status)
+            self.assertEqual(is_service_failure(error), expected, status)
+        self.assertTrue(is_service_failure(httpx.ConnectError("refused")))
+        self.assertFalse(is_service_failure(RuntimeError("Invalid JSON")))
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_client_errors_ignored(self, mock_client, _):
+        """Test repeated 404s of deleted items leave the circuit closed."""
+        mock_client.return_value.get.return_value = create_mock(status_code=404)
+        wrapper = VintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            circuit_breaker=CircuitBreaker(window=2, min_requests=2),
+        )
+
+        for item_id in ("1", "2", "3", "4"):
+            with self.assertRaises(VintedApiError) as ctx:
+                wrapper.item(item_id)
+            self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(wrapper.circuit_breaker.state(ITEM.format(1)), "closed")
+        self.assertEqual(mock_client.return_value.get.call_count, 4)
+
+
+class TestAsyncCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    """Test the circuit breaker in the async wrapper."""
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_wrapper(self, mock_client):
+        """Test the async wrapper fails fast without calling a blocked endpoint."""
+        mock_client.return_value.get = AsyncMock(
+            return_value=create_mock(status_code=403)
+        )
+        wrapper = AsyncVintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            circuit_breaker=CircuitBreaker(window=1, min_requests=1),
+        )
+
+        with self.assertRaises(RuntimeError):
+            await wrapper.item("1")
+        with self.assertRaises(CircuitOpenError):
+            await wrapper.item("2")
+        self.assertEqual(mock_client.return_value.get.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
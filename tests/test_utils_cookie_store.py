@@ -0,0 +1,185 @@
+# jscpd:ignore-start
+# pylint: disable=duplicate-code,consider-using-with
+"""Tests for the persistent cookie stores."""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from src.vinted_scraper import VintedWrapper
+from src.vinted_scraper.utils import (
+    SESSION_COOKIE_NAME,
+    FileCookieStore,
+    SQLiteCookieStore,
+)
+from tests.utils import (
+    BASE_URL,
+    COOKIE_VALUE,
+    USER_AGENT,
+    create_cookie_response,
+    create_jwt,
+    create_mock,
+)
+
+
+class StoreTestCase(unittest.TestCase):
+    """Base test case giving each test a temporary store path."""
+
+    def setUp(self):
+        """Create a temporary directory for the store files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "cookies")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+
+class CookieStoreTestMixin:
+    """Tests shared by every cookie store backend."""
+
+    def create_store(self, path, **kwargs):
+        """Create the store under test."""
+        raise NotImplementedError
+
+    def test_save_and_load(self):
+        """Test a saved cookie is loaded by base URL and user agent."""
+        store = self.create_store(self.path)
+        store.save(BASE_URL, USER_AGENT, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+
+        record = self.create_store(self.path).load(BASE_URL, USER_AGENT)
+        self.assertEqual(record.cookies, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertEqual(record.user_agent, USER_AGENT)
+        self.assertAlmostEqual(record.expires_at, time.time() + store.ttl, delta=5)
+
+        self.assertIsNone(store.load(BASE_URL, "another agent"))
+        self.assertIsNone(store.load("https://www.vinted.it", USER_AGENT))
+        self.assertEqual(store.load(BASE_URL, None).user_agent, USER_AGENT)
+
+    def test_save_replaces_previous_cookie(self):
+        """Test saving again for the same key replaces the cookie."""
+        store = self.create_store(self.path)
+        store.save(BASE_URL, USER_AGENT, {SESSION_COOKIE_NAME: "old"})
+        store.save(BASE_URL, USER_AGENT, {SESSION_COOKIE_NAME: "new"})
+        self.assertEqual(
+            store.load(BASE_URL, USER_AGENT).cookies, {SESSION_COOKIE_NAME: "new"}
+        )
+
+    def test_expiry(self):
+        """Test the token expiry or the ttl is honoured."""
+        store = self.create_store(self.path, ttl=0)
+        store.save(BASE_URL, USER_AGENT, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertIsNone(store.load(BASE_URL, USER_AGENT))
+
+        token = create_jwt({"exp": time.time() + 3600})
+        store.save(BASE_URL, USER_AGENT, {SESSION_COOKIE_NAME: token})
+        self.assertEqual(
+            store.load(BASE_URL, USER_AGENT).cookies, {SESSION_COOKIE_NAME: token}
+        )
+
+        token = create_jwt({"exp": time.time() + 1})
+        store.save(BASE_URL, USER_AGENT, {SESSION_COOKIE_NAME: token})
+        self.assertIsNone(store.load(BASE_URL, USER_AGENT))
+
+
+class TestFileCookieStore(CookieStoreTestMixin, StoreTestCase):
+    """Test the FileCookieStore class."""
+
+    def create_store(self, path, **kwargs):
+        return FileCookieStore(f"{path}.json", **kwargs)
+
+    def test_corrupted_file(self):
+        """Test a corrupted file is treated as empty."""
+        with open(f"{self.path}.json", "w", encoding="utf-8") as file:
+            file.write("not json")
+        store = self.create_store(self.path)
+        self.assertIsNone(store.load(BASE_URL, USER_AGENT))
+        store.save(BASE_URL, USER_AGENT, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertIsNotNone(store.load(BASE_URL, USER_AGENT))
+
+    def test_malformed_entries(self):
+        """Test malformed entries are skipped and dropped on the next save."""
+        valid = {
+            "baseurl": BASE_URL,
+            "user_agent": USER_AGENT,
+            "cookies": {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            "expires_at": time.time() + 3600,
+        }
+        data = {
+            "valid": valid,
+            "missing": {"baseurl": BASE_URL, "user_agent": USER_AGENT},
+            "unknown": dict(valid, other=1),
+            "types": dict(valid, expires_at="soon"),
+            "list": [BASE_URL],
+        }
+        with open(f"{self.path}.json", "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+        store = self.create_store(self.path)
+        self.assertEqual(
+            store.load(BASE_URL, None).cookies, {SESSION_COOKIE_NAME: COOKIE_VALUE}
+        )
+        store.save(BASE_URL, "another agent", {SESSION_COOKIE_NAME: "new"})
+        with open(f"{self.path}.json", "r", encoding="utf-8") as file:
+            self.assertEqual(len(json.load(file)), 2)
+
+
+class TestSQLiteCookieStore(CookieStoreTestMixin, StoreTestCase):
+    """Test the SQLiteCookieStore class."""
+
+    def create_store(self, path, **kwargs):
+        return SQLiteCookieStore(f"{path}.db", **kwargs)
+
+
+class TestWrapperCookieStore(unittest.TestCase):
+    """Test the wrappers consult and update the cookie store."""
+
+    def setUp(self):
+        """Create a temporary cookie store."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = FileCookieStore(os.path.join(self.tmp_dir.name, "cookies.json"))
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_fetched_cookie_is_shared(self, mock_client):
+        """Test a second wrapper reuses the cookie fetched by the first one."""
+        mock_client.return_value.get.return_value = create_cookie_response()
+
+        wrapper = VintedWrapper(BASE_URL, cookie_store=self.store)
+        self.assertEqual(wrapper.session_cookie, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        mock_client.return_value.get.assert_called_once()
+
+        other = VintedWrapper(BASE_URL, cookie_store=self.store)
+        self.assertEqual(other.session_cookie, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertEqual(other.user_agent, wrapper.user_agent)
+        mock_client.return_value.get.assert_called_once()
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_401_uses_cookie_refreshed_elsewhere(self, mock_client):
+        """Test a 401 adopts a newer stored cookie instead of fetching one."""
+        mock_client.return_value.get.side_effect = [
+            create_mock(status_code=401, text=""),
+            create_mock({"success": True}),
+        ]
+        wrapper = VintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: "stale"},
+            USER_AGENT,
+            cookie_store=self.store,
+        )
+        self.store.save(BASE_URL, USER_AGENT, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+
+        self.assertEqual(wrapper.curl("/test"), {"success": True})
+        self.assertEqual(wrapper.session_cookie, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertEqual(mock_client.return_value.get.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
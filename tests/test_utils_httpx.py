@@ -3,16 +3,41 @@
 """Tests for httpx utility functions."""
 
 import unittest
+from unittest.mock import patch
 
 import httpx
+from src.vinted_scraper import AsyncVintedWrapper, VintedWrapper
 from src.vinted_scraper.utils import (
+    ASYNC_CLIENT_OPTIONS,
     SESSION_COOKIE_NAME,
+    ClientOptions,
+    borrow_transport,
     extract_cookie_from_response,
     get_httpx_config,
 )
 from tests.utils._mock import BASE_URL, COOKIE_VALUE, USER_AGENT
 
 
+class ClosingMockTransport(httpx.MockTransport):
+    """Mock transport recording the hosts called and whether it was closed."""
+
+    def __init__(self):
+        super().__init__(self.respond)
+        self.hosts = []
+        self.closed = False
+
+    def respond(self, request):
+        """Answer every request with an empty JSON object."""
+        self.hosts.append(request.url.host)
+        return httpx.Response(200, json={})
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
 class TestHttpxUtils(unittest.TestCase):
     """Test suite for httpx utility functions."""
 
@@ -37,6 +62,113 @@ class TestHttpxUtils(unittest.TestCase):
         self.assertEqual(overridden_config["timeout"], config["timeout"])
         self.assertTrue(overridden_config["follow_redirects"])
 
+    def test_get_httpx_config_options(self):
+        """Test the client options set the limits and per-phase timeouts."""
+        options = ClientOptions(
+            max_connections=50,
+            max_keepalive_connections=10,
+            keepalive_expiry=20.0,
+            timeout=5.0,
+            connect_timeout=2.0,
+            pool_timeout=None,
+        )
+        config = get_httpx_config(BASE_URL, options=options)
+        self.assertFalse(config["http2"])
+        self.assertEqual(
+            config["limits"],
+            httpx.Limits(
+                max_connections=50, max_keepalive_connections=10, keepalive_expiry=20.0
+            ),
+        )
+        self.assertEqual(
+            config["timeout"], httpx.Timeout(5.0, connect=2.0, read=5.0, pool=5.0)
+        )
+        # The custom config wins over the options
+        config = get_httpx_config(BASE_URL, {"timeout": 1.0}, options)
+        self.assertEqual(config["timeout"], 1.0)
+        self.assertEqual(ClientOptions().to_httpx()["timeout"], httpx.Timeout(10.0))
+
+    def test_client_options_validation(self):
+        """Test invalid client options are rejected."""
+        for kwargs in (
+            {"max_connections": 0},
+            {"max_connections": 10, "max_keepalive_connections": 20},
+            {"keepalive_expiry": -1},
+            {"read_timeout": -1},
+        ):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    ClientOptions(**kwargs)
+        ClientOptions(max_connections=None, max_keepalive_connections=None)
+
+        with patch(
+            "src.vinted_scraper.utils._httpx.importlib.util.find_spec",
+            return_value=None,
+        ):
+            with self.assertRaises(ImportError):
+                ClientOptions(http2=True)
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_wrapper_client_options(self, mock_client, mock_async_client):
+        """Test the wrappers build their client with their default options."""
+        VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertEqual(
+            mock_client.call_args.kwargs["limits"], ClientOptions().to_httpx()["limits"]
+        )
+        AsyncVintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertEqual(
+            mock_async_client.call_args.kwargs["limits"],
+            ASYNC_CLIENT_OPTIONS.to_httpx()["limits"],
+        )
+        options = ClientOptions(max_connections=1, max_keepalive_connections=1)
+        VintedWrapper(
+            BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE}, client_options=options
+        )
+        self.assertEqual(mock_client.call_args.kwargs["limits"].max_connections, 1)
+
+    def test_shared_transport(self):
+        """Test wrappers share a transport without closing it."""
+        transport = ClosingMockTransport()
+        cookie = {SESSION_COOKIE_NAME: COOKIE_VALUE}
+        with VintedWrapper(BASE_URL, cookie, transport=transport) as wrapper:
+            wrapper.search()
+            with VintedWrapper(
+                "https://www.vinted.fr", cookie, transport=transport
+            ) as other:
+                other.search()
+            self.assertFalse(transport.closed)
+            wrapper.search()
+
+        self.assertFalse(transport.closed)
+        host = httpx.URL(BASE_URL).host
+        self.assertEqual(transport.hosts, [host, "www.vinted.fr", host])
+        borrow_transport(transport).close()
+        self.assertFalse(transport.closed)
+
+    def test_transport_type_mismatch(self):
+        """Test a wrapper rejects a transport of the other flavour."""
+        cookie = {SESSION_COOKIE_NAME: COOKIE_VALUE}
+        sync_transport = httpx.HTTPTransport()
+        async_transport = httpx.AsyncHTTPTransport()
+        for transport in (async_transport, borrow_transport(async_transport)):
+            with self.assertRaises(TypeError) as ctx:
+                VintedWrapper(BASE_URL, cookie, transport=transport)
+            self.assertIn("httpx.BaseTransport", str(ctx.exception))
+        for transport in (sync_transport, borrow_transport(sync_transport)):
+            with self.assertRaises(TypeError) as ctx:
+                AsyncVintedWrapper(BASE_URL, cookie, transport=transport)
+            self.assertIn("httpx.AsyncBaseTransport", str(ctx.exception))
+        sync_transport.close()
+
+    def test_client_options_transport(self):
+        """Test the client options build transports with their pool limits."""
+        options = ClientOptions(max_connections=5, max_keepalive_connections=2)
+        transport = options.transport()
+        self.assertEqual(transport._pool._max_connections, 5)
+        transport.close()
+        self.assertIsInstance(options.async_transport(), httpx.AsyncHTTPTransport)
+
     def test_extract_cookie_from_response(self):
         """Test extract_cookie_from_response correctly extracts cookies from httpx response."""
         # set the request parameter, without that, res.raise_for_status() will fail
@@ -80,6 +212,19 @@ class TestHttpxUtils(unittest.TestCase):
         self.assertEqual(result["another_cookie"], "another_value")
 
 
+class TestAsyncSharedTransport(unittest.IsolatedAsyncioTestCase):
+    """Test the async wrappers with a shared transport."""
+
+    async def test_shared_transport(self):
+        """Test closing an async wrapper leaves the shared transport open."""
+        transport = ClosingMockTransport()
+        cookie = {SESSION_COOKIE_NAME: COOKIE_VALUE}
+        async with AsyncVintedWrapper(BASE_URL, cookie, transport=transport) as w:
+            self.assertEqual(await w.search(), {})
+        self.assertFalse(transport.closed)
+        self.assertEqual(transport.hosts, [httpx.URL(BASE_URL).host])
+
+
 if __name__ == "__main__":
     unittest.main()
 # jscpd:ignore-end
@@ -0,0 +1,99 @@
+# jscpd:ignore-start
+# pylint: disable=duplicate-code
+"""Tests for the JSON decoding backends."""
+
+import json
+import sys
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.vinted_scraper import VintedWrapper
+from src.vinted_scraper.utils import SESSION_COOKIE_NAME, get_json_decoder
+from tests.utils import BASE_URL, COOKIE_VALUE, setup_mock_get
+
+
+def create_fake_msgspec():
+    """Create a fake msgspec module decoding with the stdlib"""
+
+    class DecodeError(ValueError):
+        """Fake msgspec.DecodeError, a ValueError like the real one"""
+
+    def decode(data):
+        try:
+            return json.loads(data)
+        except ValueError as e:
+            raise DecodeError(str(e)) from e
+
+    module = types.ModuleType("msgspec")
+    module.DecodeError = DecodeError
+    module.json = types.SimpleNamespace(
+        Decoder=MagicMock(return_value=types.SimpleNamespace(decode=decode))
+    )
+    return module
+
+
+class TestJsonDecoder(unittest.TestCase):
+    """Test the get_json_decoder function."""
+
+    def setUp(self):
+        get_json_decoder.cache_clear()
+
+    def tearDown(self):
+        get_json_decoder.cache_clear()
+
+    def test_stdlib_fallback(self):
+        """Test the stdlib decodes bytes when no faster backend is installed."""
+        with patch(
+            "src.vinted_scraper.utils._json.importlib.util.find_spec",
+            return_value=None,
+        ):
+            decoder = get_json_decoder()
+        self.assertIs(decoder, json.loads)
+        self.assertEqual(decoder(b'{"items": [1]}'), {"items": [1]})
+        with self.assertRaises(ValueError):
+            decoder(b"invalid")
+
+    def test_preferred_backend(self):
+        """Test orjson is preferred, then msgspec."""
+        orjson = types.ModuleType("orjson")
+        orjson.loads = json.loads
+        with patch.dict(sys.modules, {"orjson": orjson}), patch(
+            "src.vinted_scraper.utils._json.importlib.util.find_spec",
+            side_effect=lambda name: name in ("orjson", "msgspec") or None,
+        ):
+            self.assertIs(get_json_decoder(), json.loads)
+
+    def test_msgspec_errors(self):
+        """Test msgspec decoding errors are raised as ValueError."""
+        with patch.dict(sys.modules, {"msgspec": create_fake_msgspec()}):
+            decoder = get_json_decoder("msgspec")
+        self.assertEqual(decoder(b"[1, 2]"), [1, 2])
+        with self.assertRaises(ValueError):
+            decoder(b"invalid")
+
+    def test_invalid_backend(self):
+        """Test unknown and missing backends are rejected."""
+        with self.assertRaises(ValueError):
+            get_json_decoder("yaml")
+        with patch.dict(sys.modules, {"orjson": None}):
+            with self.assertRaises(ImportError):
+                get_json_decoder("orjson")
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_wrapper_decoder(self, mock_client):
+        """Test the wrapper decodes the raw response bytes with its decoder."""
+        setup_mock_get(mock_client, {"items": []})
+        decoder = MagicMock(return_value={"decoded": True})
+
+        wrapper = VintedWrapper(
+            BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE}, json_decoder=decoder
+        )
+        self.assertEqual(wrapper.search(), {"decoded": True})
+        decoder.assert_called_once_with(b'{"items": []}')
+        mock_client.return_value.get.return_value.json.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
@@ -8,21 +8,37 @@ import logging
 import unittest
 
 from src.vinted_scraper.utils import (
+    log_circuit_state,
     log_constructor,
     log_cookie_fetch_failed,
     log_cookie_fetched,
+    log_cookie_renewal,
     log_cookie_retry,
     log_curl_request,
     log_curl_response,
     log_interaction,
     log_item,
+    log_proxy_quarantined,
     log_refresh_cookie,
+    log_retry,
     log_search,
     log_sleep,
 )
 from tests.utils import BASE_URL, COOKIE_VALUE, USER_AGENT, assert_no_logs
 
 
+class Unformattable:
+    """Argument failing the test as soon as a log message formats it"""
+
+    def __str__(self):
+        raise AssertionError("Log argument formatted with DEBUG disabled")
+
+    __repr__ = __format__ = __str__
+
+    def __getitem__(self, key):
+        raise AssertionError("Log argument sliced with DEBUG disabled")
+
+
 class TestLogUtils(unittest.TestCase):
     """
     Test the log utils class print a correct log in DEBUG mode and no log on INFO
@@ -368,6 +384,81 @@ class TestLogUtils(unittest.TestCase):
             status_code=status_code,
         )
 
+    def test_log_cookie_renewal(self):
+        """
+        Test the log_cookie_renewal function.
+        """
+        log = self.logger
+
+        with self.assertLogs(level=logging.DEBUG) as cm:
+            log_cookie_renewal(log=log, delay=42.4)
+            self.assertIn("renewal scheduled in 42 seconds", cm.output[0])
+
+        assert_no_logs(
+            log_cookie_renewal, self, log=log, level=logging.INFO, delay=42.4
+        )
+
+    def test_log_retry(self):
+        """
+        Test the log_retry function.
+        """
+        log = self.logger
+
+        with self.assertLogs(level=logging.DEBUG) as cm:
+            log_retry(log=log, reason="429", attempt=0, delay=1.5)
+            self.assertIn(
+                "failed (429) on attempt 1, retrying in 1.50 seconds", cm.output[0]
+            )
+
+        assert_no_logs(
+            log_retry,
+            self,
+            log=log,
+            level=logging.INFO,
+            reason="429",
+            attempt=0,
+            delay=1.5,
+        )
+
+    def test_log_circuit_state(self):
+        """
+        Test the log_circuit_state function.
+        """
+        log = self.logger
+
+        with self.assertLogs(level=logging.DEBUG) as cm:
+            log_circuit_state(log=log, endpoint="/api/v2/catalog/items", state="open")
+            self.assertIn("/api/v2/catalog/items is now open", cm.output[0])
+
+        assert_no_logs(
+            log_circuit_state,
+            self,
+            log=log,
+            level=logging.INFO,
+            endpoint="/api/v2/catalog/items",
+            state="open",
+        )
+
+    def test_log_proxy_quarantined(self):
+        """
+        Test the log_proxy_quarantined function.
+        """
+        log = self.logger
+        proxy = "http://proxy:8080"
+
+        with self.assertLogs(level=logging.DEBUG) as cm:
+            log_proxy_quarantined(log=log, proxy=proxy, duration=60.0)
+            self.assertIn(f"Proxy {proxy} quarantined for 60 seconds", cm.output[0])
+
+        assert_no_logs(
+            log_proxy_quarantined,
+            self,
+            log=log,
+            level=logging.INFO,
+            proxy=proxy,
+            duration=60.0,
+        )
+
     def test_log_cookie_fetch_failed(self):
         """
         Test the log_cookie_fetch_failed function.
@@ -402,6 +493,47 @@ class TestLogUtils(unittest.TestCase):
             retries=retries,
         )
 
+    def test_no_formatting_at_info(self):
+        """
+        Test no helper formats its arguments or reads the body at INFO level.
+        """
+        log = self.logger
+        log.setLevel(logging.INFO)
+        arg = Unformattable()
+
+        def read_body():
+            raise AssertionError("Response body read with DEBUG disabled")
+
+        log_constructor(
+            log=log,
+            self=self,
+            baseurl=arg,
+            user_agent=arg,
+            session_cookie=arg,
+            config=arg,
+        )
+        log_interaction(log, 0, 3)
+        log_sleep(log, arg)
+        log_search(log, arg)
+        log_item(log, arg, arg)
+        log_curl_request(log, arg, arg, arg, arg)
+        log_curl_response(log, arg, arg, arg, read_body)
+        log_cookie_fetched(log, arg)
+        log_cookie_retry(log, arg)
+        log_retry(log, arg, 0, 0.0)
+        log_circuit_state(log, arg, arg)
+        log_cookie_renewal(log, 0.0)
+        log_proxy_quarantined(log, arg, 0.0)
+        log_cookie_fetch_failed(log, arg, 0, 3)
+
+    def test_log_curl_response_lazy_body(self):
+        """
+        Test log_curl_response reads a lazy body only when DEBUG is enabled.
+        """
+        with self.assertLogs(level=logging.DEBUG) as cm:
+            log_curl_response(self.logger, "/items", 200, {}, lambda: "{}")
+        self.assertIn("Response Body: {}", cm.output[2])
+
 
 if __name__ == "__main__":
     unittest.main()
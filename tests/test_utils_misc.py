@@ -7,13 +7,19 @@ from unittest.mock import patch
 
 from src.vinted_scraper.utils import (
     SESSION_COOKIE_NAME,
+    get_cookie_expiry,
+    get_cookie_header_template,
     get_cookie_headers,
+    get_cookie_string,
+    get_curl_header_template,
     get_curl_headers,
+    get_endpoint_family,
     get_random_user_agent,
+    get_token_expiry,
     url_validator,
 )
 from src.vinted_scraper.utils._misc import _load_agents
-from tests.utils._mock import BASE_URL, COOKIE_VALUE, USER_AGENT
+from tests.utils._mock import BASE_URL, COOKIE_VALUE, USER_AGENT, create_jwt
 
 
 class TestMiscUtils(unittest.TestCase):
@@ -98,6 +104,52 @@ class TestMiscUtils(unittest.TestCase):
         self.assertEqual(headers["Referer"], BASE_URL)
         self.assertEqual(headers["Cookie"], f"{SESSION_COOKIE_NAME}={COOKIE_VALUE}")
 
+    def test_header_templates(self):
+        """Test the header templates are built once and cannot be modified."""
+        template = get_curl_header_template(BASE_URL, USER_AGENT)
+        self.assertIs(template, get_curl_header_template(BASE_URL, USER_AGENT))
+        self.assertNotIn("Cookie", template)
+        with self.assertRaises(TypeError):
+            template["User-Agent"] = "other"
+        cookie_template = get_cookie_header_template(BASE_URL, USER_AGENT)
+        self.assertEqual(
+            dict(cookie_template), get_cookie_headers(BASE_URL, USER_AGENT)
+        )
+        self.assertEqual(get_cookie_string({"a": "1", "b": "2"}), "a=1; b=2")
+        self.assertEqual(get_cookie_string(None), "")
+
+    def test_get_token_expiry(self):
+        """Test get_token_expiry decodes the exp claim of a JWT only."""
+        self.assertEqual(get_token_expiry(create_jwt({"exp": 1700000000})), 1.7e9)
+        self.assertIsNone(get_token_expiry(create_jwt({"sub": "user"})))
+        self.assertIsNone(get_token_expiry(create_jwt({"exp": "soon"})))
+        self.assertIsNone(get_token_expiry(create_jwt(["exp"])))
+        self.assertIsNone(get_token_expiry(COOKIE_VALUE))
+        self.assertIsNone(get_token_expiry("a.not-base64!.c"))
+
+    def test_get_cookie_expiry(self):
+        """Test get_cookie_expiry returns the earliest expiry of the cookies."""
+        cookies = {
+            SESSION_COOKIE_NAME: create_jwt({"exp": 200}),
+            "refresh_token_web": create_jwt({"exp": 100}),
+            "other": COOKIE_VALUE,
+        }
+        self.assertEqual(get_cookie_expiry(cookies), 100.0)
+        self.assertIsNone(get_cookie_expiry({SESSION_COOKIE_NAME: COOKIE_VALUE}))
+        self.assertIsNone(get_cookie_expiry(None))
+
+    def test_get_endpoint_family(self):
+        """Test get_endpoint_family replaces numeric path segments."""
+        self.assertEqual(
+            get_endpoint_family("/api/v2/items/123/details"),
+            "/api/v2/items/{id}/details",
+        )
+        self.assertEqual(
+            get_endpoint_family(f"{BASE_URL}/api/v2/catalog/items/?page=2"),
+            "/api/v2/catalog/items",
+        )
+        self.assertEqual(get_endpoint_family(""), "/")
+
     def test_load_agents_fallback_path(self):
         """Test _load_agents uses os.path fallback when sys.version_info < (3, 9)."""
         _load_agents.cache_clear()
@@ -0,0 +1,164 @@
+# jscpd:ignore-start
+# pylint: disable=protected-access,duplicate-code
+"""Tests for the proxy pool and its rotating transports."""
+
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from src.vinted_scraper.utils import (
+    AsyncProxyRotatingTransport,
+    ProxyPool,
+    ProxyRotatingTransport,
+)
+
+PROXIES = ["http://proxy-1:8080", "http://proxy-2:8080"]
+
+
+def create_transports(pool, statuses, transport_cls=ProxyRotatingTransport):
+    """Create a rotating transport whose proxies answer the given statuses.
+
+    Args:
+        pool: The proxy pool.
+        statuses: Proxy URL to status code, or to an exception to raise.
+        transport_cls: The rotating transport class.
+
+    Returns:
+        The rotating transport and the list of proxies used, in order.
+    """
+    used = []
+
+    def handler_for(url):
+        def handler(request):
+            used.append(url)
+            if isinstance(statuses[url], Exception):
+                raise statuses[url]
+            return httpx.Response(statuses[url], json={}, request=request)
+
+        return handler
+
+    transport = transport_cls(pool)
+    transport._transports = {
+        url: httpx.MockTransport(handler_for(url)) for url in statuses
+    }
+    return transport, used
+
+
+class TestProxyPool(unittest.TestCase):
+    """Test the ProxyPool class."""
+
+    def test_invalid_pool(self):
+        """Test an empty pool or an invalid smoothing are rejected."""
+        with self.assertRaises(ValueError):
+            ProxyPool([])
+        with self.assertRaises(ValueError):
+            ProxyPool(PROXIES, smoothing=0)
+
+    def test_routes_to_healthiest(self):
+        """Test requests go to the proxy with the best latency and error rate."""
+        pool = ProxyPool(PROXIES)
+        pool.record(PROXIES[0], 2.0, failed=False)
+        pool.record(PROXIES[1], 0.5, failed=False)
+        self.assertEqual(pool.acquire(), PROXIES[1])
+
+        pool.record(PROXIES[1], 0.5, failed=True)
+        self.assertEqual(pool.acquire(), PROXIES[0])
+
+    def test_spreads_concurrent_requests(self):
+        """Test concurrent requests are spread over the least loaded proxies."""
+        pool = ProxyPool(PROXIES)
+        pool.record(PROXIES[0], 2.0, failed=False)
+        pool.record(PROXIES[1], 0.5, failed=False)
+
+        acquired = [pool.acquire() for _ in range(4)]
+        self.assertEqual(acquired, [PROXIES[1], PROXIES[0], PROXIES[1], PROXIES[0]])
+        self.assertEqual([stats.in_flight for stats in pool.stats], [2, 2])
+
+        pool.record(PROXIES[1], 0.5, failed=False)
+        pool.release(PROXIES[0])
+        pool.release(PROXIES[0])
+        self.assertEqual([stats.in_flight for stats in pool.stats], [0, 1])
+        self.assertEqual(pool.acquire(), PROXIES[0])
+
+    @patch("src.vinted_scraper.utils._proxy_pool.time.monotonic")
+    def test_quarantine_and_probe(self, mock_monotonic):
+        """Test a failing proxy is quarantined then probed once it expires."""
+        mock_monotonic.return_value = 100.0
+        pool = ProxyPool(PROXIES, quarantine_after=2, quarantine_time=10)
+        pool.record(PROXIES[1], 5.0, failed=False)
+
+        pool.record(PROXIES[0], 0.1, failed=True)
+        self.assertEqual(pool.acquire(), PROXIES[0])
+        pool.record(PROXIES[0], 0.1, failed=True)
+        self.assertEqual(pool.stats[0].quarantined_until, 110.0)
+        self.assertEqual(pool.acquire(), PROXIES[1])
+
+        # Once the quarantine is over a single probe is sent
+        mock_monotonic.return_value = 111.0
+        self.assertEqual(pool.acquire(), PROXIES[0])
+        self.assertEqual(pool.acquire(), PROXIES[1])
+
+        # A failed probe doubles the quarantine
+        pool.record(PROXIES[0], 0.1, failed=True)
+        self.assertEqual(pool.stats[0].quarantined_until, 131.0)
+
+        mock_monotonic.return_value = 132.0
+        self.assertEqual(pool.acquire(), PROXIES[0])
+        pool.record(PROXIES[0], 0.1, failed=False)
+        self.assertFalse(pool.stats[0].quarantined_until)
+        self.assertEqual(pool.acquire(), PROXIES[0])
+
+    def test_all_quarantined(self):
+        """Test the proxy released soonest is used if all are quarantined."""
+        pool = ProxyPool(PROXIES, quarantine_after=1)
+        pool.record(PROXIES[1], 0.1, failed=True)
+        pool.record(PROXIES[0], 0.1, failed=True)
+        self.assertEqual(pool.acquire(), PROXIES[1])
+
+    def test_transport(self):
+        """Test the sync transport records 403 and timeouts as failures."""
+        pool = ProxyPool(PROXIES, quarantine_after=1)
+        transport, used = create_transports(
+            pool, {PROXIES[0]: 403, PROXIES[1]: httpx.ConnectTimeout("timeout")}
+        )
+
+        with httpx.Client(transport=transport) as client:
+            self.assertEqual(client.get("https://www.vinted.com").status_code, 403)
+            with self.assertRaises(httpx.ConnectTimeout):
+                client.get("https://www.vinted.com")
+
+        self.assertEqual(used, PROXIES)
+        self.assertTrue(all(stats.quarantined_until for stats in pool.stats))
+        self.assertTrue(all(stats.error_rate > 0 for stats in pool.stats))
+
+    def test_pool_transport_factories(self):
+        """Test the pool creates its sync and async transports."""
+        pool = ProxyPool(PROXIES)
+        self.assertIsInstance(pool.transport(), ProxyRotatingTransport)
+        self.assertIsInstance(pool.async_transport(), AsyncProxyRotatingTransport)
+
+
+class TestAsyncProxyRotatingTransport(unittest.IsolatedAsyncioTestCase):
+    """Test the AsyncProxyRotatingTransport class."""
+
+    async def test_transport(self):
+        """Test the async transport routes around a throttled proxy."""
+        pool = ProxyPool(PROXIES, quarantine_after=1)
+        transport, used = create_transports(
+            pool, {PROXIES[0]: 429, PROXIES[1]: 200}, AsyncProxyRotatingTransport
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            statuses = [
+                (await client.get("https://www.vinted.com")).status_code
+                for _ in range(3)
+            ]
+
+        self.assertEqual(statuses, [429, 200, 200])
+        self.assertEqual(used, [PROXIES[0], PROXIES[1], PROXIES[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
@@ -0,0 +1,93 @@
+# jscpd:ignore-start
+# pylint: disable=duplicate-code
+"""Tests for the token-bucket rate limiter."""
+
+import unittest
+from unittest.mock import patch
+
+from src.vinted_scraper import AsyncVintedWrapper, VintedWrapper
+from src.vinted_scraper.utils import SESSION_COOKIE_NAME, RateLimiter
+from tests.utils import (
+    BASE_URL,
+    COOKIE_VALUE,
+    USER_AGENT,
+    create_mock,
+    setup_async_mock_get,
+)
+
+ITEM = "/api/v2/items/{id}/details"
+CATALOG = "/api/v2/catalog/items"
+
+
+@patch("src.vinted_scraper.utils._rate_limiter.time.monotonic", return_value=0.0)
+class TestRateLimiter(unittest.TestCase):
+    """Test the RateLimiter class."""
+
+    def test_invalid_limits(self, _):
+        """Test non positive rates or bursts are rejected."""
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(limits={CATALOG: (1.0, 0)})
+
+    def test_burst_then_rate(self, mock_monotonic):
+        """Test the burst is free and further requests are spaced by the rate."""
+        limiter = RateLimiter(rate=2.0, burst=2)
+        delays = [limiter.reserve(BASE_URL, CATALOG) for _ in range(4)]
+        self.assertEqual(delays, [0.0, 0.0, 0.5, 1.0])
+
+        mock_monotonic.return_value = 10.0
+        self.assertEqual(limiter.reserve(BASE_URL, CATALOG), 0.0)
+
+    def test_separate_budgets(self, _):
+        """Test every host and endpoint family has its own bucket."""
+        limiter = RateLimiter(rate=1.0, burst=1, limits={ITEM: (0.5, 1)})
+        self.assertEqual(limiter.reserve(BASE_URL, CATALOG), 0.0)
+        self.assertEqual(limiter.reserve(BASE_URL, ITEM.format(id=1)), 0.0)
+        self.assertEqual(limiter.reserve("https://www.vinted.it", CATALOG), 0.0)
+
+        self.assertEqual(limiter.reserve(BASE_URL, f"{CATALOG}?page=2"), 1.0)
+        self.assertEqual(limiter.reserve(BASE_URL, ITEM.format(id=2)), 2.0)
+
+    @patch("src.vinted_scraper.utils._rate_limiter.time.sleep")
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_wrapper(self, mock_client, mock_sleep, _):
+        """Test the sync wrapper blocks when the budget is exhausted."""
+        mock_client.return_value.get.return_value = create_mock({"items": []})
+        wrapper = VintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            USER_AGENT,
+            rate_limiter=RateLimiter(rate=4.0, burst=1),
+        )
+
+        for _ in range(3):
+            wrapper.search()
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.25, 0.5])
+
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+    """Test the rate limiter in the async wrapper."""
+
+    @patch("src.vinted_scraper.utils._rate_limiter.time.monotonic", return_value=0.0)
+    @patch("src.vinted_scraper.utils._rate_limiter.asyncio.sleep")
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_wrapper(self, mock_client, mock_sleep, _):
+        """Test the async wrapper awaits when the budget is exhausted."""
+        setup_async_mock_get(mock_client, {"item": {}})
+        wrapper = await AsyncVintedWrapper.create(
+            BASE_URL,
+            rate_limiter=RateLimiter(limits={ITEM: (1.0, 1)}),
+            session_cookie={SESSION_COOKIE_NAME: COOKIE_VALUE},
+        )
+
+        for item_id in range(3):
+            await wrapper.item(str(item_id))
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1.0, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
@@ -0,0 +1,294 @@
+# jscpd:ignore-start
+# pylint: disable=duplicate-code
+"""Tests for the in-memory and SQLite response caches."""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from src.vinted_scraper import AsyncVintedScraper, AsyncVintedWrapper, VintedWrapper
+from src.vinted_scraper.models import VintedJsonModel
+from src.vinted_scraper.utils import (
+    SESSION_COOKIE_NAME,
+    ResponseCache,
+    SQLiteResponseCache,
+    get_cache_key,
+)
+from tests.utils import BASE_URL, COOKIE_VALUE, create_mock
+
+CATALOG = "/api/v2/catalog/items"
+ITEM = "/api/v2/items/1/details"
+
+
+@patch("src.vinted_scraper.utils._response_cache.time.monotonic", return_value=0.0)
+class TestResponseCache(unittest.TestCase):
+    """Test the ResponseCache class."""
+
+    def test_get_cache_key(self, _):
+        """Test the cache key does not depend on the params order."""
+        self.assertEqual(
+            get_cache_key(CATALOG, {"page": 2, "search_text": "games"}),
+            get_cache_key(CATALOG, {"search_text": "games", "page": 2}),
+        )
+        self.assertNotEqual(
+            get_cache_key(CATALOG, {"page": 2}), get_cache_key(CATALOG, {"page": 3})
+        )
+        self.assertEqual(get_cache_key(CATALOG, None), CATALOG)
+        self.assertEqual(
+            get_cache_key(CATALOG, {"page": 1}, "https://www.vinted.fr/"),
+            f"https://www.vinted.fr{CATALOG}?page=1",
+        )
+
+    def test_ttl(self, mock_monotonic):
+        """Test entries expire after the TTL of their endpoint family."""
+        cache = ResponseCache(ttl=10, ttls={"/api/v2/items/{id}/details": 100})
+        cache.set(CATALOG, CATALOG, b"{}")
+        cache.set(ITEM, ITEM, b"{}")
+        self.assertEqual(cache.get(CATALOG).body, b"{}")
+
+        mock_monotonic.return_value = 10.0
+        self.assertIsNone(cache.get(CATALOG))
+        self.assertEqual(cache.get(ITEM).body, b"{}")
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertEqual(len(cache), 1)
+
+        cache.ttls[CATALOG] = 0
+        cache.set(CATALOG, CATALOG, b"{}")
+        self.assertIsNone(cache.get(CATALOG))
+
+    def test_lru_size_bound(self, _):
+        """Test the least recently used entries are evicted over max_bytes."""
+        cache = ResponseCache(max_bytes=10)
+        cache.set("a", CATALOG, b"1234")
+        cache.set("b", CATALOG, b"1234")
+        cache.get("a")
+        cache.set("c", CATALOG, b"1234")
+        cache.set("too big", CATALOG, b"12345678901")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNone(cache.get("too big"))
+        self.assertEqual(cache.get("a").body, b"1234")
+        self.assertEqual(cache.size, 8)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.size, cache.hits, cache.misses), (0,) * 4)
+
+    def test_stale_while_revalidate(self, mock_monotonic):
+        """Test entries past their TTL are served as stale until stale_ttl."""
+        cache = ResponseCache(ttl=10, stale_ttl=5)
+        cache.set(CATALOG, CATALOG, b"{}", {"Content-Type": "application/json"})
+        self.assertFalse(cache.get(CATALOG).stale)
+
+        mock_monotonic.return_value = 12.0
+        cached = cache.get(CATALOG)
+        self.assertTrue(cached.stale)
+        self.assertEqual(cached.headers, {"Content-Type": "application/json"})
+
+        mock_monotonic.return_value = 15.0
+        self.assertIsNone(cache.get(CATALOG))
+        self.assertEqual((cache.hits, cache.stale_hits, cache.misses), (2, 1, 1))
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_wrapper(self, mock_client, _):
+        """Test curl serves identical requests from the cache."""
+        mock_client.return_value.get.return_value = create_mock({"items": [1]})
+        wrapper = VintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            response_cache=ResponseCache(),
+        )
+
+        first = wrapper.search({"page": 1, "search_text": "games"})
+        first["items"].append(2)
+        second = wrapper.search({"search_text": "games", "page": 1})
+        self.assertEqual(second, {"items": [1]})
+        self.assertEqual(mock_client.return_value.get.call_count, 1)
+
+        wrapper.curl(CATALOG, {"page": 1, "search_text": "games"}, use_cache=False)
+        self.assertEqual(mock_client.return_value.get.call_count, 2)
+        self.assertEqual(wrapper.response_cache.hits, 1)
+
+    def test_wrapper_shared_across_domains(self, _):
+        """Test a cache shared by two domains keeps their responses apart."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"host": request.url.host})
+        )
+        cache = ResponseCache()
+        hosts = []
+        for baseurl in ("https://www.vinted.fr", "https://www.vinted.de") * 2:
+            wrapper = VintedWrapper(
+                baseurl,
+                {SESSION_COOKIE_NAME: COOKIE_VALUE},
+                config={"transport": transport},
+                response_cache=cache,
+            )
+            with wrapper:
+                hosts.append(wrapper.curl(CATALOG)["host"])
+
+        self.assertEqual(hosts, ["www.vinted.fr", "www.vinted.de"] * 2)
+        self.assertEqual((len(cache), cache.hits, cache.misses), (2, 2, 2))
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_wrapper_stale(self, mock_client, mock_monotonic):
+        """Test curl serves a stale entry and refreshes it in the background."""
+        mock_client.return_value.get.return_value = create_mock({"items": [1]})
+        wrapper = VintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            response_cache=ResponseCache(ttl=10, stale_ttl=60),
+        )
+        wrapper.search()
+
+        mock_monotonic.return_value = 20.0
+        mock_client.return_value.get.return_value = create_mock({"items": [2]})
+        self.assertEqual(wrapper.search(), {"items": [1]})
+        wrapper._executor.shutdown(wait=True)  # pylint: disable=protected-access
+
+        self.assertEqual(mock_client.return_value.get.call_count, 2)
+        self.assertEqual(wrapper.search(), {"items": [2]})
+        self.assertEqual(wrapper.response_cache.stale_hits, 1)
+
+
+class TestSQLiteResponseCache(unittest.TestCase):
+    """Test the SQLiteResponseCache class."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.tmp.name, "cache.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_persistence(self):
+        """Test entries survive the cache instance, compressed on disk."""
+        body = json.dumps({"items": [{"title": "board game"}] * 100}).encode()
+        SQLiteResponseCache(self.path).set(CATALOG, CATALOG, body, {"X-Id": "1"})
+
+        cache = SQLiteResponseCache(self.path)
+        cached = cache.get(CATALOG)
+        self.assertEqual((cached.body, cached.headers), (body, {"X-Id": "1"}))
+        self.assertFalse(cached.stale)
+        self.assertEqual(len(cache), 1)
+        self.assertLess(cache.size, len(body))
+
+        cache.clear()
+        self.assertIsNone(cache.get(CATALOG))
+        self.assertEqual(len(cache), 0)
+
+    @patch("src.vinted_scraper.utils._response_cache.time.time", return_value=0.0)
+    def test_ttl(self, mock_time):
+        """Test entries go stale after the TTL and expire after stale_ttl."""
+        cache = SQLiteResponseCache(self.path, ttl=10, stale_ttl=5)
+        cache.set(CATALOG, CATALOG, b"{}")
+
+        mock_time.return_value = 12.0
+        self.assertTrue(cache.get(CATALOG).stale)
+        mock_time.return_value = 15.0
+        self.assertIsNone(cache.get(CATALOG))
+        self.assertEqual(len(cache), 0)
+
+    @patch("src.vinted_scraper.utils._response_cache.time.time", return_value=0.0)
+    def test_lru_size_bound(self, mock_time):
+        """Test the least recently used entries are evicted over max_bytes."""
+        body = os.urandom(100)
+        cache = SQLiteResponseCache(self.path, max_bytes=250)
+        for key in ("a", "b", "c"):
+            mock_time.return_value += 1
+            if key == "c":
+                cache.get("a")
+                mock_time.return_value += 1
+            cache.set(key, CATALOG, body)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+
+class TestAsyncResponseCache(unittest.IsolatedAsyncioTestCase):
+    """Test the response cache in the async clients."""
+
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_scraper(self, mock_client):
+        """Test the async scraper benefits from the cache transparently."""
+        mock_client.return_value.get = AsyncMock(
+            return_value=create_mock({"user": {"id": 1}})
+        )
+        scraper = AsyncVintedScraper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            response_cache=ResponseCache(),
+        )
+
+        results = [await scraper.curl("/api/v2/users/1") for _ in range(3)]
+        self.assertTrue(all(isinstance(r, VintedJsonModel) for r in results))
+        self.assertEqual(mock_client.return_value.get.call_count, 1)
+
+    @patch.object(ResponseCache, "_now", return_value=0.0)
+    @patch("src.vinted_scraper._async_wrapper.httpx.AsyncClient")
+    async def test_stale(self, mock_client, mock_now):
+        """Test a stale entry is served once while a single refresh runs."""
+        mock_get = AsyncMock(return_value=create_mock({"user": {"id": 1}}))
+        mock_client.return_value.get = mock_get
+        scraper = AsyncVintedScraper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            response_cache=ResponseCache(ttl=10, stale_ttl=60),
+        )
+        await scraper.curl("/api/v2/users/1")
+
+        mock_now.return_value = 20.0
+        mock_get.return_value = create_mock({"user": {"id": 2}})
+        stale = [await scraper.curl("/api/v2/users/1") for _ in range(2)]
+        self.assertEqual([r.json_data["user"]["id"] for r in stale], [1, 1])
+        # pylint: disable=protected-access
+        await asyncio.gather(*scraper._revalidating.values())
+
+        self.assertEqual(mock_get.call_count, 2)
+        fresh = await scraper.curl("/api/v2/users/1")
+        self.assertEqual(fresh.json_data["user"]["id"], 2)
+
+    async def test_sqlite_off_the_event_loop(self):
+        """Test the SQLite cache runs in a worker thread and keys by domain."""
+        threads = set()
+
+        class RecordingCache(SQLiteResponseCache):
+            """SQLite cache recording the threads it is accessed from."""
+
+            def _load(self, key, now):
+                threads.add(threading.get_ident())
+                return super()._load(key, now)
+
+            def _save(self, key, entry):
+                threads.add(threading.get_ident())
+                super()._save(key, entry)
+
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"host": request.url.host})
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = RecordingCache(os.path.join(tmp, "cache.sqlite"))
+            hosts = []
+            for baseurl in ("https://www.vinted.fr", "https://www.vinted.de") * 2:
+                async with AsyncVintedWrapper(
+                    baseurl,
+                    {SESSION_COOKIE_NAME: COOKIE_VALUE},
+                    config={"transport": transport},
+                    response_cache=cache,
+                ) as wrapper:
+                    hosts.append((await wrapper.curl(CATALOG))["host"])
+
+            self.assertEqual(hosts, ["www.vinted.fr", "www.vinted.de"] * 2)
+            self.assertEqual((len(cache), cache.hits), (2, 2))
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
@@ -0,0 +1,82 @@
+# jscpd:ignore-start
+# pylint: disable=duplicate-code
+"""Tests for the retry policy."""
+
+import time
+import unittest
+from email.utils import formatdate
+from unittest.mock import patch
+
+from src.vinted_scraper.utils import RetryPolicy, get_retry_after
+from tests.utils import create_mock
+
+
+def create_retry_response(retry_after):
+    """Create a 429 response with the given Retry-After header"""
+    response = create_mock(status_code=429)
+    response.headers = {"Retry-After": retry_after}
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test the RetryPolicy class and its helpers."""
+
+    def test_invalid_policy(self):
+        """Test negative counts or delays are rejected."""
+        with self.assertRaises(ValueError):
+            RetryPolicy(retries=-1)
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_delay=-1)
+
+    def test_get_retry_after(self):
+        """Test Retry-After is parsed as seconds or as an HTTP date."""
+        self.assertEqual(get_retry_after(create_retry_response("12")), 12.0)
+        self.assertEqual(get_retry_after(create_retry_response("-3")), 0.0)
+        self.assertAlmostEqual(
+            get_retry_after(create_retry_response(formatdate(2e9, usegmt=True))),
+            2e9 - time.time(),
+            delta=5,
+        )
+        self.assertIsNone(get_retry_after(create_retry_response("soon")))
+        self.assertIsNone(get_retry_after(create_mock()))
+        self.assertIsNone(get_retry_after(None))
+
+    def test_is_retryable(self):
+        """Test throttled and server errors are retryable, client errors are not."""
+        policy = RetryPolicy()
+        for status_code in (429, 500, 502, 503, 504):
+            self.assertTrue(policy.is_retryable(status_code))
+        for status_code in (200, 400, 401, 403, 404):
+            self.assertFalse(policy.is_retryable(status_code))
+
+    @patch("src.vinted_scraper.utils._retry.random.uniform")
+    def test_backoff(self, mock_uniform):
+        """Test the full jitter ceiling doubles up to max_delay."""
+        mock_uniform.side_effect = lambda low, high: high
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+        self.assertEqual([policy.backoff(i) for i in range(5)], [1, 2, 4, 5, 5])
+        self.assertEqual(policy.backoff(0, create_retry_response("3")), 3.0)
+        self.assertIsNone(policy.backoff(0, create_retry_response("300")))
+
+    def test_backoff_is_jittered(self):
+        """Test delays are spread between 0 and the backoff ceiling."""
+        policy = RetryPolicy(base_delay=1.0)
+        delays = {policy.backoff(3) for _ in range(50)}
+        self.assertGreater(len(delays), 1)
+        self.assertTrue(all(0 <= delay <= 8 for delay in delays))
+
+    def test_next_delay_limits(self):
+        """Test the retry count and the time budget stop the retries."""
+        policy = RetryPolicy(retries=2, max_elapsed=10.0)
+        response = create_retry_response("4")
+
+        self.assertEqual(policy.next_delay(0, 0.0, response), 4.0)
+        self.assertIsNone(policy.next_delay(2, 0.0, response))
+        self.assertIsNone(policy.next_delay(1, 7.0, response))
+        self.assertIsNone(policy.next_delay(0, 0.0, create_retry_response("120")))
+
+
+if __name__ == "__main__":
+    unittest.main()
+# jscpd:ignore-end
@@ -5,17 +5,25 @@ Test the Vinted Wrapper class
 """
 
 import logging
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
+
+import httpx
 
 from src.vinted_scraper import VintedScraper, VintedWrapper
-from src.vinted_scraper.models import VintedJsonModel
-from src.vinted_scraper.utils import SESSION_COOKIE_NAME
+from src.vinted_scraper.models import VintedItem, VintedJsonModel
+from src.vinted_scraper.utils import (
+    COOKIE_RENEWAL_MARGIN,
+    SESSION_COOKIE_NAME,
+    RetryPolicy,
+)
 from tests.utils import (
     BASE_URL,
     COOKIE_VALUE,
     USER_AGENT,
     create_cookie_response,
+    create_jwt,
     create_mock,
     setup_mock_get,
 )
@@ -93,7 +101,48 @@ class TestVintedWrapper(unittest.TestCase):
         self.assertEqual(mock_client.return_value.get.call_count, 3)
 
     @patch("src.vinted_scraper._wrapper.httpx.Client")
-    def test_curl_error(self, mock_client):
+    def test_curl_body_not_decoded_for_logs(self, mock_client):
+        """Test curl does not decode the body for logs when DEBUG is off"""
+        response = create_mock({"items": []})
+        text = PropertyMock(return_value="{}")
+        type(response).text = text
+        mock_client.return_value.get.return_value = response
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        logger = logging.getLogger("src.vinted_scraper._base_wrapper")
+        with patch.object(logger, "isEnabledFor", return_value=False):
+            wrapper.search()
+        text.assert_not_called()
+
+        with self.assertLogs("src.vinted_scraper._base_wrapper", logging.DEBUG):
+            wrapper.search()
+        text.assert_called()
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_curl_headers_reused(self, mock_client):
+        """Test the request headers are rebuilt only when the cookie changes"""
+        mock_client.return_value.get.return_value = create_mock({})
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        wrapper.curl("/first")
+        wrapper.curl("/second")
+        first, second = [
+            call.kwargs["headers"]
+            for call in mock_client.return_value.get.call_args_list
+        ]
+        self.assertIs(first, second)
+        self.assertIs(type(first), dict)
+        self.assertEqual(first["Cookie"], f"{SESSION_COOKIE_NAME}={COOKIE_VALUE}")
+
+        wrapper.session_cookie = {SESSION_COOKIE_NAME: "renewed"}
+        wrapper.curl("/third")
+        third = mock_client.return_value.get.call_args.kwargs["headers"]
+        self.assertEqual(third["Cookie"], f"{SESSION_COOKIE_NAME}=renewed")
+        self.assertEqual(third["User-Agent"], first["User-Agent"])
+
+    @patch("src.vinted_scraper._wrapper.time.sleep")
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_curl_error(self, mock_client, mock_sleep):
         """Test curl method with non-200/401 response"""
         setup_mock_get(mock_client, status_code=500, text="")
 
@@ -102,14 +151,129 @@ class TestVintedWrapper(unittest.TestCase):
             wrapper.curl("/test")
         self.assertIn("500", str(ctx.exception))
         self.assertIsInstance(ctx.exception, RuntimeError)
+        self.assertEqual(mock_client.return_value.get.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
+
+    @patch("src.vinted_scraper._wrapper.time.sleep")
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_curl_retry_after(self, mock_client, mock_sleep):
+        """Test a 429 is retried after the delay asked by Retry-After"""
+        throttled = create_mock(status_code=429, text="")
+        throttled.headers = {"Retry-After": "7"}
+        mock_client.return_value.get.side_effect = [
+            throttled,
+            create_mock({"success": True}),
+        ]
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertEqual(wrapper.curl("/test"), {"success": True})
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("src.vinted_scraper._wrapper.time.sleep")
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_curl_retry_after_too_long(self, mock_client, mock_sleep):
+        """Test a Retry-After longer than max_delay is not retried"""
+        throttled = create_mock(status_code=429, text="")
+        throttled.headers = {"Retry-After": "3600"}
+        mock_client.return_value.get.return_value = throttled
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        with self.assertRaises(RuntimeError):
+            with self.assertLogs(level=logging.ERROR):
+                wrapper.curl("/test")
+        mock_sleep.assert_not_called()
+        self.assertEqual(mock_client.return_value.get.call_count, 1)
+
+    @patch("src.vinted_scraper._wrapper.time.sleep")
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_curl_timeout(self, mock_client, mock_sleep):
+        """Test timeouts are retried, then raised once the retries run out"""
+        mock_client.return_value.get.side_effect = [
+            httpx.ReadTimeout("timeout"),
+            create_mock({"success": True}),
+        ]
+        wrapper = VintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            retry_policy=RetryPolicy(retries=1),
+        )
+        self.assertEqual(wrapper.curl("/test"), {"success": True})
+
+        mock_client.return_value.get.side_effect = httpx.ReadTimeout("timeout")
+        with self.assertRaises(httpx.ReadTimeout):
+            wrapper.curl("/test")
+        self.assertEqual(mock_client.return_value.get.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("src.vinted_scraper._wrapper.time.sleep")
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_curl_on_retry(self, mock_client, _):
+        """Test every retry of a call is reported with its reason"""
+        throttled = create_mock(status_code=429, text="")
+        throttled.headers = {"Retry-After": "1"}
+        mock_client.return_value.get.side_effect = [
+            create_mock(status_code=401, text=""),
+            create_cookie_response(),
+            throttled,
+            create_mock({"success": True}),
+        ]
+        states = []
+        wrapper = VintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            on_retry=lambda state: states.append(
+                (state.attempt, state.reason, state.delay)
+            ),
+        )
+
+        self.assertEqual(wrapper.curl("/test"), {"success": True})
+        self.assertEqual(states, [(1, "401", 0.0), (2, "429", 1.0)])
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_curl_auth_retries(self, mock_client):
+        """Test the number of cookie refreshes per call is configurable"""
+        mock_client.return_value.get.side_effect = [
+            create_mock(status_code=401, text=""),
+            create_cookie_response(),
+            create_mock(status_code=401, text=""),
+        ]
+        wrapper = VintedWrapper(
+            BASE_URL,
+            {SESSION_COOKIE_NAME: COOKIE_VALUE},
+            retry_policy=RetryPolicy(auth_retries=1),
+        )
+
+        with self.assertRaises(RuntimeError) as ctx:
+            wrapper.curl("/test")
+        self.assertIn("401", str(ctx.exception))
+        self.assertEqual(mock_client.return_value.get.call_count, 3)
+
+    @patch("src.vinted_scraper._wrapper.time.sleep")
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_fetch_cookie_jittered_backoff(self, mock_client, mock_sleep):
+        """Test fetch_cookie sleeps a jittered backoff between failed attempts"""
+        mock_client.return_value.get.side_effect = [
+            create_mock(status_code=503),
+            create_mock(status_code=503),
+            create_cookie_response(),
+        ]
+        policy = RetryPolicy(base_delay=1.0)
+
+        with patch("src.vinted_scraper.utils._retry.random.uniform") as uniform:
+            uniform.side_effect = lambda low, high: high / 2
+            cookies = VintedWrapper.fetch_cookie(
+                mock_client.return_value, {}, [SESSION_COOKIE_NAME], 3, policy
+            )
+
+        self.assertEqual(cookies, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        self.assertEqual([c.args for c in uniform.call_args_list], [(0, 1.0), (0, 2.0)])
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0])
 
     @patch("src.vinted_scraper._wrapper.httpx.Client")
     def test_curl_invalid_json(self, mock_client):
         """Test curl method with invalid JSON response"""
         setup_mock_get(mock_client, text="invalid")
-        mock_client.return_value.get.return_value.json.side_effect = ValueError(
-            "Invalid JSON"
-        )
+        mock_client.return_value.get.return_value.content = b"invalid"
 
         wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
         with self.assertRaises(RuntimeError) as ctx:
@@ -147,6 +311,44 @@ class TestVintedWrapper(unittest.TestCase):
         self.assertIn("500", str(ctx.exception))
         self.assertIsInstance(ctx.exception, RuntimeError)
 
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_auto_renew_cookie(self, mock_client):
+        """Test the session cookie is renewed in background before it expires"""
+        setup_mock_get(mock_client, {"success": True})
+        mock_client.return_value.get.return_value.cookies = {
+            SESSION_COOKIE_NAME: COOKIE_VALUE
+        }
+        token = create_jwt({"exp": time.time() + COOKIE_RENEWAL_MARGIN + 0.05})
+
+        wrapper = VintedWrapper(
+            BASE_URL, {SESSION_COOKIE_NAME: token}, auto_renew_cookie=True
+        )
+        self.assertIsNotNone(wrapper._renewal)
+        time.sleep(0.2)
+
+        self.assertEqual(wrapper.session_cookie, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        mock_client.return_value.get.assert_called_once()
+        self.assertEqual(mock_client.return_value.get.call_args.args[0], "/")
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_auto_renew_cookie_disabled(self, mock_client):
+        """Test no renewal is scheduled by default or without a token expiry"""
+        token = create_jwt({"exp": time.time() + COOKIE_RENEWAL_MARGIN + 60})
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: token})
+        self.assertIsNone(wrapper._renewal)
+
+        wrapper = VintedWrapper(
+            BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE}, auto_renew_cookie=True
+        )
+        self.assertIsNone(wrapper._renewal)
+
+        with VintedWrapper(
+            BASE_URL, {SESSION_COOKIE_NAME: token}, auto_renew_cookie=True
+        ) as wrapper:
+            renewal = wrapper._renewal
+        self.assertTrue(renewal.finished.is_set())
+        mock_client.return_value.get.assert_not_called()
+
     @patch("src.vinted_scraper._wrapper.httpx.Client")
     def test_context_manager(self, mock_client):
         """Test context manager __enter__ and __exit__"""
@@ -155,6 +357,120 @@ class TestVintedWrapper(unittest.TestCase):
         mock_client.return_value.close.assert_called_once()
 
 
+class TestVintedWrapperMany(unittest.TestCase):
+    """Test the iter_search, search_many and item_many methods of VintedWrapper"""
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_iter_search_stops_on_empty_page(self, mock_client):
+        """Test iter_search walks pages until an empty items list"""
+        mock_client.return_value.get.side_effect = [
+            create_mock({"items": [{"id": 1}, {"id": 2}]}),
+            create_mock({"items": [{"id": 3}]}),
+            create_mock({"items": []}),
+        ]
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        result = list(wrapper.iter_search({"search_text": "test"}))
+
+        self.assertEqual([item["id"] for item in result], [1, 2, 3])
+        self.assertEqual(mock_client.return_value.get.call_count, 3)
+        pages = [
+            call.kwargs["params"]["page"]
+            for call in mock_client.return_value.get.call_args_list
+        ]
+        self.assertEqual(pages, [1, 2, 3])
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_iter_search_stops_on_pagination(self, mock_client):
+        """Test iter_search stops on the last page reported by the pagination"""
+        mock_client.return_value.get.side_effect = [
+            create_mock({"items": [{"id": 1}], "pagination": {"total_pages": 3}}),
+            create_mock({"items": [{"id": 2}], "pagination": {"total_pages": 3}}),
+        ]
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        result = list(wrapper.iter_search({"page": 2}))
+
+        self.assertEqual([item["id"] for item in result], [1, 2])
+        self.assertEqual(mock_client.return_value.get.call_count, 2)
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_iter_search_is_lazy(self, mock_client):
+        """Test iter_search does not fetch extra pages on early break"""
+        setup_mock_get(mock_client, {"items": [{"id": 1}, {"id": 2}]})
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        for item in wrapper.iter_search():
+            self.assertEqual(item["id"], 1)
+            break
+        mock_client.return_value.get.assert_called_once()
+
+        self.assertEqual(len(list(wrapper.iter_search(max_pages=2))), 4)
+        self.assertEqual(mock_client.return_value.get.call_count, 3)
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_search_many(self, mock_client):
+        """Test search_many returns the results in input order"""
+
+        def get(_endpoint, params=None, **_kwargs):
+            time.sleep(0.01 * (3 - params["page"]))
+            return create_mock({"items": [{"id": params["page"]}]})
+
+        mock_client.return_value.get.side_effect = get
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        result = wrapper.search_many([{"page": 1}, {"page": 2}, {"page": 3}])
+
+        self.assertEqual([page["items"][0]["id"] for page in result], [1, 2, 3])
+        self.assertEqual(mock_client.return_value.get.call_count, 3)
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_item_many(self, mock_client):
+        """Test item_many raises or returns exceptions in place"""
+
+        def get(endpoint, **_kwargs):
+            if "/2/" in endpoint:
+                return create_mock(status_code=404, text="")
+            return create_mock({"item": {"endpoint": endpoint}})
+
+        mock_client.return_value.get.side_effect = get
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        with self.assertRaises(RuntimeError):
+            wrapper.item_many(["1", "2", "3"])
+
+        result = wrapper.item_many(["1", "2", "3"], return_exceptions=True)
+        self.assertEqual(result[0], {"item": {"endpoint": "/api/v2/items/1/details"}})
+        self.assertIsInstance(result[1], RuntimeError)
+        self.assertEqual(result[2], {"item": {"endpoint": "/api/v2/items/3/details"}})
+
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_item_many_single_cookie_refresh(self, mock_client):
+        """Test concurrent 401s refresh the cookie once for every thread"""
+        refreshing = []
+        overlaps = []
+
+        def get(endpoint, headers=None, **_kwargs):
+            if endpoint == "/":
+                overlaps.append(bool(refreshing))
+                refreshing.append(endpoint)
+                time.sleep(0.01)
+                refreshing.pop()
+                return create_cookie_response()
+            if "stale" in headers["Cookie"]:
+                time.sleep(0.01)
+                return create_mock(status_code=401, text="")
+            return create_mock({"item": {}})
+
+        mock_client.return_value.get.side_effect = get
+
+        wrapper = VintedWrapper(BASE_URL, {SESSION_COOKIE_NAME: "stale"})
+        result = wrapper.item_many([str(i) for i in range(8)])
+
+        self.assertEqual(result, [{"item": {}}] * 8)
+        self.assertEqual(overlaps, [False])
+
+
 class TestVintedScraper(unittest.TestCase):
     """Test VintedScraper class"""
 
@@ -171,6 +487,21 @@ class TestVintedScraper(unittest.TestCase):
         self.assertEqual(result[0].id, 1)
         self.assertEqual(result[0].title, "Test")
 
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_iter_search_returns_vinted_items(self, mock_client):
+        """Test iter_search yields VintedItem objects"""
+        mock_client.return_value.get.side_effect = [
+            create_mock({"items": [{"id": 1, "title": "Test"}]}),
+            create_mock({"items": []}),
+        ]
+
+        scraper = VintedScraper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        result = list(scraper.iter_search({"search_text": "test"}))
+
+        self.assertEqual(len(result), 1)
+        self.assertIsInstance(result[0], VintedItem)
+        self.assertEqual(result[0].title, "Test")
+
     @patch("src.vinted_scraper._wrapper.httpx.Client")
     def test_item_returns_vinted_item(self, mock_client):
         """Test item method returns VintedItem object"""
@@ -183,6 +514,16 @@ class TestVintedScraper(unittest.TestCase):
         self.assertEqual(result.title, "Test Item")
         mock_client.return_value.get.assert_called_once()
 
+    @patch("src.vinted_scraper._wrapper.httpx.Client")
+    def test_item_many_returns_vinted_items(self, mock_client):
+        """Test item_many returns VintedItem objects"""
+        setup_mock_get(mock_client, {"item": {"id": 123, "title": "Test Item"}})
+
+        scraper = VintedScraper(BASE_URL, {SESSION_COOKIE_NAME: COOKIE_VALUE})
+        result = scraper.item_many(["1", "2"])
+        self.assertEqual(len(result), 2)
+        self.assertTrue(all(isinstance(item, VintedItem) for item in result))
+
     @patch("src.vinted_scraper._wrapper.httpx.Client")
     def test_curl_returns_vinted_base(self, mock_client):
         """Test curl method returns VintedJsonModel object"""
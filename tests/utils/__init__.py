@@ -7,6 +7,7 @@ from ._mock import (
     HTTP_OK,
     USER_AGENT,
     create_cookie_response,
+    create_jwt,
     create_mock,
     setup_async_mock_get,
     setup_mock_get,
@@ -21,6 +22,7 @@ __all__ = [
     "assert_no_logs",
     "create_mock",
     "create_cookie_response",
+    "create_jwt",
     "setup_mock_get",
     "setup_async_mock_get",
 ]
@@ -3,6 +3,8 @@
 Mock utils
 """
 
+import base64
+import json
 from typing import Final
 from unittest.mock import AsyncMock, MagicMock
 
@@ -13,11 +15,21 @@ USER_AGENT: Final = get_random_user_agent()
 COOKIE_VALUE: Final = "valid_token-123456"
 
 
+def create_jwt(claims):
+    """Create an unsigned JWT carrying the given claims"""
+
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'none'})}.{encode(claims)}.signature"
+
+
 def create_mock(json_data=None, status_code=HTTP_OK, text="{}"):
     """Create a mock response"""
     mock = MagicMock()
     mock.status_code = status_code
     mock.json.return_value = json_data or {}
+    mock.content = json.dumps(json_data or {}).encode()
     mock.headers = {}
     mock.text = text
     return mock